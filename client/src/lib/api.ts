@@ -71,6 +71,7 @@ export interface MarketDetailResponse {
   table: MarketDetailPoint[];
   range: "4W" | "12W" | "YTD" | "1Y" | "ALL";
   points: number;
+  source_points?: number;
 }
 
 export interface SignalsQuery {
@@ -127,10 +128,12 @@ export async function fetchMarkets(): Promise<MarketsResponse> {
 export async function fetchMarketDetail(
   marketId: string,
   range: "4W" | "12W" | "YTD" | "1Y" | "ALL",
+  width?: number,
 ): Promise<MarketDetailResponse> {
   const params = new URLSearchParams();
   params.set("market_id", marketId);
   params.set("range", range);
+  if (width) params.set("width", String(width));
   const res = await fetch(`/api/market-detail?${params.toString()}`);
   if (!res.ok) {
     const msg = await res.text();
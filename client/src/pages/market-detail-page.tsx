@@ -15,6 +15,9 @@ function fmtNum(x: number | null | undefined): string {
   return new Intl.NumberFormat("en-US", { maximumFractionDigits: 0 }).format(x);
 }
 
+// SVG viewBox width; also sent as ?width= so the API returns only the points it can show
+const CHART_WIDTH = 1000;
+
 function SimpleLineChart({
   dates,
   series,
@@ -28,7 +31,7 @@ function SimpleLineChart({
   yMax?: number;
   thresholds?: number[];
 }) {
-  const width = 1000;
+  const width = CHART_WIDTH;
   const height = 280;
   const padLeft = 44;
   const padRight = 16;
@@ -43,8 +46,14 @@ function SimpleLineChart({
   const safeMin = minV === maxV ? minV - 1 : minV;
   const safeMax = minV === maxV ? maxV + 1 : maxV;
 
+  // x by date: series may be downsampled server-side, so rows are not evenly spaced
+  const times = dates.map((d) => Date.parse(d));
+  const t0 = times[0];
+  const t1 = times[times.length - 1];
+  const byDate = times.every((t) => Number.isFinite(t)) && t1 > t0;
   const xPos = (idx: number) => {
     if (dates.length <= 1) return padLeft + plotW / 2;
+    if (byDate) return padLeft + ((times[idx] - t0) / (t1 - t0)) * plotW;
     return padLeft + (idx / (dates.length - 1)) * plotW;
   };
 
@@ -140,7 +149,7 @@ export function MarketDetailPage() {
 
   const detailQ = useQuery({
     queryKey: ["market-detail", marketId, range],
-    queryFn: () => fetchMarketDetail(marketId, range),
+    queryFn: () => fetchMarketDetail(marketId, range, CHART_WIDTH),
     enabled: !!marketId,
   });
 
@@ -0,0 +1,139 @@
+"""Login burst benchmark: sign-in latency under N concurrent users and the stall it causes for other sessions.
+
+Creates active users in a temporary auth DB, then for each concurrency level starts N threads
+that sign in at once (like Streamlit script threads of N sessions) while a probe thread runs a
+short CPU task in a loop (another session's rerun). Reports login latency and probe latency.
+
+Compare hashing on the calling thread with the bounded PBKDF2 pool:
+    python scripts/bench_login.py --users 1 8 32 --workers 0
+    python scripts/bench_login.py --users 1 8 32 --workers 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+PASSWORD = "StrongPass_123!"
+
+
+def _probe_task() -> None:
+    # ~1 ms of pure-Python work: a small rerun of another session
+    sum(i * i for i in range(20_000))
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def run_burst(auth, emails: list[str]) -> dict:
+    """Sign in all emails at once; probe latency is sampled until the last login finishes."""
+    latencies: list[float] = []
+    results: list[bool] = []
+    probe: list[float] = []
+    lock = threading.Lock()
+    start_gate = threading.Barrier(len(emails) + 1)
+    done = threading.Event()
+
+    def login(email: str) -> None:
+        start_gate.wait()
+        t0 = time.perf_counter()
+        ok, _ = auth.authenticate_local(email, PASSWORD)
+        elapsed = time.perf_counter() - t0
+        with lock:
+            latencies.append(elapsed)
+            results.append(ok)
+
+    def run_probe() -> None:
+        while not done.is_set():
+            t0 = time.perf_counter()
+            _probe_task()
+            probe.append(time.perf_counter() - t0)
+
+    threads = [threading.Thread(target=login, args=(e,)) for e in emails]
+    for t in threads:
+        t.start()
+    probe_thread = threading.Thread(target=run_probe)
+    probe_thread.start()
+    t0 = time.perf_counter()
+    start_gate.wait()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - t0
+    done.set()
+    probe_thread.join()
+
+    return {
+        "users": len(emails),
+        "ok": sum(results),
+        "wall_s": wall,
+        "login_p50_ms": statistics.median(latencies) * 1000,
+        "login_p95_ms": _percentile(latencies, 0.95) * 1000,
+        "login_max_ms": max(latencies) * 1000,
+        "probe_p50_ms": statistics.median(probe) * 1000 if probe else float("nan"),
+        "probe_max_ms": max(probe) * 1000 if probe else float("nan"),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, nargs="+", default=[1, 8, 32], help="Concurrency levels (default: 1 8 32).")
+    parser.add_argument("--workers", type=int, default=None, help="COT_PBKDF2_WORKERS (0 = hash on the calling thread).")
+    parser.add_argument("--iterations", type=int, default=None, help="PBKDF2 iterations (default: auth.PASSWORD_HASH_ITERATIONS).")
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    os.environ["COT_AUTH_DB_PATH"] = str(Path(tmp.name) / "auth.db")
+    os.environ.pop("COT_ADMIN_EMAIL", None)
+    if args.workers is not None:
+        os.environ["COT_PBKDF2_WORKERS"] = str(args.workers)
+
+    from streamlit import logger as st_logger
+
+    from src.app import auth
+
+    # Bare-mode session state warnings: the benchmark calls auth outside `streamlit run`
+    st_logger.set_log_level(logging.ERROR)
+
+    if args.iterations is not None:
+        auth.PASSWORD_HASH_ITERATIONS = args.iterations
+    # The benchmark measures hashing and pool contention, not the failed-login throttle
+    auth.LOGIN_MAX_FAILURES_PER_EMAIL = auth.LOGIN_MAX_FAILURES_PER_IP = 10**9
+
+    auth.init_auth_db()
+    emails = [f"user{i}@example.com" for i in range(max(args.users))]
+    for email in emails:
+        auth.register_local(email, PASSWORD)
+        auth._update_user_role_status(email, auth.ROLE_USER, auth.STATUS_ACTIVE)
+
+    print("=" * 96)
+    print(
+        f"Login burst: iterations={auth.PASSWORD_HASH_ITERATIONS} "
+        f"workers={auth._pbkdf2_workers()} (0 = calling thread) cpus={os.cpu_count()}"
+    )
+    print("=" * 96)
+    print(f"{'users':>6} {'ok':>4} {'wall s':>8} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'probe p50':>10} {'probe max':>10}")
+    for n in args.users:
+        r = run_burst(auth, emails[:n])
+        print(
+            f"{r['users']:>6} {r['ok']:>4} {r['wall_s']:>8.2f} {r['login_p50_ms']:>9.0f} {r['login_p95_ms']:>9.0f} "
+            f"{r['login_max_ms']:>9.0f} {r['probe_p50_ms']:>10.2f} {r['probe_max_ms']:>10.2f}"
+        )
+    tmp.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
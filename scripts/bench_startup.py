@@ -0,0 +1,120 @@
+"""Startup benchmark for the Streamlit entry point: cold import times with an -X importtime profile.
+
+Each run is a fresh interpreter (cold start as on a new container), importing the entry
+module and optionally the page modules. Reports wall time per run and, from the
+`-X importtime` profile of the median run, the slowest modules by cumulative and self time.
+
+Usage:
+    python scripts/bench_startup.py --runs 5 --top 15
+    python scripts/bench_startup.py --pages --json startup_report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+ENTRY_MODULES = ("src.app.app",)
+PAGE_MODULES = (
+    "src.app.pages.market",
+    "src.app.pages.overview_mvp",
+    "src.app.pages.compare",
+    "src.app.pages.signals",
+)
+# Heavy libraries worth knowing about on the login path (imported before any page)
+WATCHED_MODULES = ("pandas", "numpy", "pyarrow", "streamlit")
+
+
+def parse_importtime(stderr: str) -> list[dict]:
+    """Rows of an -X importtime report: module, depth, self_us, cumulative_us."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|", 2)
+        module = name.rstrip()[1:]  # one separator space, then two spaces per nesting level
+        rows.append(
+            {
+                "module": module.strip(),
+                "depth": (len(module) - len(module.lstrip())) // 2,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+            }
+        )
+    return rows
+
+
+def run_once(modules: tuple[str, ...]) -> tuple[float, list[dict]]:
+    """Wall time (ms) and import profile of one cold interpreter importing modules."""
+    code = "; ".join(f"import {m}" for m in modules)
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000.0
+    if proc.returncode != 0:
+        raise RuntimeError(f"import failed:\n{proc.stderr[-2000:]}")
+    return wall_ms, parse_importtime(proc.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Cold interpreter runs (default: 5).")
+    parser.add_argument("--top", type=int, default=15, help="Modules listed per table (default: 15).")
+    parser.add_argument("--pages", action="store_true", help="Also import the page modules (post-login cost).")
+    parser.add_argument("--json", dest="json_path", default=None, help="Write the report as JSON to this path.")
+    args = parser.parse_args()
+
+    modules = ENTRY_MODULES + (PAGE_MODULES if args.pages else ())
+    runs = [run_once(modules) for _ in range(max(1, args.runs))]
+    walls = [wall for wall, _ in runs]
+    median_wall = statistics.median(walls)
+    _, profile = min(runs, key=lambda r: abs(r[0] - median_wall))
+
+    imported = {row["module"] for row in profile}
+    by_cumulative = sorted((r for r in profile if r["depth"] <= 1), key=lambda r: -r["cumulative_us"])[: args.top]
+    by_self = sorted(profile, key=lambda r: -r["self_us"])[: args.top]
+    total_us = sum(r["self_us"] for r in profile)
+
+    print("=" * 80)
+    print(f"Startup benchmark: import {', '.join(modules)}")
+    print("=" * 80)
+    print(f"runs: {len(walls)}  wall ms: median {median_wall:.0f}  min {min(walls):.0f}  max {max(walls):.0f}")
+    print(f"import time (sum of self, median run): {total_us / 1000:.0f} ms, {len(profile)} modules")
+    print("watched: " + ", ".join(f"{m}={'yes' if m in imported else 'no'}" for m in WATCHED_MODULES))
+    print()
+    print(f"Top {len(by_cumulative)} by cumulative time (top-level imports)")
+    for r in by_cumulative:
+        print(f"  {r['cumulative_us'] / 1000:8.1f} ms  {'  ' * r['depth']}{r['module']}")
+    print()
+    print(f"Top {len(by_self)} by self time")
+    for r in by_self:
+        print(f"  {r['self_us'] / 1000:8.1f} ms  {r['module']}")
+
+    if args.json_path:
+        report = {
+            "modules": list(modules),
+            "wall_ms": walls,
+            "median_wall_ms": median_wall,
+            "import_ms": total_us / 1000,
+            "watched": {m: m in imported for m in WATCHED_MODULES},
+            "profile": profile,
+        }
+        Path(args.json_path).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nreport: {args.json_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
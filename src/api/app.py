@@ -2,17 +2,89 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
+import os
 from pathlib import Path
-from typing import Literal
+from typing import Any, Callable, Hashable, Literal
 
 import pandas as pd
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-
+from fastapi.responses import StreamingResponse
+
+from src.api.artifacts import Artifact, artifact_cache
+from src.api.bulk import (
+    BULK_BATCH_ROWS,
+    BULK_EXTENSIONS,
+    BULK_MEDIA_TYPES,
+    BulkFormat,
+    BulkQueryError,
+    build_filter,
+    open_dataset,
+    project_columns,
+    stream_batches,
+)
+from src.api.events import EVENTS_HEARTBEAT_SECONDS, ReportWatcher, format_sse
+from src.api.executor import PoolSaturated, work_pool
+from src.api.http_cache import GenerationTracker, HttpCacheMiddleware, HttpCacheSettings
+from src.api.responses import bytes_response, json_response
+from src.api.serialization import PayloadFormat, dumps, frame_payload, frame_records
+from src.api.snapshots import DASHBOARD_DEFAULT_LIMIT, SIGNALS_DEFAULT_LIMIT, RadarSnapshots
+from src.common.cross_section import RANK_METRICS, RankingQueryError, rank_week, week_slice
+from src.common.downsample import DownsampleMethod, downsample_frame
+from src.common.generation import GENERATION_FILE
+from src.common.market_index import MarketIndex, build_market_index, range_cutoff
 from src.common.paths import ProjectPaths
 
+# Default chart series for /api/market-detail and /api/series
+SERIES_COLS = [
+    "report_date",
+    "nc_net",
+    "comm_net",
+    "open_interest",
+    "net_z_52w_funds",
+    "net_z_52w_commercials",
+    "nc_net_chg_1w",
+    "comm_net_chg_1w",
+    "open_interest_chg_1w_pct",
+]
+
+# Market-detail table and default /api/market-history columns
+TABLE_COLS = [
+    "report_date",
+    "nc_net",
+    "comm_net",
+    "net_z_52w_funds",
+    "net_z_52w_commercials",
+    "open_interest",
+    "open_interest_chg_1w_pct",
+]
+MARKET_DETAIL_TABLE_ROWS = 30
+
+# /api/market-history page size (default and upper bound)
+HISTORY_PAGE_SIZE = int(os.getenv("COT_API_HISTORY_PAGE", "100"))
+HISTORY_MAX_PAGE = 1000
+
+# Upper bound on rows x columns returned by one /api/series request
+SERIES_MAX_CELLS = int(os.getenv("COT_API_SERIES_MAX_CELLS", "250000"))
+
+# ?width= (chart width in px) bounds for server-side series downsampling
+CHART_MIN_WIDTH_PX = 32
+CHART_MAX_WIDTH_PX = 8192
+
 app = FastAPI(title="COT API", version="0.1.0")
 
+# Added before CORS so CORS stays outermost and also decorates 304s
+app.add_middleware(
+    HttpCacheMiddleware,
+    tracker=GenerationTracker(
+        lambda: _compute_path(GENERATION_FILE),
+        lambda: _compute_path("metrics_weekly.parquet"),
+    ),
+    settings=HttpCacheSettings.from_env(),
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -29,33 +101,124 @@ def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
-def _load_radar_df() -> pd.DataFrame:
-    paths = ProjectPaths(_repo_root())
-    radar_path = paths.data / "compute" / "market_radar_latest.parquet"
-    if not radar_path.exists():
-        raise HTTPException(status_code=404, detail="market_radar_latest.parquet not found")
+def _compute_path(filename: str) -> Path:
+    return ProjectPaths(_repo_root()).data / "compute" / filename
 
-    df = pd.read_parquet(radar_path)
-    if df.empty:
-        return df
 
+def _read_parquet_with_dates(path: Path) -> pd.DataFrame:
+    df = pd.read_parquet(path)
     if "report_date" in df.columns:
         df["report_date"] = pd.to_datetime(df["report_date"], errors="coerce")
-        latest = df["report_date"].max()
-        df = df[df["report_date"] == latest].copy()
-
     return df
 
 
+def _read_radar_latest(path: Path) -> pd.DataFrame:
+    df = _read_parquet_with_dates(path)
+    if df.empty or "report_date" not in df.columns:
+        return df
+    latest = df["report_date"].max()
+    return df[df["report_date"] == latest].copy()
+
+
+def _load_artifact(filename: str, loader=_read_parquet_with_dates) -> Artifact:
+    """Cached, parsed compute artifact (re-read only when the file changes on disk)."""
+    artifact = artifact_cache().get(_compute_path(filename), loader)
+    if artifact is None:
+        raise HTTPException(status_code=404, detail=f"{filename} not found")
+    return artifact
+
+
+def _load_radar_df() -> pd.DataFrame:
+    return _load_artifact("market_radar_latest.parquet", _read_radar_latest).frame
+
+
+def _load_radar_snapshots() -> RadarSnapshots:
+    """Pre-encoded dashboard/signals responses, rebuilt once per radar generation."""
+    return _load_artifact("market_radar_latest.parquet", _read_radar_latest).derive("snapshots", RadarSnapshots)
+
+
 def _load_metrics_df() -> pd.DataFrame:
-    paths = ProjectPaths(_repo_root())
-    metrics_path = paths.data / "compute" / "metrics_weekly.parquet"
-    if not metrics_path.exists():
-        raise HTTPException(status_code=404, detail="metrics_weekly.parquet not found")
-    df = pd.read_parquet(metrics_path)
-    if "report_date" in df.columns:
-        df["report_date"] = pd.to_datetime(df["report_date"], errors="coerce")
-    return df
+    return _load_artifact("metrics_weekly.parquet").frame
+
+
+def _load_market_index() -> MarketIndex:
+    """metrics_weekly row ranges per market, built once per artifact generation."""
+    return _load_artifact("metrics_weekly.parquet").derive("market_index", build_market_index)
+
+
+def _load_cross_section_df() -> pd.DataFrame:
+    return _load_artifact("cross_section_weekly.parquet").frame
+
+
+def _load_category_aggregates_df() -> pd.DataFrame:
+    return _load_artifact("category_aggregates_weekly.parquet").frame
+
+
+# One watcher per process; polls only while /api/events has subscribers
+_REPORT_WATCHER = ReportWatcher(lambda: _compute_path(GENERATION_FILE), lambda: _load_radar_df())
+
+
+def _split_csv(values: list[str] | None) -> list[str]:
+    """Flatten repeated and comma-separated query values (?a=x,y&a=z), keeping order, dropping duplicates."""
+    items = [v.strip() for value in values or [] for v in value.split(",")]
+    return list(dict.fromkeys(v for v in items if v))
+
+
+def _parse_date_param(value: str | None, name: str) -> pd.Timestamp | None:
+    if not value:
+        return None
+    ts = pd.to_datetime(value, errors="coerce")
+    if pd.isna(ts):
+        raise HTTPException(status_code=400, detail=f"Invalid {name}: {value}")
+    return ts
+
+
+def _projection(available: pd.Index, columns: tuple[str, ...], default: list[str]) -> list[str]:
+    """report_date + requested columns (400 on unknown ones), or the available defaults."""
+    requested = list(columns) or default
+    unknown = [c for c in requested if c not in available]
+    if columns and unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown columns: {', '.join(unknown)}")
+    return ["report_date", *[c for c in requested if c in available and c != "report_date"]]
+
+
+def _encode_cursor(market: str, report_date: pd.Timestamp, order: str) -> str:
+    raw = dumps({"m": market, "d": report_date.strftime("%Y-%m-%d"), "o": order})
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, market: str, order: str) -> pd.Timestamp:
+    """Keyset position (last report_date served); 400 if malformed or issued for another market/order."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        after = pd.Timestamp(data["d"])
+    except (ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+    if data.get("m") != market or data.get("o") != order:
+        raise HTTPException(status_code=400, detail="Cursor does not match market_id/order")
+    return after
+
+
+def _history_page(
+    index: MarketIndex,
+    market: str,
+    after: pd.Timestamp | None,
+    limit: int,
+    order: str,
+    keep: list[str],
+    format: PayloadFormat,
+) -> tuple[list[dict] | dict[str, list], str | None]:
+    """One keyset page of a market's rows (projected to keep) and the cursor for the next page."""
+    lo, hi, has_more = index.page_bounds(market, after, limit, descending=order == "desc")
+    col_pos = [index.frame.columns.get_loc(c) for c in keep]
+    rows = index.frame.iloc[lo:hi, col_pos]
+    if order == "desc":
+        rows = rows.iloc[::-1]
+    next_cursor = None
+    if has_more and len(rows):
+        next_cursor = _encode_cursor(market, pd.Timestamp(index.dates[hi - 1 if order == "asc" else lo]), order)
+    return frame_payload(rows, format), next_cursor
 
 
 def _apply_range(df: pd.DataFrame, range_code: str) -> pd.DataFrame:
@@ -67,25 +230,14 @@ def _apply_range(df: pd.DataFrame, range_code: str) -> pd.DataFrame:
     if out.empty:
         return out
 
-    range_norm = (range_code or "12W").upper()
-    if range_norm == "ALL":
-        return out
-
     latest = out["report_date"].max()
     if pd.isna(latest):
         return out
 
-    if range_norm == "4W":
-        return out[out["report_date"] >= latest - pd.Timedelta(days=28)]
-    if range_norm == "12W":
-        return out[out["report_date"] >= latest - pd.Timedelta(days=84)]
-    if range_norm == "1Y":
-        return out[out["report_date"] >= latest - pd.Timedelta(days=365)]
-    if range_norm == "YTD":
-        year_start = pd.Timestamp(year=latest.year, month=1, day=1)
-        return out[out["report_date"] >= year_start]
-
-    return out
+    cutoff = range_cutoff(latest, range_code)
+    if cutoff is None:
+        return out
+    return out[out["report_date"] >= cutoff]
 
 
 def _compute_signal_state(row: pd.Series) -> str:
@@ -101,153 +253,178 @@ def _compute_signal_state(row: pd.Series) -> str:
     return "neutral"
 
 
+async def _offload(key: Hashable | None, fn: Callable[..., Any], *args: Any) -> Any:
+    """Run blocking work on the bounded pool; identical concurrent keys share one run."""
+    try:
+        return await work_pool().run(key, fn, *args)
+    except PoolSaturated as e:
+        raise HTTPException(
+            status_code=429,
+            detail="Server busy, retry later",
+            headers={"Retry-After": str(e.retry_after)},
+        ) from e
+
+
+async def _offload_json(key: Hashable, build: Callable[..., dict], *args: Any) -> Response:
+    """Build and encode a payload on the pool; coalesced callers share the encoded bytes."""
+    body = await _offload(key, lambda: dumps(build(*args)))
+    return bytes_response(body)
+
+
 @app.get("/api/health")
-def health() -> dict[str, str]:
+async def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
 @app.get("/api/signals")
-def get_signals(
+async def get_signals(
+    request: Request,
     signal: Literal["all", "extreme", "bullish", "bearish", "neutral"] = "all",
     category: str = Query(default="all"),
     conflict: Literal["all", "High", "Medium", "Low"] = "all",
-    limit: int = Query(default=200, ge=1, le=2000),
-) -> dict:
+    limit: int = Query(default=SIGNALS_DEFAULT_LIMIT, ge=1, le=2000),
+) -> Response:
+    encoded = await _offload(
+        ("signals", signal, category, conflict, limit),
+        lambda: _load_radar_snapshots().signals(signal, category, conflict, limit),
+    )
+    return json_response(request, encoded)
+
+
+def _markets_payload() -> dict:
     df = _load_radar_df()
     if df.empty:
-        return {"items": [], "total": 0, "latest_report_date": None}
+        return {"items": []}
+    cols = [c for c in ["market_id", "market_name", "category"] if c in df.columns]
+    out = df[cols].drop_duplicates().sort_values(["category", "market_name"], na_position="last")
+    return {"items": frame_records(out)}
 
-    df = df.copy()
-    df["signal_state"] = df.apply(_compute_signal_state, axis=1)
-    df["signal_abs"] = pd.to_numeric(df.get("cot_traffic_signal"), errors="coerce").abs()
 
-    if category != "all":
-        df = df[df["category"].astype(str).str.lower() == category.lower()]
+@app.get("/api/markets")
+async def get_markets() -> Response:
+    return await _offload_json(("markets",), _markets_payload)
+
 
-    if signal != "all":
-        df = df[df["signal_state"] == signal]
+@app.get("/api/dashboard")
+async def get_dashboard(
+    request: Request,
+    signal: Literal["all", "extreme", "bullish", "bearish", "neutral"] = "all",
+    category: str = Query(default="all"),
+    limit: int = Query(default=DASHBOARD_DEFAULT_LIMIT, ge=1, le=500),
+) -> Response:
+    encoded = await _offload(
+        ("dashboard", signal, category, limit),
+        lambda: _load_radar_snapshots().dashboard(signal, category, limit),
+    )
+    return json_response(request, encoded)
+
+
+def _rankings_payload(
+    by: str,
+    scope: str,
+    category: str,
+    report_date: str | None,
+    order: str,
+    limit: int,
+    format: PayloadFormat,
+) -> dict:
+    df = _load_cross_section_df()
+    if df.empty:
+        return {"items": [] if format == "records" else {}, "total": 0, "report_date": None, "by": by}
 
-    if conflict != "all":
-        df = df[df["conflict_level"] == conflict]
+    if report_date:
+        target = pd.to_datetime(report_date, errors="coerce")
+        if pd.isna(target):
+            raise HTTPException(status_code=400, detail=f"Invalid report_date: {report_date}")
+    else:
+        target = df["report_date"].iloc[-1]
 
-    df = df.sort_values(["signal_abs", "hot_score"], ascending=False, na_position="last")
+    week = week_slice(df, target)
+    if week.empty:
+        raise HTTPException(status_code=404, detail=f"No rankings for report_date: {report_date}")
 
-    latest_report_date = None
-    if "report_date" in df.columns and not df["report_date"].isna().all():
-        latest_report_date = pd.to_datetime(df["report_date"].max()).strftime("%Y-%m-%d")
+    try:
+        week = rank_week(week, by, scope, category, order)
+    except RankingQueryError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
     keep_cols = [
-        "market_id",
-        "market_name",
+        "market_key",
         "category",
-        "signal_state",
-        "cot_traffic_signal",
-        "hot_score",
-        "conflict_level",
-        "oi_risk_level",
-        "net_z_52w_funds",
-        "open_interest_chg_1w_pct",
-        "is_hot",
+        *RANK_METRICS,
+        *[f"{c}_pct_xs" for c in RANK_METRICS],
+        *[f"{c}_pct_cat" for c in RANK_METRICS],
+        "hot_rank",
     ]
-    out = df[[c for c in keep_cols if c in df.columns]].head(limit).copy()
-    out = out.where(pd.notna(out), None)
+    out = week[[c for c in keep_cols if c in week.columns]].head(limit)
 
     return {
-        "items": out.to_dict(orient="records"),
-        "total": int(len(df)),
-        "latest_report_date": latest_report_date,
+        "items": frame_payload(out, format),
+        "total": int(len(week)),
+        "report_date": pd.to_datetime(target).strftime("%Y-%m-%d"),
+        "by": by,
+        "scope": scope,
     }
 
 
-@app.get("/api/markets")
-def get_markets() -> dict:
-    df = _load_radar_df()
-    if df.empty:
-        return {"items": []}
-    cols = [c for c in ["market_id", "market_name", "category"] if c in df.columns]
-    out = df[cols].drop_duplicates().sort_values(["category", "market_name"], na_position="last")
-    out = out.where(pd.notna(out), None)
-    return {"items": out.to_dict(orient="records")}
-
-
-@app.get("/api/dashboard")
-def get_dashboard(
-    signal: Literal["all", "extreme", "bullish", "bearish", "neutral"] = "all",
+@app.get("/api/rankings")
+async def get_rankings(
+    by: Literal["hot_score", "net_z_52w_funds", "nc_net_pct_oi", "oi_z_52w"] = "hot_score",
+    scope: Literal["all", "category"] = "all",
     category: str = Query(default="all"),
-    limit: int = Query(default=50, ge=1, le=500),
-) -> dict:
-    df = _load_radar_df()
-    if df.empty:
-        return {
-            "summary": {"bullish": 0, "bearish": 0, "extreme": 0, "neutral": 0},
-            "items": [],
-            "total": 0,
-            "latest_report_date": None,
-            "categories": [],
-        }
-
-    df = df.copy()
-    df["signal_state"] = df.apply(_compute_signal_state, axis=1)
-    df["signal_abs"] = pd.to_numeric(df.get("cot_traffic_signal"), errors="coerce").abs()
-
-    categories = sorted(df["category"].dropna().astype(str).unique().tolist()) if "category" in df.columns else []
-
-    if category != "all":
-        df = df[df["category"].astype(str).str.lower() == category.lower()]
-    if signal != "all":
-        df = df[df["signal_state"] == signal]
-
-    summary = {
-        "bullish": int((df["signal_state"] == "bullish").sum()),
-        "bearish": int((df["signal_state"] == "bearish").sum()),
-        "extreme": int((df["signal_state"] == "extreme").sum()),
-        "neutral": int((df["signal_state"] == "neutral").sum()),
-    }
+    report_date: str | None = Query(default=None),
+    order: Literal["desc", "asc"] = "desc",
+    limit: int = Query(default=20, ge=1, le=500),
+    format: PayloadFormat = "records",
+) -> Response:
+    args = (by, scope, category, report_date, order, limit, format)
+    return await _offload_json(("rankings", *args), _rankings_payload, *args)
 
-    df = df.sort_values(["signal_abs", "hot_score"], ascending=False, na_position="last")
-    latest_report_date = None
-    if "report_date" in df.columns and not df["report_date"].isna().all():
-        latest_report_date = pd.to_datetime(df["report_date"].max()).strftime("%Y-%m-%d")
 
-    keep_cols = [
-        "market_id",
-        "market_name",
-        "category",
-        "signal_state",
-        "cot_traffic_signal",
-        "hot_score",
-        "conflict_level",
-        "net_z_52w_funds",
-        "open_interest_chg_1w_pct",
-        "is_hot",
-    ]
-    out = df[[c for c in keep_cols if c in df.columns]].head(limit).copy()
-    out = out.where(pd.notna(out), None)
+def _category_aggregates_payload(category: str, range: str, format: PayloadFormat) -> dict:
+    df = _load_category_aggregates_df()
+    available = sorted(df["category"].dropna().astype(str).unique().tolist()) if "category" in df.columns else []
+    c = df[df["category"].astype(str).str.lower() == category.lower()]
+    if c.empty:
+        raise HTTPException(status_code=404, detail=f"Category not found: {category}")
+
+    c = _apply_range(c.sort_values("report_date"), range)
+    series = c.drop(columns=["category"])
 
     return {
-        "summary": summary,
-        "items": out.to_dict(orient="records"),
-        "total": int(len(df)),
-        "latest_report_date": latest_report_date,
-        "categories": categories,
+        "category": str(c["category"].iloc[0]) if not c.empty else category,
+        "categories": available,
+        "series": frame_payload(series, format),
+        "range": range,
+        "points": int(len(series)),
     }
 
 
-@app.get("/api/market-detail")
-def get_market_detail(
-    market_id: str = Query(..., min_length=1),
-    range: Literal["4W", "12W", "YTD", "1Y", "ALL"] = "12W",
+@app.get("/api/category-aggregates")
+async def get_category_aggregates(
+    category: str = Query(default="ALL"),
+    range: Literal["4W", "12W", "YTD", "1Y", "ALL"] = "1Y",
+    format: PayloadFormat = "records",
+) -> Response:
+    args = (category, range, format)
+    return await _offload_json(("category-aggregates", *args), _category_aggregates_payload, *args)
+
+
+def _market_detail_payload(
+    market: str,
+    range: str,
+    format: PayloadFormat,
+    width: int | None = None,
+    downsample: DownsampleMethod = "minmax",
 ) -> dict:
-    df = _load_metrics_df()
-    market = str(market_id).strip()
-    m = df[df["market_key"].astype(str) == market].copy()
-    if m.empty:
+    index = _load_market_index()
+    m = index.market_rows(market)
+    if m is None or m.empty:
         raise HTTPException(status_code=404, detail=f"Market not found: {market}")
 
-    m = m.sort_values("report_date")
-    m_range = _apply_range(m, range)
+    m_range = index.range_rows(market, lambda latest: range_cutoff(latest, range))
     if m_range.empty:
-        m_range = m.tail(1).copy()
+        m_range = m.tail(1)
 
     latest_row = m.iloc[-1]
     latest = {
@@ -270,43 +447,202 @@ def get_market_detail(
         else None,
     }
 
-    series_cols = [
-        "report_date",
-        "nc_net",
-        "comm_net",
-        "open_interest",
-        "net_z_52w_funds",
-        "net_z_52w_commercials",
-        "nc_net_chg_1w",
-        "comm_net_chg_1w",
-        "open_interest_chg_1w_pct",
-    ]
-    keep = [c for c in series_cols if c in m_range.columns]
-    series = m_range[keep].copy()
-    if "report_date" in series.columns:
-        series["report_date"] = pd.to_datetime(series["report_date"], errors="coerce").dt.strftime("%Y-%m-%d")
-    series = series.where(pd.notna(series), None)
-
-    # Recent rows for table (always from full history, newest first)
-    table_cols = [
-        "report_date",
-        "nc_net",
-        "comm_net",
-        "net_z_52w_funds",
-        "net_z_52w_commercials",
-        "open_interest",
-        "open_interest_chg_1w_pct",
-    ]
-    keep_tbl = [c for c in table_cols if c in m.columns]
-    table_df = m[keep_tbl].sort_values("report_date", ascending=False).head(30).copy()
-    if "report_date" in table_df.columns:
-        table_df["report_date"] = pd.to_datetime(table_df["report_date"], errors="coerce").dt.strftime("%Y-%m-%d")
-    table_df = table_df.where(pd.notna(table_df), None)
+    keep = [c for c in SERIES_COLS if c in m_range.columns]
+    # Rows the client chart can show at `width` px (full resolution when the range already fits)
+    series = downsample_frame(m_range[keep], width, method=downsample)
+
+    # Recent rows for table: first keyset page of the full history, newest first
+    keep_tbl = [c for c in TABLE_COLS if c in m.columns]
+    table, table_next = _history_page(index, market, None, MARKET_DETAIL_TABLE_ROWS, "desc", keep_tbl, format)
 
+    # Serialized from column arrays straight to bytes (range=ALL is the largest payload)
     return {
         "latest": latest,
-        "series": series.to_dict(orient="records"),
-        "table": table_df.to_dict(orient="records"),
+        "series": frame_payload(series, format),
+        "table": table,
+        "table_next_cursor": table_next,
         "range": range,
         "points": int(len(series)),
+        "source_points": int(len(m_range)),
+    }
+
+
+@app.get("/api/market-detail")
+async def get_market_detail(
+    market_id: str = Query(..., min_length=1),
+    range: Literal["4W", "12W", "YTD", "1Y", "ALL"] = "12W",
+    format: PayloadFormat = "records",
+    width: int | None = Query(default=None, ge=CHART_MIN_WIDTH_PX, le=CHART_MAX_WIDTH_PX),
+    downsample: DownsampleMethod = "minmax",
+) -> Response:
+    args = (str(market_id).strip(), range, format, width, downsample)
+    return await _offload_json(("market-detail", *args), _market_detail_payload, *args)
+
+
+def _series_payload(
+    market_ids: tuple[str, ...],
+    columns: tuple[str, ...],
+    lo: pd.Timestamp | None,
+    hi: pd.Timestamp | None,
+    format: PayloadFormat,
+    width: int | None = None,
+    downsample: DownsampleMethod = "minmax",
+) -> dict:
+    index = _load_market_index()
+    available = index.frame.columns
+    keep = _projection(available, columns, SERIES_COLS)
+    col_pos = [available.get_loc(c) for c in keep]
+
+    bounds = {m: index.date_bounds(m, lo, hi) for m in market_ids}
+    found = {m: b for m, b in bounds.items() if b is not None}
+    cells = sum(b[1] - b[0] for b in found.values()) * len(keep)
+    if cells > SERIES_MAX_CELLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Request covers {cells} cells (limit {SERIES_MAX_CELLS}); narrow markets, columns or date range",
+        )
+
+    # Only the requested columns of each market's row range are materialized, then reduced
+    # to the chart width when one is given
+    series = {
+        m: downsample_frame(index.frame.iloc[b[0]:b[1], col_pos], width, method=downsample) for m, b in found.items()
     }
+    return {
+        "markets": {
+            m: {
+                "series": frame_payload(series[m], format),
+                "points": int(len(series[m])),
+                "source_points": int(b[1] - b[0]),
+            }
+            for m, b in found.items()
+        },
+        "missing": [m for m in market_ids if m not in found],
+        "columns": keep,
+        "start": lo.strftime("%Y-%m-%d") if lo is not None else None,
+        "end": hi.strftime("%Y-%m-%d") if hi is not None else None,
+        "cells": int(cells),
+    }
+
+
+def _market_history_payload(
+    market: str,
+    cursor: str | None,
+    limit: int,
+    order: str,
+    columns: tuple[str, ...],
+    format: PayloadFormat,
+) -> dict:
+    index = _load_market_index()
+    if market not in index.ranges:
+        raise HTTPException(status_code=404, detail=f"Market not found: {market}")
+    after = _decode_cursor(cursor, market, order) if cursor else None
+    keep = _projection(index.frame.columns, columns, TABLE_COLS)
+    items, next_cursor = _history_page(index, market, after, limit, order, keep, format)
+    return {
+        "market_id": market,
+        "items": items,
+        "next_cursor": next_cursor,
+        "order": order,
+        "limit": limit,
+        "columns": keep,
+    }
+
+
+@app.get("/api/market-history")
+async def get_market_history(
+    market_id: str = Query(..., min_length=1),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=HISTORY_PAGE_SIZE, ge=1, le=HISTORY_MAX_PAGE),
+    order: Literal["desc", "asc"] = "desc",
+    columns: list[str] | None = Query(default=None),
+    format: PayloadFormat = "records",
+) -> Response:
+    args = (str(market_id).strip(), cursor, limit, order, tuple(_split_csv(columns)), format)
+    return await _offload_json(("market-history", *args), _market_history_payload, *args)
+
+
+@app.get("/api/series")
+async def get_series(
+    markets: list[str] = Query(..., min_length=1),
+    columns: list[str] | None = Query(default=None),
+    start: str | None = Query(default=None),
+    end: str | None = Query(default=None),
+    format: PayloadFormat = "records",
+    width: int | None = Query(default=None, ge=CHART_MIN_WIDTH_PX, le=CHART_MAX_WIDTH_PX),
+    downsample: DownsampleMethod = "minmax",
+) -> Response:
+    market_ids = tuple(_split_csv(markets))
+    if not market_ids:
+        raise HTTPException(status_code=400, detail="markets is required")
+    lo, hi = _parse_date_param(start, "start"), _parse_date_param(end, "end")
+    if lo is not None and hi is not None and lo > hi:
+        raise HTTPException(status_code=400, detail="start must be <= end")
+    args = (market_ids, tuple(_split_csv(columns)), lo, hi, format, width, downsample)
+    return await _offload_json(("series", *args), _series_payload, *args)
+
+
+@app.get("/api/bulk/metrics")
+async def get_bulk_metrics(
+    format: BulkFormat = "arrow",
+    columns: list[str] | None = Query(default=None),
+    market_id: list[str] | None = Query(default=None),
+    start: str | None = Query(default=None),
+    end: str | None = Query(default=None),
+    batch_size: int = Query(default=BULK_BATCH_ROWS, ge=256, le=262_144),
+) -> StreamingResponse:
+    path = _compute_path("metrics_weekly.parquet")
+    if not path.exists():
+        raise HTTPException(status_code=404, detail="metrics_weekly.parquet not found")
+
+    dataset = await _offload(None, open_dataset, path)
+    try:
+        projection = project_columns(dataset.schema, columns)
+        filter_expr = build_filter(dataset.schema, market_id, start, end)
+    except BulkQueryError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    # Record batches are read, encoded and sent one at a time (flat memory for any range);
+    # every step runs on the bounded pool, the first one before the response starts (429 if saturated)
+    chunks = stream_batches(dataset, projection, filter_expr, format, batch_size)
+    first = await _offload(None, next, chunks, None)
+    return StreamingResponse(
+        work_pool().iterate(chunks, first),
+        media_type=BULK_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="metrics_weekly.{BULK_EXTENSIONS[format]}"'},
+    )
+
+
+@app.get("/api/events")
+async def get_events(request: Request) -> StreamingResponse:
+    """
+    SSE stream: `generation` on connect, then `report` (new report_date) or `update`
+    (same report_date recomputed) with a compact radar diff, plus heartbeat comments.
+    """
+    watcher = _REPORT_WATCHER
+    await watcher.start()
+    last_event_id = request.headers.get("last-event-id")
+
+    async def stream():
+        with watcher.subscribe() as queue:
+            yield "retry: 10000\n\n"
+            current = watcher.generation or {}
+            if last_event_id and watcher.last_event and last_event_id != current.get("id"):
+                # Reconnecting client missed the latest release
+                yield format_sse(*watcher.last_event, current.get("id"))
+            else:
+                yield format_sse(
+                    "generation",
+                    {"generation": current.get("id"), "report_date": current.get("report_date")},
+                    current.get("id"),
+                )
+            while not await request.is_disconnected():
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=EVENTS_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,139 @@
+"""Process-wide cache of parsed compute artifacts for the API."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+import pandas as pd
+
+logger = logging.getLogger("cot_mvp")
+
+# (mtime_ns, size, inode) of the file at load time
+Signature = tuple[int, int, int]
+
+
+def file_signature(path: Path) -> Signature | None:
+    """Cheap stat()-based identity of a file; None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+@dataclass
+class Artifact:
+    """
+    One parsed artifact generation.
+
+    `frame` is shared by all requests and must be treated as read-only.
+    `derive()` memoizes per-generation structures (indexes, encoded responses);
+    they are dropped together with the artifact when the file changes.
+    """
+
+    path: Path
+    frame: pd.DataFrame
+    signature: Signature
+    generation: int
+    loaded_at: float
+    _derived: dict[Any, Any] = field(default_factory=dict, repr=False)
+    _derive_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def derive(self, key: Any, build: Callable[[pd.DataFrame], Any]) -> Any:
+        """Return build(frame), computed once per (artifact generation, key)."""
+        try:
+            return self._derived[key]
+        except KeyError:
+            pass
+        with self._derive_lock:
+            if key not in self._derived:
+                self._derived[key] = build(self.frame)
+            return self._derived[key]
+
+
+class ArtifactCache:
+    """
+    Keeps parsed parquet frames in memory and revalidates them with stat().
+
+    A request only stats the file; a changed (mtime, size, inode) triggers a
+    reload under a per-path lock, after which the new Artifact replaces the old
+    one in a single dict assignment. If a reload fails (e.g. compute is still
+    writing the file), the previous generation keeps being served.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, Artifact] = {}
+        self._locks: dict[Path, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._generation = 0
+
+    def _lock_for(self, path: Path) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(path, threading.Lock())
+
+    def get(self, path: Path, loader: Callable[[Path], pd.DataFrame]) -> Artifact | None:
+        """
+        Return the cached artifact for path, reloading it if the file changed.
+
+        Args:
+            path: Parquet file path
+            loader: Reads and normalizes the file into a DataFrame
+
+        Returns:
+            Artifact, or None if the file does not exist
+        """
+        path = Path(path)
+        signature = file_signature(path)
+        if signature is None:
+            self._entries.pop(path, None)
+            return None
+
+        entry = self._entries.get(path)
+        if entry is not None and entry.signature == signature:
+            return entry
+
+        with self._lock_for(path):
+            entry = self._entries.get(path)
+            signature = file_signature(path)
+            if signature is None:
+                return entry
+            if entry is not None and entry.signature == signature:
+                return entry
+            try:
+                frame = loader(path)
+            except Exception as e:  # noqa: BLE001 - keep serving the previous generation
+                if entry is None:
+                    raise
+                logger.warning(f"[api] reload of {path.name} failed, serving previous generation: {e}")
+                return entry
+            with self._locks_guard:
+                self._generation += 1
+                generation = self._generation
+            entry = Artifact(
+                path=path,
+                frame=frame,
+                signature=signature,
+                generation=generation,
+                loaded_at=time.time(),
+            )
+            self._entries[path] = entry
+            logger.info(f"[api] loaded {path.name} rows={len(frame)} generation={generation}")
+            return entry
+
+    def clear(self) -> None:
+        """Drop all cached artifacts."""
+        self._entries.clear()
+
+
+_CACHE = ArtifactCache()
+
+
+def artifact_cache() -> ArtifactCache:
+    """The process-wide cache shared by all API workers' threads."""
+    return _CACHE
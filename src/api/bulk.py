@@ -0,0 +1,139 @@
+"""Bulk Arrow IPC / Parquet streams over compute artifacts (projection and predicates pushed to the reader)."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import Iterator, Literal
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as pds
+import pyarrow.parquet as pq
+
+BulkFormat = Literal["arrow", "parquet"]
+
+BULK_MEDIA_TYPES: dict[str, str] = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+BULK_EXTENSIONS: dict[str, str] = {"arrow": "arrows", "parquet": "parquet"}
+
+# Rows per streamed record batch; bounds server memory independently of the requested range
+BULK_BATCH_ROWS = 16_384
+
+KEY_COLUMNS = ("market_key", "report_date")
+
+
+class BulkQueryError(ValueError):
+    """Invalid projection or predicate for a bulk request."""
+
+
+def open_dataset(path: Path) -> pds.Dataset:
+    """Parquet dataset over a single compute artifact (reads the footer only)."""
+    return pds.dataset(str(path), format="parquet")
+
+
+def project_columns(schema: pa.Schema, columns: list[str] | None) -> list[str]:
+    """
+    Requested columns in file order, key columns always first.
+
+    Accepts repeated (?columns=a&columns=b) and comma-separated (?columns=a,b) values.
+    """
+    if not columns:
+        return list(schema.names)
+    requested = [c.strip() for value in columns for c in value.split(",") if c.strip()]
+    unknown = sorted(set(requested) - set(schema.names))
+    if unknown:
+        raise BulkQueryError(f"Unknown columns: {', '.join(unknown)}")
+    keys = [c for c in KEY_COLUMNS if c in schema.names]
+    return keys + [c for c in schema.names if c in set(requested) and c not in keys]
+
+
+def _timestamp(value: str | None, name: str) -> pd.Timestamp | None:
+    if not value:
+        return None
+    ts = pd.to_datetime(value, errors="coerce")
+    if pd.isna(ts):
+        raise BulkQueryError(f"Invalid {name}: {value}")
+    return ts
+
+
+def build_filter(
+    schema: pa.Schema,
+    markets: list[str] | None,
+    start: str | None,
+    end: str | None,
+) -> pds.Expression | None:
+    """
+    Dataset filter for market_key IN markets and start <= report_date <= end.
+
+    Row groups whose min/max statistics cannot match are skipped by the reader.
+    """
+    expr: pds.Expression | None = None
+
+    def _and(part: pds.Expression) -> None:
+        nonlocal expr
+        expr = part if expr is None else expr & part
+
+    market_list = [m.strip() for value in markets or [] for m in value.split(",") if m.strip()]
+    if market_list:
+        _and(pds.field("market_key").isin(market_list))
+
+    lo, hi = _timestamp(start, "start"), _timestamp(end, "end")
+    if lo is not None and hi is not None and lo > hi:
+        raise BulkQueryError("start must be <= end")
+    if lo is not None or hi is not None:
+        date_type = schema.field("report_date").type
+        if lo is not None:
+            _and(pds.field("report_date") >= pa.scalar(lo.to_pydatetime(), type=date_type))
+        if hi is not None:
+            _and(pds.field("report_date") <= pa.scalar(hi.to_pydatetime(), type=date_type))
+    return expr
+
+
+def _drain(buffer: io.BytesIO) -> bytes:
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
+
+
+def stream_batches(
+    dataset: pds.Dataset,
+    columns: list[str],
+    filter_expr: pds.Expression | None,
+    fmt: BulkFormat,
+    batch_size: int = BULK_BATCH_ROWS,
+) -> Iterator[bytes]:
+    """
+    Encode scanned record batches as they arrive.
+
+    Each yielded chunk holds at most one batch (plus the schema header for
+    Arrow, or the footer for Parquet on close), so memory stays flat for any
+    requested range.
+    """
+    scanner = dataset.scanner(columns=columns, filter=filter_expr, batch_size=batch_size)
+    # pandas metadata describes all columns of the file, not the projection
+    schema = scanner.projected_schema.remove_metadata()
+    buffer = io.BytesIO()
+    if fmt == "parquet":
+        writer = pq.ParquetWriter(buffer, schema)
+    else:
+        writer = pa.ipc.new_stream(buffer, schema)
+    try:
+        header = _drain(buffer)
+        if header:
+            yield header
+        for batch in scanner.to_batches():
+            if batch.num_rows == 0:
+                continue
+            writer.write_batch(batch)
+            chunk = _drain(buffer)
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    tail = _drain(buffer)
+    if tail:
+        yield tail
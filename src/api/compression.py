@@ -0,0 +1,47 @@
+"""Response body compression shared by the HTTP cache middleware and pre-encoded JSON responses."""
+
+from __future__ import annotations
+
+import gzip
+import os
+
+try:  # optional: br is used only when installed and accepted by the client
+    import brotli
+except ImportError:  # pragma: no cover - depends on environment
+    brotli = None
+
+# Deployment defaults (env); HttpCacheSettings.from_env reads the same values
+COMPRESSION_ENABLED = os.getenv("COT_API_COMPRESSION", "1").strip().lower() in {"1", "true", "yes", "on"}
+COMPRESS_MIN_BYTES = int(os.getenv("COT_API_COMPRESS_MIN_BYTES", "1024"))
+GZIP_LEVEL = int(os.getenv("COT_API_GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("COT_API_BROTLI_QUALITY", "5"))
+
+# Encodings this process can produce, in preference order
+AVAILABLE_ENCODINGS: tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def choose_encoding(accept_encoding: str | None) -> str | None:
+    """'br' (if available) or 'gzip' when the client accepts it with q > 0."""
+    accepted: dict[str, float] = {}
+    for part in (accept_encoding or "").split(","):
+        token, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if token:
+            accepted[token.strip().lower()] = q
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str, gzip_level: int = GZIP_LEVEL, brotli_quality: int = BROTLI_QUALITY) -> bytes:
+    """body in the given content-coding ('br' or 'gzip'; gzip output is deterministic, mtime=0)."""
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
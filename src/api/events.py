@@ -0,0 +1,210 @@
+"""Server-sent events for new compute generations (new report_date + compact radar diff)."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from src.api.artifacts import Signature, file_signature
+from src.api.serialization import column_values, dumps, frame_records
+from src.common.generation import read_generation
+from src.common.signals import signal_states
+
+logger = logging.getLogger("cot_mvp")
+
+# How often the watcher stat()s generation.json
+EVENTS_POLL_SECONDS = float(os.getenv("COT_API_EVENTS_POLL", "5"))
+# Comment line sent to idle SSE clients so proxies keep the connection open
+EVENTS_HEARTBEAT_SECONDS = float(os.getenv("COT_API_EVENTS_HEARTBEAT", "15"))
+# Events buffered per client; a slow client loses the oldest ones
+EVENTS_CLIENT_BUFFER = 8
+
+DIFF_COLS = [
+    "signal_state",
+    "cot_traffic_signal",
+    "hot_score",
+    "conflict_level",
+    "oi_risk_level",
+    "net_z_52w_funds",
+    "is_hot",
+]
+
+
+def _diff_frame(radar: pd.DataFrame | None) -> pd.DataFrame:
+    if radar is None or radar.empty or "market_id" not in radar.columns:
+        return pd.DataFrame(columns=DIFF_COLS, index=pd.Index([], name="market_id"))
+    df = radar.assign(signal_state=signal_states(radar))
+    df = df.drop_duplicates("market_id", keep="last").set_index(df["market_id"].astype(str).rename("market_id"))
+    return df.reindex(columns=DIFF_COLS)
+
+
+def radar_diff(old: pd.DataFrame | None, new: pd.DataFrame) -> dict:
+    """
+    Compact per-market changes between two latest-radar frames.
+
+    Returns {"added": [rows], "removed": [market_id], "changed": [{"market_id", "changes": {col: [old, new]}}],
+    "unchanged": n}; only DIFF_COLS are compared (NaN == NaN).
+    """
+    a, b = _diff_frame(old), _diff_frame(new)
+    common = a.index.intersection(b.index)
+    added = b.loc[b.index.difference(a.index)]
+    removed = a.index.difference(b.index)
+
+    a_common, b_common = a.loc[common], b.loc[common]
+    same = (a_common.astype(object) == b_common.astype(object)) | (a_common.isna() & b_common.isna())
+    changed_mask = ~same.to_numpy(dtype=bool)
+
+    old_vals = {col: column_values(a_common[col]) for col in DIFF_COLS}
+    new_vals = {col: column_values(b_common[col]) for col in DIFF_COLS}
+    changed = []
+    for i in np.flatnonzero(changed_mask.any(axis=1)):
+        changes = {
+            col: [old_vals[col][i], new_vals[col][i]]
+            for j, col in enumerate(DIFF_COLS)
+            if changed_mask[i, j]
+        }
+        changed.append({"market_id": str(common[i]), "changes": changes})
+
+    return {
+        "added": frame_records(added.reset_index()),
+        "removed": [str(m) for m in removed],
+        "changed": changed,
+        "unchanged": int(len(common) - len(changed)),
+    }
+
+
+def format_sse(event: str, data: dict, event_id: str | None = None) -> str:
+    """One SSE message (data is a single compact JSON line)."""
+    head = f"id: {event_id}\n" if event_id else ""
+    return f"{head}event: {event}\ndata: {dumps(data).decode('utf-8')}\n\n"
+
+
+class ReportWatcher:
+    """
+    Watches data/compute/generation.json and fans out one event per new generation.
+
+    While at least one client is subscribed, a single background task stat()s the
+    marker every EVENTS_POLL_SECONDS; it is cancelled when the last client leaves.
+    The radar reload and diff run once per generation off the event loop, and the
+    resulting event is pushed to every subscriber's bounded queue.
+    """
+
+    def __init__(
+        self,
+        generation_path: Callable[[], Path],
+        load_radar: Callable[[], pd.DataFrame],
+        poll_seconds: float = EVENTS_POLL_SECONDS,
+    ):
+        self._generation_path = generation_path
+        self._load_radar = load_radar
+        self.poll_seconds = poll_seconds
+        self.generation: dict | None = None
+        self.last_event: tuple[str, dict] | None = None
+        self._signature: Signature | None = None
+        self._radar: pd.DataFrame | None = None
+        self._subscribers: set[asyncio.Queue] = set()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def _read_radar(self) -> pd.DataFrame | None:
+        try:
+            return self._load_radar()
+        except Exception as e:  # noqa: BLE001 - artifacts may be missing before the first compute
+            logger.warning(f"[api] events: radar not available: {e}")
+            return None
+
+    def _polling(self) -> bool:
+        task = self._task
+        return task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop()
+
+    async def start(self) -> None:
+        """
+        Bring the baseline up to date before a client subscribes.
+
+        The first call loads the current generation; after an idle period (no
+        subscribers, no polling) a generation written meanwhile is picked up here,
+        so last_event covers it for reconnecting clients.
+        """
+        if self._polling():
+            return
+        if self.generation is None:
+            path = self._generation_path()
+            self._signature = file_signature(path)
+            self.generation = read_generation(path)
+            self._radar = await asyncio.to_thread(self._read_radar)
+        else:
+            await self.check()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_seconds)
+            try:
+                await self.check()
+            except Exception as e:  # noqa: BLE001 - keep watching
+                logger.warning(f"[api] events: check failed: {e}")
+
+    async def check(self) -> bool:
+        """Publish an event if generation.json changed; True if one was published."""
+        path = self._generation_path()
+        signature = file_signature(path)
+        if signature is None or signature == self._signature:
+            return False
+        generation = read_generation(path)
+        if generation is None:
+            return False  # retried on the next poll
+        self._signature = signature
+        if self.generation is not None and generation.get("id") == self.generation.get("id"):
+            return False
+
+        radar = await asyncio.to_thread(self._read_radar)
+        diff = await asyncio.to_thread(radar_diff, self._radar, radar if radar is not None else pd.DataFrame())
+        previous = self.generation or {}
+        new_report = generation.get("report_date") != previous.get("report_date")
+        event = "report" if new_report else "update"
+        data = {
+            "generation": generation.get("id"),
+            "report_date": generation.get("report_date"),
+            "previous_report_date": previous.get("report_date"),
+            "written_at_utc": generation.get("written_at_utc"),
+            "radar_diff": diff,
+        }
+        self.generation, self._radar = generation, radar
+        self.last_event = (event, data)
+        self.publish(event, data, generation.get("id"))
+        logger.info(
+            f"[api] events: {event} generation={generation.get('id')} report_date={generation.get('report_date')} "
+            f"clients={len(self._subscribers)}"
+        )
+        return True
+
+    def publish(self, event: str, data: dict, event_id: str | None = None) -> None:
+        message = format_sse(event, data, event_id)
+        for queue in list(self._subscribers):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+    @contextmanager
+    def subscribe(self) -> Iterator[asyncio.Queue]:
+        """Client queue; the first subscriber starts polling and the last one to leave stops it."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=EVENTS_CLIENT_BUFFER)
+        self._subscribers.add(queue)
+        if not self._polling():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+            if not self._subscribers and self._task is not None:
+                self._task.cancel()
+                self._task = None
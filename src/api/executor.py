@@ -0,0 +1,125 @@
+"""Bounded worker pool for blocking parquet/pandas work behind async API handlers."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Hashable, Iterator
+
+# Threads doing parquet/pandas work; the event loop itself never blocks on it
+API_WORKERS = int(os.getenv("COT_API_WORKERS", "4"))
+# Jobs allowed to wait for a worker before new ones are rejected with 429
+API_QUEUE = int(os.getenv("COT_API_QUEUE", "16"))
+# Retry-After (seconds) sent with 429
+API_RETRY_AFTER = int(os.getenv("COT_API_RETRY_AFTER", "1"))
+# Wait between attempts when a started stream finds the pool saturated
+STREAM_RETRY_SECONDS = 0.05
+
+
+class PoolSaturated(RuntimeError):
+    """All workers are busy and the wait queue is full."""
+
+    def __init__(self, retry_after: int):
+        super().__init__("API worker pool is saturated")
+        self.retry_after = retry_after
+
+
+@dataclass
+class PoolStats:
+    submitted: int = 0
+    coalesced: int = 0
+    rejected: int = 0
+
+
+class WorkPool:
+    """
+    Runs blocking callables on a fixed thread pool with a bounded backlog.
+
+    Concurrent calls with the same key share one execution: later callers
+    await the first caller's future instead of submitting again. A job stays
+    counted (and coalescable) until its thread finishes, even if every waiting
+    client has disconnected. State is touched only from the event loop thread.
+    """
+
+    def __init__(self, max_workers: int = API_WORKERS, max_queue: int = API_QUEUE, retry_after: int = API_RETRY_AFTER):
+        self.max_workers = max_workers
+        self.max_pending = max_workers + max_queue
+        self.retry_after = retry_after
+        self.stats = PoolStats()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cot-api")
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Jobs running or waiting for a worker."""
+        return self._pending
+
+    def _finished(self, key: Hashable | None, future: asyncio.Future) -> None:
+        self._pending -= 1
+        if key is not None and self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            future.exception()  # mark retrieved when no caller is left to await it
+
+    async def run(self, key: Hashable | None, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Await fn(*args) on the pool.
+
+        Args:
+            key: Coalescing key (e.g. endpoint + normalized params); None disables sharing
+            fn: Blocking callable; its result is shared by all callers with the same key
+
+        Raises:
+            PoolSaturated: if no worker or queue slot is free
+        """
+        loop = asyncio.get_running_loop()
+        if key is not None:
+            shared = self._inflight.get(key)
+            if shared is not None and shared.get_loop() is loop:
+                self.stats.coalesced += 1
+                return await asyncio.shield(shared)
+
+        if self._pending >= self.max_pending:
+            self.stats.rejected += 1
+            raise PoolSaturated(self.retry_after)
+
+        self._pending += 1
+        self.stats.submitted += 1
+        future = loop.run_in_executor(self._executor, functools.partial(fn, *args))
+        if key is not None:
+            self._inflight[key] = future
+        future.add_done_callback(functools.partial(self._finished, key))
+        return await asyncio.shield(future)
+
+    async def iterate(self, items: Iterator[Any], first: Any = None) -> AsyncIterator[Any]:
+        """
+        Yield `first`, then the later items of a blocking iterator, each produced by one pool job.
+
+        For streamed responses: the handler produces the first item with run() (a
+        saturated pool can still answer 429), later steps wait for a free slot instead
+        of cutting the stream short. Iteration ends at the first None item.
+        """
+        item = first
+        while item is not None:
+            yield item
+            while True:
+                try:
+                    item = await self.run(None, next, items, None)
+                    break
+                except PoolSaturated:
+                    await asyncio.sleep(STREAM_RETRY_SECONDS)
+
+
+_POOL: WorkPool | None = None
+
+
+def work_pool() -> WorkPool:
+    """The process-wide pool shared by all API handlers."""
+    global _POOL
+    if _POOL is None:
+        _POOL = WorkPool()
+    return _POOL
@@ -0,0 +1,221 @@
+"""HTTP validators (ETag / Last-Modified from the compute generation) and response compression."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Callable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.artifacts import Signature, file_signature
+from src.api.compression import (
+    BROTLI_QUALITY,
+    COMPRESS_MIN_BYTES,
+    COMPRESSION_ENABLED,
+    GZIP_LEVEL,
+    choose_encoding,
+    compress,
+)
+from src.api.responses import etag_matches
+from src.common.generation import read_generation
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() in {"1", "true", "yes", "on"}
+
+
+@dataclass(frozen=True)
+class HttpCacheSettings:
+    """Per-deployment knobs (env: COT_API_HTTP_CACHE, COT_API_CACHE_MAX_AGE, COT_API_COMPRESSION, ...)."""
+
+    validators: bool = True
+    max_age: int = 60
+    compression: bool = True
+    min_size: int = 1024
+    gzip_level: int = 6
+    brotli_quality: int = 5
+    excluded_paths: tuple[str, ...] = ("/api/health", "/api/events")
+
+    @classmethod
+    def from_env(cls) -> "HttpCacheSettings":
+        return cls(
+            validators=_env_flag("COT_API_HTTP_CACHE", "1"),
+            max_age=int(os.getenv("COT_API_CACHE_MAX_AGE", "60")),
+            compression=COMPRESSION_ENABLED,
+            min_size=COMPRESS_MIN_BYTES,
+            gzip_level=GZIP_LEVEL,
+            brotli_quality=BROTLI_QUALITY,
+        )
+
+
+@dataclass(frozen=True)
+class GenerationStamp:
+    """Identity and modification time of the compute outputs currently on disk."""
+
+    id: str
+    modified: float  # POSIX seconds
+
+
+class GenerationTracker:
+    """
+    Current GenerationStamp, re-read only when generation.json changes (one stat() per request).
+
+    Falls back to the fallback artifact's (mtime, size, inode) if compute has
+    not written a generation marker yet.
+    """
+
+    def __init__(self, generation_path: Callable[[], Path], fallback_path: Callable[[], Path]):
+        self._generation_path = generation_path
+        self._fallback_path = fallback_path
+        self._cached: tuple[Signature, GenerationStamp] | None = None
+
+    def current(self) -> GenerationStamp | None:
+        path = self._generation_path()
+        signature = file_signature(path)
+        if signature is None:
+            path = self._fallback_path()
+            signature = file_signature(path)
+            if signature is None:
+                return None
+            return GenerationStamp(id="-".join(map(str, signature)), modified=signature[0] / 1e9)
+        cached = self._cached
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        generation = read_generation(path) or {}
+        stamp = GenerationStamp(id=str(generation.get("id") or signature[0]), modified=signature[0] / 1e9)
+        self._cached = (signature, stamp)
+        return stamp
+
+
+def generation_etag(stamp: GenerationStamp, path: str, query: str) -> str:
+    """Weak ETag for one URL within one generation (responses are a function of both)."""
+    query_key = "&".join(sorted(query.split("&"))) if query else ""
+    digest = hashlib.blake2b(f"{stamp.id}|{path}?{query_key}".encode("utf-8"), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _not_modified_since(if_modified_since: str | None, modified: float) -> bool:
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return int(modified) <= int(since)
+
+
+class HttpCacheMiddleware:
+    """
+    ASGI middleware for GET /api/* responses.
+
+    - Conditional requests: If-None-Match / If-Modified-Since are checked
+      against the generation validators before the handler runs, so repeat
+      polls between pipeline runs cost one stat() and a 304.
+    - 200 responses get ETag (unless the handler set its own), Last-Modified
+      and Cache-Control.
+    - Complete (non-streaming) JSON/text bodies of at least min_size bytes
+      are compressed with br or gzip; a strong handler ETag becomes weak, as
+      the compressed bytes differ. Responses that already carry
+      Content-Encoding (pre-compressed snapshots, see responses.json_response)
+      are passed through with their own validators.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        tracker: GenerationTracker,
+        settings: HttpCacheSettings | None = None,
+    ) -> None:
+        self.app = app
+        self.tracker = tracker
+        self.settings = settings or HttpCacheSettings.from_env()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or scope.get("method") != "GET"
+            or not path.startswith("/api/")
+            or path in self.settings.excluded_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        settings = self.settings
+        request_headers = Headers(scope=scope)
+        validators: dict[str, str] = {}
+        if settings.validators:
+            stamp = self.tracker.current()
+            if stamp is not None:
+                validators = {
+                    "etag": generation_etag(stamp, path, scope.get("query_string", b"").decode("latin-1")),
+                    "last-modified": formatdate(stamp.modified, usegmt=True),
+                    "cache-control": f"public, max-age={settings.max_age}, must-revalidate",
+                }
+                if_none_match = request_headers.get("if-none-match")
+                if (if_none_match and etag_matches(if_none_match, validators["etag"])) or (
+                    not if_none_match and _not_modified_since(request_headers.get("if-modified-since"), stamp.modified)
+                ):
+                    # Same Vary as the 200 (its body may be encoded per Accept-Encoding)
+                    not_modified = {**validators, "vary": "Accept-Encoding"} if settings.compression else validators
+                    await send({"type": "http.response.start", "status": 304, "headers": _raw(not_modified)})
+                    await send({"type": "http.response.body", "body": b""})
+                    return
+
+        encoding = choose_encoding(request_headers.get("accept-encoding")) if settings.compression else None
+        start: Message | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+            assert start is not None
+            headers = MutableHeaders(scope=start)
+            if start["status"] == 200:
+                for name, value in validators.items():
+                    if name not in headers:
+                        headers[name] = value
+            body = message.get("body", b"")
+            if message.get("more_body", False):
+                # Streaming response (bulk/SSE): forward as is
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+            if settings.compression and "accept-encoding" not in headers.get("vary", "").lower():
+                headers.add_vary_header("Accept-Encoding")
+            if encoding and _compressible(headers, len(body), settings.min_size):
+                body = compress(body, encoding, settings.gzip_level, settings.brotli_quality)
+                headers["content-encoding"] = encoding
+                headers["content-length"] = str(len(body))
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["etag"] = f"W/{etag}"
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _raw(headers: dict[str, str]) -> list[tuple[bytes, bytes]]:
+    return [(k.encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()]
+
+
+def _compressible(headers: MutableHeaders, size: int, min_size: int) -> bool:
+    if size < min_size or "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    return any(content_type.startswith(t) for t in COMPRESSIBLE_TYPES)
+
@@ -0,0 +1,96 @@
+"""Pre-encoded JSON responses with strong ETags and conditional GET support."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass, field
+from typing import Any
+
+from fastapi import Request, Response
+
+from src.api.compression import AVAILABLE_ENCODINGS, COMPRESS_MIN_BYTES, COMPRESSION_ENABLED, choose_encoding, compress
+from src.api.serialization import dumps
+
+# Browser/proxy freshness for snapshot responses; clients revalidate with If-None-Match after that
+SNAPSHOT_MAX_AGE = int(os.getenv("COT_API_SNAPSHOT_MAX_AGE", "60"))
+
+
+@dataclass(frozen=True)
+class EncodedJSON:
+    """
+    A serialized JSON body and its strong ETag (content hash).
+
+    Each content-coding is its own representation with its own strong ETag
+    (`"<hash>-gzip"`, `"<hash>-br"`), so a 304 can be answered without
+    compressing. `compressed` holds bodies encoded up front (precompress=True).
+    """
+
+    body: bytes
+    etag: str
+    compressed: dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def compressible(self) -> bool:
+        return COMPRESSION_ENABLED and len(self.body) >= COMPRESS_MIN_BYTES
+
+    def variant_etag(self, encoding: str | None) -> str:
+        return self.etag if encoding is None else f'{self.etag[:-1]}-{encoding}"'
+
+    def variant(self, encoding: str | None) -> bytes:
+        """Body in the given content-coding (None = identity); compressed now if not precompressed."""
+        if encoding is None:
+            return self.body
+        body = self.compressed.get(encoding)
+        return body if body is not None else compress(self.body, encoding)
+
+
+def encode_json(payload: Any, precompress: bool = False) -> EncodedJSON:
+    """Serialize compactly (see serialization.dumps) and tag with a content hash; optionally compress once."""
+    body = dumps(payload)
+    encoded = EncodedJSON(body=body, etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+    if precompress and encoded.compressible:
+        encoded.compressed.update({encoding: compress(body, encoding) for encoding in AVAILABLE_ENCODINGS})
+    return encoded
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """True if an If-None-Match header value covers etag (weak comparison, as for GET)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    return opaque in {c[2:] if c.startswith("W/") else c for c in candidates}
+
+
+def json_response(
+    request: Request,
+    encoded: EncodedJSON,
+    max_age: int = SNAPSHOT_MAX_AGE,
+) -> Response:
+    """
+    200 with the pre-encoded body, or 304 if the client already holds this ETag.
+
+    The content-coding is picked from Accept-Encoding; the 200 and the 304 of one
+    representation carry the same ETag and Vary.
+    """
+    encoding = choose_encoding(request.headers.get("accept-encoding")) if encoded.compressible else None
+    etag = encoded.variant_etag(encoding)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}, must-revalidate",
+    }
+    if encoded.compressible:
+        headers["Vary"] = "Accept-Encoding"
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(content=encoded.variant(encoding), media_type="application/json", headers=headers)
+
+
+def bytes_response(body: bytes) -> Response:
+    """Already-encoded JSON body as a Response (no FastAPI re-validation/re-encoding)."""
+    return Response(content=body, media_type="application/json")
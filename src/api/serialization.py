@@ -0,0 +1,82 @@
+"""Column-array JSON serialization for API payloads (NaN/NaT -> null without per-cell pandas work)."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Literal
+
+import numpy as np
+import pandas as pd
+
+try:  # optional fast encoder
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+PayloadFormat = Literal["records", "columns"]
+
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def column_values(series: pd.Series) -> list:
+    """
+    JSON-ready Python list for one column.
+
+    Missing values become None via a single mask per column; datetimes are
+    formatted as YYYY-MM-DD.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        values = series.dt.strftime(DATE_FORMAT).to_numpy(dtype=object, na_value=None)
+        return values.tolist()
+    if pd.api.types.is_bool_dtype(series.dtype) and not series.hasnans:
+        return series.to_numpy(dtype=bool).tolist()
+    if pd.api.types.is_integer_dtype(series.dtype) and not series.hasnans:
+        return series.to_numpy(dtype="int64").tolist()
+    if pd.api.types.is_float_dtype(series.dtype):
+        arr = series.to_numpy(dtype="float64", na_value=np.nan)
+        mask = ~np.isfinite(arr)
+        if not mask.any():
+            return arr.tolist()
+        out = arr.astype(object)
+        out[mask] = None
+        return out.tolist()
+    arr = series.to_numpy(dtype=object)
+    mask = pd.isna(arr)
+    if mask.any():
+        arr = arr.copy()
+        arr[mask] = None
+    return arr.tolist()
+
+
+def frame_columns(df: pd.DataFrame) -> dict[str, list]:
+    """{column: values} layout."""
+    return {str(col): column_values(df[col]) for col in df.columns}
+
+
+def frame_records(df: pd.DataFrame) -> list[dict]:
+    """[{column: value}, ...] layout built from the column lists."""
+    columns = frame_columns(df)
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
+def frame_payload(df: pd.DataFrame, fmt: PayloadFormat) -> list[dict] | dict[str, list]:
+    """Serialize df as records (default) or as column arrays (`?format=columns`)."""
+    return frame_columns(df) if fmt == "columns" else frame_records(df)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.strftime(DATE_FORMAT)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(payload: Any) -> bytes:
+    """Compact UTF-8 JSON; orjson when installed, stdlib otherwise."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_default)
+    return json.dumps(
+        payload, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default
+    ).encode("utf-8")
@@ -0,0 +1,171 @@
+"""Precomputed dashboard/signals responses over the latest market radar."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from src.api.responses import EncodedJSON, encode_json
+from src.api.serialization import frame_records
+from src.common.signals import signal_states
+
+SIGNAL_FILTERS = ("all", "extreme", "bullish", "bearish", "neutral")
+CONFLICT_FILTERS = ("all", "High", "Medium", "Low")
+
+SIGNALS_DEFAULT_LIMIT = 200
+DASHBOARD_DEFAULT_LIMIT = 50
+
+SIGNALS_COLS = [
+    "market_id",
+    "market_name",
+    "category",
+    "signal_state",
+    "cot_traffic_signal",
+    "hot_score",
+    "conflict_level",
+    "oi_risk_level",
+    "net_z_52w_funds",
+    "open_interest_chg_1w_pct",
+    "is_hot",
+]
+DASHBOARD_COLS = [
+    "market_id",
+    "market_name",
+    "category",
+    "signal_state",
+    "cot_traffic_signal",
+    "hot_score",
+    "conflict_level",
+    "net_z_52w_funds",
+    "open_interest_chg_1w_pct",
+    "is_hot",
+]
+
+
+def _category_key(category: str) -> tuple[bool, str]:
+    # "all" disables the filter; any other value (including "ALL") is matched case-insensitively
+    return (category == "all", category.lower())
+
+
+def _records(df: pd.DataFrame, cols: list[str]) -> list[dict]:
+    return frame_records(df[[c for c in cols if c in df.columns]])
+
+
+class RadarSnapshots:
+    """
+    Dashboard/signals payloads for one radar generation.
+
+    The radar is sorted once; each (signal, category, conflict) filter is a
+    boolean mask over that order. Default-limit responses for every filter
+    combination are encoded (and compressed, once per content-coding) up
+    front, so repeat requests are a dict lookup.
+    """
+
+    def __init__(self, radar: pd.DataFrame):
+        df = radar.copy()
+        self.empty = df.empty
+        if not self.empty:
+            df["signal_state"] = signal_states(df)
+            df["signal_abs"] = pd.to_numeric(df.get("cot_traffic_signal"), errors="coerce").abs()
+            df = df.sort_values(["signal_abs", "hot_score"], ascending=False, na_position="last")
+        df = df.reset_index(drop=True)
+
+        has_category = "category" in df.columns
+        self.categories = sorted(df["category"].dropna().astype(str).unique().tolist()) if has_category else []
+        self._category = (
+            df["category"].astype(str).str.lower().to_numpy(dtype=object)
+            if has_category
+            else np.full(len(df), "nan", dtype=object)
+        )
+        self._state = df["signal_state"].to_numpy(dtype=object) if "signal_state" in df.columns else np.array([])
+        self._conflict = (
+            df["conflict_level"].to_numpy(dtype=object)
+            if "conflict_level" in df.columns
+            else np.full(len(df), None, dtype=object)
+        )
+        self._dates = (
+            pd.to_datetime(df["report_date"]).to_numpy(dtype="datetime64[ns]")
+            if "report_date" in df.columns
+            else np.full(len(df), np.datetime64("NaT"), dtype="datetime64[ns]")
+        )
+        self._signal_records = _records(df, SIGNALS_COLS) if not self.empty else []
+        self._dashboard_records = _records(df, DASHBOARD_COLS) if not self.empty else []
+
+        category_keys = ["all", *sorted({c.lower() for c in self.categories})]
+        self._signals_encoded = {
+            (signal, _category_key(category), conflict): encode_json(
+                self.signals_payload(signal, category, conflict, SIGNALS_DEFAULT_LIMIT), precompress=True
+            )
+            for signal in SIGNAL_FILTERS
+            for category in category_keys
+            for conflict in CONFLICT_FILTERS
+        }
+        self._dashboard_encoded = {
+            (signal, _category_key(category)): encode_json(
+                self.dashboard_payload(signal, category, DASHBOARD_DEFAULT_LIMIT), precompress=True
+            )
+            for signal in SIGNAL_FILTERS
+            for category in category_keys
+        }
+
+    def _positions(self, signal: str, category: str, conflict: str = "all") -> np.ndarray:
+        mask = np.ones(len(self._category), dtype=bool)
+        if category != "all":
+            mask &= self._category == category.lower()
+        if signal != "all":
+            mask &= self._state == signal
+        if conflict != "all":
+            mask &= self._conflict == conflict
+        return np.flatnonzero(mask)
+
+    def _latest_report_date(self, positions: np.ndarray) -> str | None:
+        dates = self._dates[positions]
+        dates = dates[~np.isnat(dates)]
+        if len(dates) == 0:
+            return None
+        return pd.Timestamp(dates.max()).strftime("%Y-%m-%d")
+
+    def signals_payload(self, signal: str, category: str, conflict: str, limit: int) -> dict:
+        if self.empty:
+            return {"items": [], "total": 0, "latest_report_date": None}
+        positions = self._positions(signal, category, conflict)
+        return {
+            "items": [self._signal_records[i] for i in positions[:limit]],
+            "total": int(len(positions)),
+            "latest_report_date": self._latest_report_date(positions),
+        }
+
+    def dashboard_payload(self, signal: str, category: str, limit: int) -> dict:
+        if self.empty:
+            return {
+                "summary": {"bullish": 0, "bearish": 0, "extreme": 0, "neutral": 0},
+                "items": [],
+                "total": 0,
+                "latest_report_date": None,
+                "categories": [],
+            }
+        positions = self._positions(signal, category)
+        states = self._state[positions]
+        return {
+            "summary": {state: int((states == state).sum()) for state in ["bullish", "bearish", "extreme", "neutral"]},
+            "items": [self._dashboard_records[i] for i in positions[:limit]],
+            "total": int(len(positions)),
+            "latest_report_date": self._latest_report_date(positions),
+            "categories": self.categories,
+        }
+
+    def signals(self, signal: str, category: str, conflict: str, limit: int) -> EncodedJSON:
+        """Encoded /api/signals body (pre-encoded for the default limit)."""
+        if limit == SIGNALS_DEFAULT_LIMIT:
+            cached = self._signals_encoded.get((signal, _category_key(category), conflict))
+            if cached is not None:
+                return cached
+        return encode_json(self.signals_payload(signal, category, conflict, limit))
+
+    def dashboard(self, signal: str, category: str, limit: int) -> EncodedJSON:
+        """Encoded /api/dashboard body (pre-encoded for the default limit)."""
+        if limit == DASHBOARD_DEFAULT_LIMIT:
+            cached = self._dashboard_encoded.get((signal, _category_key(category)))
+            if cached is not None:
+                return cached
+        return encode_json(self.dashboard_payload(signal, category, limit))
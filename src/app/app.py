@@ -8,6 +8,7 @@ from pathlib import Path
 
 import streamlit as st
 from src.app.auth import require_authentication, render_auth_sidebar
+from src.app.styles import HIDE_SIDEBAR_NAV_CSS
 
 
 def main() -> None:
@@ -26,16 +27,7 @@ def main() -> None:
     )
 
     # Hide Streamlit multipage menu (if auto-detected) - we use custom navigation
-    st.markdown(
-        """
-        <style>
-        [data-testid="stSidebarNav"] {
-            display: none !important;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(HIDE_SIDEBAR_NAV_CSS, unsafe_allow_html=True)
 
     if not require_authentication():
         st.stop()
@@ -51,9 +43,9 @@ def main() -> None:
     try:
         current_page = page
 
-        if current_page not in ["market", "overview", "signals"]:
+        if current_page not in ["market", "overview", "compare", "signals"]:
             st.error(f"Unknown page: '{current_page}'")
-            st.write("Expected pages: market, overview, signals")
+            st.write("Expected pages: market, overview, compare, signals")
             st.write(f"Resolved page: {page}")
             st.warning("Resetting to 'market'. Refresh to apply.")
             st.session_state["page"] = "market"
@@ -65,12 +57,15 @@ def main() -> None:
         elif current_page == "market":
             from src.app.pages.market import render as render_market
             render_market()
+        elif current_page == "compare":
+            from src.app.pages.compare import render as render_compare
+            render_compare()
         elif current_page == "signals":
             from src.app.pages.signals import render as render_signals
             render_signals()
         else:
             st.error(f"Unknown page: '{current_page}'")
-            st.write("Expected pages: market, overview, signals")
+            st.write("Expected pages: market, overview, compare, signals")
             st.write(f"Resolved page: {page}")
             st.stop()
     except Exception as e:
@@ -9,12 +9,20 @@ import os
 import re
 import secrets
 import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator
 
-import pandas as pd
 import streamlit as st
 
+if TYPE_CHECKING:  # pandas is imported lazily (admin user table only), not on the login path
+    import pandas as pd
+
 EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 ROLE_USER = "user"
 ROLE_ADMIN = "admin"
@@ -27,6 +35,38 @@ ROLE_PERMISSIONS = {
     ROLE_ADMIN: {"view_app", "run_pipeline", "manage_users"},
 }
 
+# Password hashing: iterations for new hashes (older hashes are upgraded on login), PBKDF2 threads
+# (COT_PBKDF2_WORKERS, 0 = hash on the calling thread) and hashes allowed to wait for a thread
+PASSWORD_HASH_ITERATIONS = 210_000
+PBKDF2_MAX_PENDING = 32
+
+# Failed sign-ins allowed per email / per client IP within the window
+LOGIN_MAX_FAILURES_PER_EMAIL = 5
+LOGIN_MAX_FAILURES_PER_IP = 20
+LOGIN_THROTTLE_WINDOW_S = 300.0
+
+# SQLite connections: idle connections kept per DB file, lock wait, compiled statements per connection
+POOL_MAX_IDLE = 4
+SQLITE_BUSY_TIMEOUT_S = 5.0
+STATEMENT_CACHE_SIZE = 64
+
+# Hot statements as constants: identical SQL text hits the per-connection statement cache
+_SQL_USER_BY_EMAIL = "SELECT * FROM users WHERE email = ?"
+_SQL_USER_BY_SESSION = """
+    SELECT u.*
+    FROM sessions s
+    JOIN users u ON u.id = s.user_id
+    WHERE s.token = ?
+      AND s.revoked = 0
+      AND s.expires_at_utc > ?
+"""
+_SQL_TOUCH_SESSION = "UPDATE sessions SET last_seen_at_utc = ? WHERE token = ?"
+_SQL_REVOKE_SESSION = "UPDATE sessions SET revoked = 1 WHERE token = ?"
+_SQL_INSERT_SESSION = """
+    INSERT INTO sessions (token, user_id, created_at_utc, last_seen_at_utc, expires_at_utc, revoked)
+    VALUES (?, ?, ?, ?, ?, 0)
+"""
+
 
 def _utc_now() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
@@ -39,15 +79,159 @@ def _db_path() -> Path:
     return Path(__file__).resolve().parents[2] / "data" / "app" / "auth.db"
 
 
-def _connect() -> sqlite3.Connection:
-    path = _db_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(path)
-    conn.row_factory = sqlite3.Row
-    return conn
+class _ConnectionPool:
+    """Per-process SQLite connections to one DB file in WAL mode (readers do not block the writer)."""
+
+    def __init__(self, path: Path, max_idle: int = POOL_MAX_IDLE) -> None:
+        self.path = path
+        self.max_idle = max_idle
+        self._idle: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _open(self) -> sqlite3.Connection:
+        # A connection is used by one thread at a time (borrowed), so it may move between script threads
+        conn = sqlite3.connect(
+            self.path,
+            timeout=SQLITE_BUSY_TIMEOUT_S,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._open()
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+        with self._lock:
+            if not self._closed and len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+_pools: dict[Path, _ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _pool_for(path: Path) -> _ConnectionPool:
+    """The process pool of path; replaced if the DB file was removed (old connections are closed)."""
+    with _pools_lock:
+        pool = _pools.get(path)
+        if pool is None or not path.exists():
+            if pool is not None:
+                pool.close()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            pool = _pools[path] = _ConnectionPool(path)
+    return pool
+
+
+@contextmanager
+def _connect() -> Iterator[sqlite3.Connection]:
+    """Borrow a pooled connection; commits on success, rolls back on error."""
+    pool = _pool_for(_db_path())
+    conn = pool.acquire()
+    try:
+        with conn:
+            yield conn
+    finally:
+        pool.release(conn)
+
+
+class _TTLCache:
+    """Thread-safe per-process cache with per-entry expiry (time.monotonic)."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: dict[Any, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def put(self, key: Any, value: Any, ttl_s: float) -> None:
+        if ttl_s <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                for k in [k for k, (exp, _) in self._entries.items() if exp <= now]:
+                    del self._entries[k]
+                if len(self._entries) >= self.max_entries:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = (now + ttl_s, value)
+
+    def pop(self, key: Any) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Validated users by (db, email) and sessions by (db, token): reruns skip the DB for up to the TTL.
+# Logout/revoke and role/status changes in this process drop entries at once; other processes
+# see such changes within the TTL.
+_user_cache = _TTLCache()
+_session_cache = _TTLCache()
+
+
+def _auth_cache_ttl_seconds() -> float:
+    raw = os.environ.get("COT_AUTH_CACHE_TTL_SECONDS", "30").strip()
+    try:
+        return max(0.0, min(float(raw), 600.0))
+    except Exception:
+        return 30.0
+
+
+def _invalidate_user(email: str) -> None:
+    """Drop cached state of a user whose role/status/sessions changed."""
+    _user_cache.pop((_db_path(), email))
+    # Session entries carry the user row; admin edits are rare, so drop them all
+    _session_cache.clear()
+
+
+# DB files whose schema was created by this process: the DDL runs once per path, not per rerun
+_initialized_dbs: set[Path] = set()
+_init_lock = threading.Lock()
 
 
 def init_auth_db() -> None:
+    """Create the auth tables once per process and DB path (again if the file was removed)."""
+    path = _db_path()
+    if path in _initialized_dbs and path.exists():
+        return
+    with _init_lock:
+        if path in _initialized_dbs and path.exists():
+            return
+        _create_auth_tables()
+        _initialized_dbs.add(path)
+
+
+def _create_auth_tables() -> None:
     with _connect() as conn:
         conn.execute(
             """
@@ -174,28 +358,144 @@ def _parse_hash(password_hash: str) -> tuple[int, bytes, bytes] | None:
         return None
 
 
+class HashPoolBusyError(RuntimeError):
+    """More password hashes in flight than the PBKDF2 pool admits."""
+
+
+def _pbkdf2_workers() -> int:
+    raw = os.environ.get("COT_PBKDF2_WORKERS", "").strip()
+    try:
+        return max(0, min(int(raw), 32))
+    except Exception:
+        # Leave cores for other sessions' reruns
+        return max(1, min(4, (os.cpu_count() or 2) // 2))
+
+
+_hash_executor: ThreadPoolExecutor | None = None
+_hash_slots: threading.BoundedSemaphore | None = None
+_hash_lock = threading.Lock()
+
+
+def _hash_pool() -> tuple[ThreadPoolExecutor, threading.BoundedSemaphore] | None:
+    """Process-wide PBKDF2 pool and its admission slots (None when hashing inline)."""
+    global _hash_executor, _hash_slots
+    if _hash_executor is None:
+        workers = _pbkdf2_workers()
+        if workers == 0:
+            return None
+        with _hash_lock:
+            if _hash_executor is None:
+                _hash_slots = threading.BoundedSemaphore(workers + PBKDF2_MAX_PENDING)
+                _hash_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pbkdf2")
+    return _hash_executor, _hash_slots
+
+
+def _pbkdf2(password: str, salt: bytes, iterations: int) -> bytes:
+    """
+    PBKDF2-SHA256 digest computed on the bounded hash pool.
+
+    hashlib releases the GIL while hashing, so a login burst uses at most the pool's threads
+    of CPU and other sessions' reruns keep running; the caller waits for its own digest.
+    Raises HashPoolBusyError when the pool's queue is full.
+    """
+    args = ("sha256", password.encode("utf-8"), salt, iterations)
+    pool = _hash_pool()
+    if pool is None:
+        return hashlib.pbkdf2_hmac(*args)
+    executor, slots = pool
+    if not slots.acquire(blocking=False):
+        raise HashPoolBusyError("password hashing queue is full")
+    try:
+        return executor.submit(hashlib.pbkdf2_hmac, *args).result()
+    finally:
+        slots.release()
+
+
 def verify_password(password: str, password_hash: str) -> bool:
     parsed = _parse_hash(password_hash)
     if parsed is None:
         return False
     iterations, salt, expected_digest = parsed
-    actual_digest = hashlib.pbkdf2_hmac(
-        "sha256",
-        password.encode("utf-8"),
-        salt,
-        iterations,
-    )
+    actual_digest = _pbkdf2(password, salt, iterations)
     return hmac.compare_digest(actual_digest, expected_digest)
 
 
-def hash_password(password: str, iterations: int = 210_000) -> str:
+def _needs_rehash(password_hash: str) -> bool:
+    parsed = _parse_hash(password_hash)
+    return parsed is not None and parsed[0] != PASSWORD_HASH_ITERATIONS
+
+
+def hash_password(password: str, iterations: int | None = None) -> str:
+    iterations = PASSWORD_HASH_ITERATIONS if iterations is None else iterations
     salt = os.urandom(16)
-    digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+    digest = _pbkdf2(password, salt, iterations)
     salt_b64 = base64.b64encode(salt).decode("ascii")
     digest_b64 = base64.b64encode(digest).decode("ascii")
     return f"pbkdf2_sha256${iterations}${salt_b64}${digest_b64}"
 
 
+class _LoginThrottle:
+    """Failed sign-in timestamps per key (email / client IP) in a sliding window."""
+
+    def __init__(self, window_s: float = LOGIN_THROTTLE_WINDOW_S) -> None:
+        self.window_s = window_s
+        self._failures: dict[tuple, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def _recent(self, key: tuple, now: float) -> deque[float]:
+        failures = self._failures.get(key)
+        if failures is None:
+            return deque()
+        while failures and failures[0] <= now - self.window_s:
+            failures.popleft()
+        if not failures:
+            del self._failures[key]
+        return failures
+
+    def retry_after(self, limits: dict[tuple, int]) -> float:
+        """Seconds until every key is under its limit (0 = allowed now)."""
+        now = time.monotonic()
+        wait = 0.0
+        with self._lock:
+            for key, limit in limits.items():
+                failures = self._recent(key, now)
+                if len(failures) >= limit:
+                    wait = max(wait, failures[len(failures) - limit] + self.window_s - now)
+        return wait
+
+    def record_failure(self, keys: list[tuple]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                self._failures.setdefault(key, deque()).append(now)
+
+    def reset(self, key: tuple) -> None:
+        with self._lock:
+            self._failures.pop(key, None)
+
+
+_login_throttle = _LoginThrottle()
+
+
+def _throttle_limits(email: str, client_ip: str | None) -> dict[tuple, int]:
+    db = _db_path()
+    limits = {("email", db, email): LOGIN_MAX_FAILURES_PER_EMAIL}
+    if client_ip:
+        limits[("ip", db, client_ip)] = LOGIN_MAX_FAILURES_PER_IP
+    return limits
+
+
+def _client_ip() -> str | None:
+    try:
+        ip = getattr(st.context, "ip_address", None)
+        if ip:
+            return str(ip)
+        forwarded = st.context.headers.get("X-Forwarded-For", "")
+        return forwarded.split(",")[0].strip() or None
+    except Exception:
+        return None
+
+
 def _upsert_admin_role_if_needed(email: str) -> None:
     admin_email = _admin_email()
     if not admin_email or email != admin_email:
@@ -211,11 +511,23 @@ def _upsert_admin_role_if_needed(email: str) -> None:
             (ROLE_ADMIN, STATUS_ACTIVE, _utc_now(), email),
         )
         conn.commit()
+    _invalidate_user(email)
 
 
 def _get_user_by_email(email: str) -> sqlite3.Row | None:
     with _connect() as conn:
-        row = conn.execute("SELECT * FROM users WHERE email = ?", (email,)).fetchone()
+        row = conn.execute(_SQL_USER_BY_EMAIL, (email,)).fetchone()
+    return row
+
+
+def _cached_user_by_email(email: str) -> sqlite3.Row | None:
+    """User row for the per-rerun status/role check (TTL cache; unknown users are not cached)."""
+    key = (_db_path(), email)
+    row = _user_cache.get(key)
+    if row is None:
+        row = _get_user_by_email(email)
+        if row is not None:
+            _user_cache.put(key, row, _auth_cache_ttl_seconds())
     return row
 
 
@@ -224,45 +536,34 @@ def _create_session_for_user(user_id: int) -> str:
     now = _utc_now()
     expires = _utc_after_days(_session_ttl_days())
     with _connect() as conn:
-        conn.execute(
-            """
-            INSERT INTO sessions (token, user_id, created_at_utc, last_seen_at_utc, expires_at_utc, revoked)
-            VALUES (?, ?, ?, ?, ?, 0)
-            """,
-            (token, user_id, now, now, expires),
-        )
+        conn.execute(_SQL_INSERT_SESSION, (token, user_id, now, now, expires))
         conn.commit()
     return token
 
 
 def _load_user_by_session_token(token: str) -> sqlite3.Row | None:
+    # A validated token is trusted for the cache TTL (last_seen is touched once per validation)
+    key = (_db_path(), token)
+    row = _session_cache.get(key)
+    if row is not None:
+        return row
     now = _utc_now()
     with _connect() as conn:
-        row = conn.execute(
-            """
-            SELECT u.*
-            FROM sessions s
-            JOIN users u ON u.id = s.user_id
-            WHERE s.token = ?
-              AND s.revoked = 0
-              AND s.expires_at_utc > ?
-            """,
-            (token, now),
-        ).fetchone()
+        row = conn.execute(_SQL_USER_BY_SESSION, (token, now)).fetchone()
         if row is not None:
-            conn.execute(
-                "UPDATE sessions SET last_seen_at_utc = ? WHERE token = ?",
-                (now, token),
-            )
+            conn.execute(_SQL_TOUCH_SESSION, (now, token))
             conn.commit()
+    if row is not None:
+        _session_cache.put(key, row, _auth_cache_ttl_seconds())
     return row
 
 
 def _revoke_session_token(token: str | None) -> None:
     if not token:
         return
+    _session_cache.pop((_db_path(), token))
     with _connect() as conn:
-        conn.execute("UPDATE sessions SET revoked = 1 WHERE token = ?", (token,))
+        conn.execute(_SQL_REVOKE_SESSION, (token,))
         conn.commit()
 
 
@@ -293,25 +594,37 @@ def register_local(email: str, password: str) -> tuple[bool, str]:
     role = ROLE_ADMIN if is_admin else ROLE_USER
     status = STATUS_ACTIVE if is_admin else STATUS_PENDING
 
+    try:
+        password_hash = hash_password(password)
+    except HashPoolBusyError:
+        return False, "Server is busy. Try again in a moment."
+
     with _connect() as conn:
         conn.execute(
             """
             INSERT INTO users (email, password_hash, role, status, auth_provider, created_at_utc, updated_at_utc)
             VALUES (?, ?, ?, ?, 'local', ?, ?)
             """,
-            (email_norm, hash_password(password), role, status, now, now),
+            (email_norm, password_hash, role, status, now, now),
         )
         conn.commit()
 
     return True, "Registration successful. You can sign in after admin approval." if status == STATUS_PENDING else "Registration successful."
 
 
-def authenticate_local(email: str, password: str) -> tuple[bool, str]:
+def authenticate_local(email: str, password: str, client_ip: str | None = None) -> tuple[bool, str]:
     init_auth_db()
     email_norm = _normalize_email(email)
-    user = _get_user_by_email(email_norm)
 
+    # Throttled before any hashing: repeated failures cost no PBKDF2 time
+    limits = _throttle_limits(email_norm, client_ip)
+    retry_after = _login_throttle.retry_after(limits)
+    if retry_after > 0:
+        return False, f"Too many failed sign-in attempts. Try again in {int(retry_after) + 1} s."
+
+    user = _get_user_by_email(email_norm)
     if user is None:
+        _login_throttle.record_failure(list(limits))
         return False, "Invalid email or password."
 
     _upsert_admin_role_if_needed(email_norm)
@@ -322,19 +635,34 @@ def authenticate_local(email: str, password: str) -> tuple[bool, str]:
     if (user["auth_provider"] or "local") not in {"local", "mixed"}:
         return False, "Use Google login for this account."
 
-    if not verify_password(password, str(user["password_hash"] or "")):
+    password_hash = str(user["password_hash"] or "")
+    try:
+        password_ok = verify_password(password, password_hash)
+    except HashPoolBusyError:
+        return False, "Server is busy. Try again in a moment."
+    if not password_ok:
+        _login_throttle.record_failure(list(limits))
         return False, "Invalid email or password."
+    _login_throttle.reset(("email", _db_path(), email_norm))
 
     status = (user["status"] or STATUS_PENDING).strip().lower()
     if status != STATUS_ACTIVE:
         return False, f"Account is {_status_label(status)}."
 
+    # Hashes made with another iteration count are replaced while the password is at hand
+    if _needs_rehash(password_hash):
+        try:
+            password_hash = hash_password(password)
+        except HashPoolBusyError:
+            pass
+
     with _connect() as conn:
         conn.execute(
-            "UPDATE users SET last_login_at_utc = ?, updated_at_utc = ? WHERE email = ?",
-            (_utc_now(), _utc_now(), email_norm),
+            "UPDATE users SET password_hash = ?, last_login_at_utc = ?, updated_at_utc = ? WHERE email = ?",
+            (password_hash, _utc_now(), _utc_now(), email_norm),
         )
         conn.commit()
+    _user_cache.pop((_db_path(), email_norm))
 
     _set_auth_session(user_email=email_norm, role=str(user["role"] or ROLE_USER), status=status, method="local")
     _remember_login(user)
@@ -440,6 +768,7 @@ def _sync_google_user(email: str) -> tuple[bool, str]:
                 (now, now, email_norm),
             )
             conn.commit()
+        _user_cache.pop((_db_path(), email_norm))
         user = _get_user_by_email(email_norm)
 
     if user is None:
@@ -455,6 +784,8 @@ def _sync_google_user(email: str) -> tuple[bool, str]:
 
 
 def _list_users_df() -> pd.DataFrame:
+    import pandas as pd
+
     init_auth_db()
     with _connect() as conn:
         rows = conn.execute(
@@ -485,6 +816,7 @@ def _update_user_role_status(email: str, role: str, status: str) -> tuple[bool,
         )
         conn.commit()
 
+    _invalidate_user(email_norm)
     if cur.rowcount == 0:
         return False, "User not found."
     return True, "User updated."
@@ -507,7 +839,7 @@ def _render_login_screen() -> None:
         email = st.text_input("Email", key="login_email")
         password = st.text_input("Password", key="login_password", type="password")
         if st.button("Sign In", key="login_submit", use_container_width=True):
-            ok, err = authenticate_local(email, password)
+            ok, err = authenticate_local(email, password, client_ip=_client_ip())
             if not ok:
                 st.error(err)
             else:
@@ -538,7 +870,11 @@ def require_authentication() -> bool:
     init_auth_db()
 
     google_email = _streamlit_google_email()
-    if google_email:
+    # Sync (user upsert + new session) once per login, not on every rerun of a signed-in session
+    already_synced = (
+        st.session_state.get("auth_method") == "google" and st.session_state.get("auth_email") == google_email
+    )
+    if google_email and not already_synced:
         ok, err = _sync_google_user(google_email)
         if not ok:
             st.error(err)
@@ -568,7 +904,7 @@ def require_authentication() -> bool:
 
     if st.session_state.get("auth_email"):
         # Enforce active status on every run in case admin changed status.
-        current_user = _get_user_by_email(_normalize_email(st.session_state.get("auth_email", "")))
+        current_user = _cached_user_by_email(_normalize_email(st.session_state.get("auth_email", "")))
         if current_user is None:
             _revoke_session_token(st.session_state.get("auth_token"))
             _clear_query_param_auth_token()
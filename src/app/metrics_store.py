@@ -0,0 +1,105 @@
+"""Process-wide read-only metrics store with per-market slice views for Streamlit pages."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from src.common.market_index import MarketIndex, build_market_index, range_cutoff
+
+
+@dataclass(frozen=True)
+class MetricsStore:
+    """
+    metrics_weekly sorted by (market_key, report_date), shared by every session.
+
+    Held by st.cache_resource, so reruns get this object itself rather than a
+    deserialized copy. `market()` / `market_range()` return iloc slices of the
+    shared frame (no per-rerun filtering or copying of the full table); callers
+    must treat all returned frames as read-only and copy before assigning.
+    """
+
+    index: MarketIndex
+    markets: list[str]
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        return self.index.frame
+
+    @property
+    def empty(self) -> bool:
+        return self.index.frame.empty
+
+    def market(self, market_key: str) -> pd.DataFrame:
+        """All rows of one market sorted by report_date (empty if unknown)."""
+        rows = self.index.market_rows(str(market_key))
+        return rows if rows is not None else self.index.frame.iloc[0:0]
+
+    def market_range(self, market_key: str, range_code: str) -> pd.DataFrame:
+        """Rows of one market within range_code (4W/12W/YTD/1Y/ALL), missing dates excluded."""
+        rows = self.index.range_rows(str(market_key), lambda latest: range_cutoff(latest, range_code))
+        return rows if rows is not None else self.index.frame.iloc[0:0]
+
+    def project(self, columns: Iterable[str]) -> MetricsStore:
+        """
+        Store over a subset of columns (frame order) backed by this store's arrays.
+
+        Columns are taken one at a time, so no data is copied (a multi-column
+        selection would copy whole blocks); the market row ranges are shared.
+        """
+        wanted = set(columns)
+        frame = pd.DataFrame({c: self.frame[c] for c in self.frame.columns if c in wanted}, copy=False)
+        return MetricsStore(index=replace(self.index, frame=frame), markets=self.markets)
+
+
+def build_metrics_store(metrics: pd.DataFrame) -> MetricsStore:
+    """Sort once and index market row ranges (market_id is used if market_key is absent)."""
+    if "market_key" not in metrics.columns and "market_id" in metrics.columns:
+        metrics = metrics.assign(market_key=metrics["market_id"])
+    if "market_key" not in metrics.columns or "report_date" not in metrics.columns:
+        empty = metrics.iloc[0:0]
+        return MetricsStore(
+            index=MarketIndex(frame=empty, ranges={}, dates=np.array([], dtype="datetime64[ns]")),
+            markets=[],
+        )
+    markets = sorted(metrics["market_key"].dropna().astype(str).unique().tolist())
+    return MetricsStore(index=build_market_index(metrics), markets=markets)
+
+
+def build_metric_pivot(metrics: pd.DataFrame, metric: str) -> pd.DataFrame:
+    """
+    report_date x market_key pivot of one metric (NaN where a market has no row).
+
+    Vectorized: rows are scattered into a dense (dates x markets) array by their
+    factorized date and market codes; no per-market filtering or groupby.
+    """
+    key_col = "market_key" if "market_key" in metrics.columns else "market_id"
+    if metric not in metrics.columns or key_col not in metrics.columns or "report_date" not in metrics.columns:
+        return pd.DataFrame(index=pd.DatetimeIndex([], name="report_date"), columns=pd.Index([], name="market_key"))
+    dates = pd.to_datetime(metrics["report_date"], errors="coerce")
+    keys = metrics[key_col]
+    keep = (dates.notna() & keys.notna()).to_numpy()
+    values = pd.to_numeric(metrics[metric], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)[keep]
+
+    date_codes, date_index = pd.factorize(dates[keep], sort=True)
+    market_codes, market_index = pd.factorize(keys[keep].astype(str), sort=True)
+    grid = np.full((len(date_index), len(market_index)), np.nan)
+    grid[date_codes, market_codes] = values
+    return pd.DataFrame(
+        grid,
+        index=pd.DatetimeIndex(date_index, name="report_date"),
+        columns=pd.Index(market_index, name="market_key"),
+    )
+
+
+def pivot_range(pivot: pd.DataFrame, range_code: str) -> pd.DataFrame:
+    """Rows of a metric pivot within range_code (4W/12W/YTD/1Y/ALL) of its latest report_date."""
+    if pivot.empty:
+        return pivot
+    cutoff = range_cutoff(pivot.index[-1], range_code)
+    if cutoff is None:
+        return pivot
+    return pivot.iloc[pivot.index.searchsorted(cutoff):]
@@ -5,35 +5,154 @@ from __future__ import annotations
 from pathlib import Path
 
 import pandas as pd
+import pyarrow.parquet as pq
 import streamlit as st
 
+from src.app.metrics_store import MetricsStore, build_metric_pivot, build_metrics_store, pivot_range
+from src.app.styles import css_bundle
 from src.common.paths import ProjectPaths
-from src.compute.build_market_radar import build_market_radar_latest
+from src.common.view_models import MARKET_VIEW_FILE, build_market_view_weekly, market_view_record
 
 # _terminal_ui.py -> pages -> app -> src -> <repo_root>
 REPO_ROOT = Path(__file__).resolve().parents[3]
 
 
-@st.cache_data
-def load_radar_latest(path_str: str, mtime: float) -> pd.DataFrame:
-    df = pd.read_parquet(path_str)
+# Columns the loaders always add to a page's manifest: row keys and signal_state inputs
+RADAR_BASE_COLUMNS = ("market_id", "report_date", "cot_traffic_signal", "net_z_52w_funds", "oi_risk_level")
+METRICS_BASE_COLUMNS = ("market_key", "market_id", "report_date")
+
+# Radar columns the Dashboard and Signals tables read (both render the same radar fields)
+RADAR_TABLE_COLUMNS = (
+    "category",
+    "hot_score",
+    "conflict_level",
+    "open_interest_chg_1w_pct",
+)
+
+
+def fragment(fn):
+    """
+    Run `fn` as a Streamlit fragment: its own widgets rerun only this block, not the page.
+
+    Uses st.fragment (Streamlit >= 1.37) or st.experimental_fragment (1.33-1.36); on older
+    versions the block is a plain call and a widget change reruns the whole script.
+    Fragment reruns reuse the arguments of the last full run, so pass shared read-only
+    frames (store slices, view records) instead of reloading inside the block.
+    """
+    decorator = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    return decorator(fn) if decorator is not None else fn
+
+
+def _projection(path_str: str, columns: tuple[str, ...] | None, base: tuple[str, ...]) -> list[str] | None:
+    """Manifest + base columns present in the file, in file order (None = read everything)."""
+    if columns is None:
+        return None
+    wanted = set(columns) | set(base)
+    return [c for c in pq.read_schema(path_str).names if c in wanted]
+
+
+# cache_resource: every rerun/session shares one parsed frame (no pickle round-trip, no copy).
+# Returned frames are read-only; copy before assigning columns. Radar entries are keyed by
+# (path, mtime, columns), so each page projection is cached once per file generation.
+@st.cache_resource(max_entries=4, show_spinner=False)
+def load_radar_latest(path_str: str, mtime: float, columns: tuple[str, ...] | None = None) -> pd.DataFrame:
+    df = pd.read_parquet(path_str, columns=_projection(path_str, columns, RADAR_BASE_COLUMNS))
     if df.empty:
         return df
     if "report_date" in df.columns:
-        df = df.copy()
         df["report_date"] = pd.to_datetime(df["report_date"], errors="coerce")
         latest = df["report_date"].max()
         df = df[df["report_date"] == latest].copy()
+    df["signal_state"] = df.apply(signal_state_from_row, axis=1)
     return df
 
 
-@st.cache_data
-def load_metrics(path_str: str, mtime: float) -> pd.DataFrame:
+# One metrics store per file generation: page manifests and the compute fallbacks share its arrays
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _load_full_metrics_store(path_str: str, mtime: float) -> MetricsStore:
     df = pd.read_parquet(path_str)
     if "report_date" in df.columns:
-        df = df.copy()
         df["report_date"] = pd.to_datetime(df["report_date"], errors="coerce")
-    return df
+    return build_metrics_store(df)
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def load_metrics_store(path_str: str, mtime: float, columns: tuple[str, ...] | None = None) -> MetricsStore:
+    """The generation's metrics store, or a column view of it (manifest + base columns, no copy)."""
+    store = _load_full_metrics_store(path_str, mtime)
+    return store if columns is None else store.project((*columns, *METRICS_BASE_COLUMNS))
+
+
+def load_metrics(path_str: str, mtime: float) -> pd.DataFrame:
+    """Full metrics frame from the shared store (read-only)."""
+    return load_metrics_store(path_str, mtime).frame
+
+
+# Comparison pivots: one projected read (keys, report_date, metric) per metric; ranges are
+# cached row slices of it. Read-only like the store frames.
+@st.cache_resource(max_entries=32, show_spinner=False)
+def load_metric_pivot(path_str: str, mtime: float, metric: str, range_code: str = "ALL") -> pd.DataFrame:
+    """report_date x market_key pivot of one metrics_weekly column over range_code."""
+    if range_code != "ALL":
+        return pivot_range(load_metric_pivot(path_str, mtime, metric, "ALL"), range_code)
+    df = pd.read_parquet(path_str, columns=_projection(path_str, (metric,), METRICS_BASE_COLUMNS))
+    return build_metric_pivot(df, metric)
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def load_metrics_columns(path_str: str, mtime: float) -> tuple[str, ...]:
+    """Column names of metrics_weekly (parquet schema only)."""
+    return tuple(pq.read_schema(path_str).names)
+
+
+# One market's view records per entry: a page render looks up a single row
+@st.cache_resource(max_entries=64, show_spinner=False)
+def load_market_views(path_str: str, mtime: float, market_key: str) -> pd.DataFrame:
+    """View records of one market sorted by report_date (row groups of other markets are skipped)."""
+    return pd.read_parquet(path_str, filters=[("market_key", "==", market_key)])
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def build_market_views(path_str: str, mtime: float, market_key: str) -> pd.DataFrame:
+    """View records of one market built from metrics_weekly (compute outputs without the view artifact)."""
+    return build_market_view_weekly(load_metrics_store(path_str, mtime).market(market_key))
+
+
+def load_market_views_with_fallback(metrics_path: Path, market_key: str) -> tuple[pd.DataFrame, str]:
+    """Load the market's view records; if the artifact is missing, build them from metrics_weekly."""
+    views_path = metrics_path.with_name(MARKET_VIEW_FILE)
+    if views_path.exists():
+        return load_market_views(str(views_path), views_path.stat().st_mtime, str(market_key)), "views"
+    if metrics_path.exists():
+        return build_market_views(str(metrics_path), metrics_path.stat().st_mtime, str(market_key)), "metrics_fallback"
+    return pd.DataFrame(), "missing_all"
+
+
+def view_record(views: pd.DataFrame, report_date: pd.Timestamp | None = None) -> dict | None:
+    """The view record for report_date (latest if None), or None if there is none."""
+    if views.empty:
+        return None
+    if report_date is None:
+        return views.iloc[-1].to_dict()
+    match = views.index[views["report_date"] == pd.Timestamp(report_date)]
+    return views.loc[match[-1]].to_dict() if len(match) else None
+
+
+def load_market_view(metrics_path: Path, market_key: str, report_date: pd.Timestamp) -> dict:
+    """
+    The market's view record for report_date.
+
+    If the artifact predates metrics_weekly (no record for that week), the record is
+    built from the full metrics row: page stores are projected to their manifests and
+    lack the extremes/moves inputs.
+    """
+    views, _ = load_market_views_with_fallback(metrics_path, market_key)
+    view = view_record(views, report_date)
+    if view is not None:
+        return view
+    rows = load_metrics_store(str(metrics_path), metrics_path.stat().st_mtime).market(market_key)
+    week = rows[rows["report_date"] == pd.Timestamp(report_date)]
+    return market_view_record(week.iloc[-1].to_dict() if len(week) else {"market_key": market_key})
 
 
 def get_compute_paths() -> tuple[Path, Path]:
@@ -41,10 +160,14 @@ def get_compute_paths() -> tuple[Path, Path]:
     return paths.data / "compute" / "market_radar_latest.parquet", paths.data / "compute" / "metrics_weekly.parquet"
 
 
-def load_radar_with_fallback(radar_path: Path, metrics_path: Path) -> tuple[pd.DataFrame, str]:
-    """Load radar parquet; if missing, build in-memory from metrics_weekly."""
+def load_radar_with_fallback(
+    radar_path: Path,
+    metrics_path: Path,
+    columns: tuple[str, ...] | None = None,
+) -> tuple[pd.DataFrame, str]:
+    """Load radar parquet (projected to the page's columns); if missing, build in-memory from metrics_weekly."""
     if radar_path.exists():
-        df = load_radar_latest(str(radar_path), radar_path.stat().st_mtime)
+        df = load_radar_latest(str(radar_path), radar_path.stat().st_mtime, columns)
         return df, "radar"
 
     if metrics_path.exists():
@@ -62,11 +185,15 @@ def load_radar_with_fallback(radar_path: Path, metrics_path: Path) -> tuple[pd.D
             )
             market_name_map = dict(zip(names["market_key"].astype(str), names["market_name"].astype(str)))
 
+        from src.compute.build_market_radar import build_market_radar_latest  # compute-only fallback path
+
         radar = build_market_radar_latest(metrics, market_name_map)
         if not radar.empty and "report_date" in radar.columns:
             radar["report_date"] = pd.to_datetime(radar["report_date"], errors="coerce")
             latest = radar["report_date"].max()
             radar = radar[radar["report_date"] == latest].copy()
+        if not radar.empty:
+            radar["signal_state"] = radar.apply(signal_state_from_row, axis=1)
         return radar, "metrics_fallback"
 
     return pd.DataFrame(), "missing_all"
@@ -85,82 +212,88 @@ def signal_state_from_row(row: pd.Series) -> str:
     return "neutral"
 
 
+# Terminal theme, built once at import (one compact <style> element per page run)
+TERMINAL_THEME_CSS = css_bundle(
+    """
+    :root {
+      --cot-bg: #0a111b;
+      --cot-panel: #101b2a;
+      --cot-border: #233247;
+      --cot-text: #e5edf8;
+      --cot-dim: #8ea0b8;
+      --cot-green: #22c55e;
+      --cot-red: #ef4444;
+      --cot-amber: #f59e0b;
+      --cot-cyan: #38bdf8;
+    }
+
+    .stApp, [data-testid="stAppViewContainer"], [data-testid="stHeader"] {
+      background: var(--cot-bg);
+      color: var(--cot-text);
+    }
+
+    [data-testid="stSidebar"] {
+      background: #0f1724;
+      border-right: 1px solid var(--cot-border);
+    }
+
+    .cot-panel {
+      background: var(--cot-panel);
+      border: 1px solid var(--cot-border);
+      border-radius: 10px;
+      padding: 12px 14px;
+    }
+
+    .cot-kpi-label {
+      color: var(--cot-dim);
+      font-size: 12px;
+      margin-bottom: 4px;
+    }
+
+    .cot-kpi-value {
+      font-family: ui-monospace, SFMono-Regular, Menlo, Consolas, monospace;
+      font-size: 30px;
+      line-height: 1;
+      font-weight: 700;
+    }
+
+    .cot-muted { color: var(--cot-dim); }
+
+    .cot-pill {
+      display: inline-block;
+      padding: 2px 8px;
+      border-radius: 999px;
+      background: #162235;
+      border: 1px solid #253752;
+      font-size: 11px;
+      color: var(--cot-dim);
+      margin-right: 6px;
+    }
+
+    .cot-grid-gap { margin-top: 6px; margin-bottom: 6px; }
+
+    .stDataFrame, [data-testid="stDataFrame"] {
+      border: 1px solid var(--cot-border);
+      border-radius: 10px;
+      overflow: hidden;
+    }
+    """
+)
+
+
 def apply_terminal_theme() -> None:
-    st.markdown(
-        """
-        <style>
-        :root {
-          --cot-bg: #0a111b;
-          --cot-panel: #101b2a;
-          --cot-border: #233247;
-          --cot-text: #e5edf8;
-          --cot-dim: #8ea0b8;
-          --cot-green: #22c55e;
-          --cot-red: #ef4444;
-          --cot-amber: #f59e0b;
-          --cot-cyan: #38bdf8;
-        }
-
-        .stApp, [data-testid="stAppViewContainer"], [data-testid="stHeader"] {
-          background: var(--cot-bg);
-          color: var(--cot-text);
-        }
-
-        [data-testid="stSidebar"] {
-          background: #0f1724;
-          border-right: 1px solid var(--cot-border);
-        }
-
-        .cot-panel {
-          background: var(--cot-panel);
-          border: 1px solid var(--cot-border);
-          border-radius: 10px;
-          padding: 12px 14px;
-        }
-
-        .cot-kpi-label {
-          color: var(--cot-dim);
-          font-size: 12px;
-          margin-bottom: 4px;
-        }
-
-        .cot-kpi-value {
-          font-family: ui-monospace, SFMono-Regular, Menlo, Consolas, monospace;
-          font-size: 30px;
-          line-height: 1;
-          font-weight: 700;
-        }
-
-        .cot-muted { color: var(--cot-dim); }
-
-        .cot-pill {
-          display: inline-block;
-          padding: 2px 8px;
-          border-radius: 999px;
-          background: #162235;
-          border: 1px solid #253752;
-          font-size: 11px;
-          color: var(--cot-dim);
-          margin-right: 6px;
-        }
-
-        .cot-grid-gap { margin-top: 6px; margin-bottom: 6px; }
-
-        .stDataFrame, [data-testid="stDataFrame"] {
-          border: 1px solid var(--cot-border);
-          border-radius: 10px;
-          overflow: hidden;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(TERMINAL_THEME_CSS, unsafe_allow_html=True)
 
 
 def render_nav(current_page: str) -> None:
     with st.sidebar:
         st.markdown("### Navigation")
-        for label, key in [("Dashboard", "market"), ("Market Detail", "overview"), ("Signals", "signals")]:
+        for label, key in [
+            ("Dashboard", "market"),
+            ("Market Detail", "overview"),
+            ("Compare", "compare"),
+            ("Signals", "signals"),
+        ]:
             if st.button(
                 label,
                 type="primary" if current_page == key else "secondary",
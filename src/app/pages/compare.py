@@ -0,0 +1,104 @@
+"""Market comparison page: N markets x M metrics over a date range (Streamlit terminal UI)."""
+
+from __future__ import annotations
+
+import pandas as pd
+import streamlit as st
+
+from src.app.pages._terminal_ui import (
+    apply_terminal_theme,
+    get_compute_paths,
+    load_metric_pivot,
+    load_metrics_columns,
+    render_nav,
+)
+from src.common.downsample import DEFAULT_CHART_WIDTH_PX, downsample_frame
+
+
+RANGE_OPTIONS = ["4W", "12W", "YTD", "1Y", "ALL"]
+DEFAULT_MARKETS = 4
+DEFAULT_METRICS = ("nc_net", "net_z_52w_funds")
+
+# Comparable metrics_weekly columns (each is read on its own as a report_date x market pivot)
+COMPARE_METRICS = {
+    "nc_net": "Funds Net",
+    "comm_net": "Commercials Net",
+    "nr_net": "Non-Reported Net",
+    "net_z_52w_funds": "Z-score (Funds)",
+    "net_z_52w_commercials": "Z-score (Commercials)",
+    "nc_net_pos_5y": "Funds Net Position (5Y)",
+    "comm_net_pos_5y": "Commercials Net Position (5Y)",
+    "open_interest": "Open Interest",
+    "open_interest_chg_1w_pct": "OI Delta 1W %",
+}
+
+
+def render() -> None:
+    apply_terminal_theme()
+    render_nav("compare")
+
+    _, metrics_path = get_compute_paths()
+    if not metrics_path.exists():
+        st.error("metrics_weekly.parquet not found")
+        return
+
+    path_str, mtime = str(metrics_path), metrics_path.stat().st_mtime
+    file_columns = load_metrics_columns(path_str, mtime)
+    metric_options = [m for m in COMPARE_METRICS if m in file_columns]
+    if not metric_options:
+        st.warning("No comparable metrics in metrics_weekly.parquet")
+        return
+
+    # Market list from a cached pivot (its columns), no scan of the metrics frame
+    markets = list(load_metric_pivot(path_str, mtime, metric_options[0]).columns)
+    if not markets:
+        st.warning("No market keys available in metrics_weekly.parquet")
+        return
+
+    st.markdown("## Compare")
+
+    selected_asset = st.session_state.get("selected_asset")
+    default_markets = [selected_asset] if selected_asset in markets else []
+    default_markets += [m for m in markets if m not in default_markets][: DEFAULT_MARKETS - len(default_markets)]
+    range_default = st.session_state.get("cmp_range", "1Y")
+    if range_default not in RANGE_OPTIONS:
+        range_default = "1Y"
+
+    c1, c2, c3 = st.columns([3, 3, 1])
+    with c1:
+        selected_markets = st.multiselect("Markets", markets, default=default_markets, key="cmp_markets")
+    with c2:
+        selected_metrics = st.multiselect(
+            "Metrics",
+            metric_options,
+            default=[m for m in DEFAULT_METRICS if m in metric_options],
+            format_func=COMPARE_METRICS.get,
+            key="cmp_metrics",
+        )
+    with c3:
+        selected_range = st.selectbox("Range", RANGE_OPTIONS, index=RANGE_OPTIONS.index(range_default))
+    st.session_state["cmp_range"] = selected_range
+
+    if not selected_markets or not selected_metrics:
+        st.info("Select at least one market and one metric.")
+        return
+
+    # One cached pivot per (metric, range); markets are a column selection of it
+    panels = {m: load_metric_pivot(path_str, mtime, m, selected_range)[selected_markets] for m in selected_metrics}
+
+    as_of = max((p.index[-1] for p in panels.values() if not p.empty), default=None)
+    st.caption(f"Report date: {as_of.strftime('%Y-%m-%d') if as_of is not None else 'N/A'}")
+
+    # Latest value of each market in the range (last non-missing week)
+    latest = {COMPARE_METRICS[m]: p.ffill().iloc[-1] for m, p in panels.items() if not p.empty}
+    grid = pd.DataFrame(latest, index=pd.Index(selected_markets, name="Market"))
+    st.markdown("### Latest")
+    st.dataframe(grid.reset_index(), use_container_width=True, hide_index=True)
+
+    for metric, panel in panels.items():
+        st.markdown(f"### {COMPARE_METRICS[metric]}")
+        if panel.empty:
+            st.info("No data in the selected range.")
+            continue
+        chart_df = downsample_frame(panel.reset_index(), DEFAULT_CHART_WIDTH_PX).set_index("report_date")
+        st.line_chart(chart_df, use_container_width=True, height=260)
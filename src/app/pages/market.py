@@ -6,11 +6,11 @@ import pandas as pd
 import streamlit as st
 
 from src.app.pages._terminal_ui import (
+    RADAR_TABLE_COLUMNS,
     apply_terminal_theme,
     get_compute_paths,
     load_radar_with_fallback,
     render_nav,
-    signal_state_from_row,
 )
 
 
@@ -29,16 +29,13 @@ def render() -> None:
     render_nav("market")
 
     radar_path, metrics_path = get_compute_paths()
-    df, source = load_radar_with_fallback(radar_path, metrics_path)
+    df, source = load_radar_with_fallback(radar_path, metrics_path, RADAR_TABLE_COLUMNS)
     if df.empty:
         st.warning("No dashboard data available. Run compute pipeline to generate data files.")
         return
     if source == "metrics_fallback":
         st.info("Using fallback data from metrics_weekly.parquet (market_radar_latest.parquet is missing).")
 
-    df = df.copy()
-    df["signal_state"] = df.apply(signal_state_from_row, axis=1)
-
     categories = sorted(df["category"].dropna().astype(str).unique().tolist()) if "category" in df.columns else []
 
     st.markdown("## Dashboard")
@@ -5,6 +5,8 @@ from src.app.pages.overview_sections.common import (
     fmt_delta,
     fmt_delta_colored,
     create_sparkline,
+    cached_sparkline,
+    sparkline_for,
     get_13w_net_data,
     render_heatline_html,
     inject_shared_css,
@@ -22,6 +24,8 @@ __all__ = [
     "fmt_delta",
     "fmt_delta_colored",
     "create_sparkline",
+    "cached_sparkline",
+    "sparkline_for",
     "get_13w_net_data",
     "render_heatline_html",
     "inject_shared_css",
@@ -10,6 +10,26 @@ from src.app.pages.overview_sections.common import (
     fmt_delta_colored,
     inject_charts_css,
 )
+from src.common.downsample import DEFAULT_CHART_WIDTH_PX, downsample_frame
+
+CHART_GROUPS = {
+    "Funds": "nc",
+    "Commercials": "comm",
+    "Non-Reported": "nr",
+}
+CHART_METRICS = {
+    "Net": "net",
+    "Total": "total",
+    "Long": "long",
+    "Short": "short",
+}
+# metrics_weekly columns render_charts reads (pages add them to their column manifest)
+CHART_COLUMNS = tuple(
+    f"{prefix}_{metric}{suffix}"
+    for prefix in CHART_GROUPS.values()
+    for metric in CHART_METRICS.values()
+    for suffix in ("", "_ma_13w", "_pos_5y", "_chg_1w", "_move_pct_all")
+)
 
 
 def render_charts(df: pd.DataFrame | None = None, row: dict | None = None, **kwargs) -> None:
@@ -24,9 +44,6 @@ def render_charts(df: pd.DataFrame | None = None, row: dict | None = None, **kwa
 
     inject_charts_css()
 
-    df_chart = df.sort_values("report_date").reset_index(drop=True).copy()
-    df_chart["report_date"] = pd.to_datetime(df_chart["report_date"])
-
     col_group, col_metric, col_range = st.columns(3)
 
     with col_group:
@@ -53,20 +70,8 @@ def render_charts(df: pd.DataFrame | None = None, row: dict | None = None, **kwa
             horizontal=True,
         )
 
-    group_map = {
-        "Funds": "nc",
-        "Commercials": "comm",
-        "Non-Reported": "nr",
-    }
-    prefix = group_map.get(group, "nc")
-
-    metric_map = {
-        "Net": "net",
-        "Total": "total",
-        "Long": "long",
-        "Short": "short",
-    }
-    metric_suffix = metric_map.get(metric, "net")
+    prefix = CHART_GROUPS.get(group, "nc")
+    metric_suffix = CHART_METRICS.get(metric, "net")
 
     main_col = f"{prefix}_{metric_suffix}"
     ma_col = f"{prefix}_{metric_suffix}_ma_13w"
@@ -74,28 +79,32 @@ def render_charts(df: pd.DataFrame | None = None, row: dict | None = None, **kwa
     chg_1w_col = f"{prefix}_{metric_suffix}_chg_1w"
     move_pct_col = f"{prefix}_{metric_suffix}_move_pct_all"
 
-    if main_col not in df_chart.columns:
+    if main_col not in df.columns:
         st.error(f"Missing column '{main_col}' in data.")
         return
 
+    # Only the plotted columns are sliced (df may be a shared read-only store slice)
+    df_chart = df[[c for c in ("report_date", main_col, ma_col) if c in df.columns]]
+    if not df_chart["report_date"].is_monotonic_increasing:
+        df_chart = df_chart.sort_values("report_date", kind="stable")
+    dates = pd.to_datetime(df_chart["report_date"])
+
     current_date = pd.to_datetime(row.get("report_date"))
     if pd.notna(current_date):
-        df_chart = df_chart[df_chart["report_date"] <= current_date].copy()
-
-    if range_option == "1Y" and pd.notna(current_date):
-        start_date = current_date - pd.DateOffset(years=1)
-        df_chart = df_chart[df_chart["report_date"] >= start_date].copy()
-    elif range_option == "5Y" and pd.notna(current_date):
-        start_date = current_date - pd.DateOffset(years=5)
-        df_chart = df_chart[df_chart["report_date"] >= start_date].copy()
+        in_range = dates <= current_date
+        if range_option == "1Y":
+            in_range &= dates >= current_date - pd.DateOffset(years=1)
+        elif range_option == "5Y":
+            in_range &= dates >= current_date - pd.DateOffset(years=5)
+        df_chart = df_chart[in_range.to_numpy()]
+        dates = dates[in_range.to_numpy()]
 
-    chart_data = df_chart[["report_date", main_col]].copy()
-    chart_data.columns = ["report_date", metric]
+    chart_data = pd.DataFrame({"report_date": dates.to_numpy(), metric: df_chart[main_col].to_numpy()})
 
     if ma_col in df_chart.columns:
-        chart_data[f"{metric} (13W avg)"] = df_chart[ma_col].values
+        chart_data[f"{metric} (13W avg)"] = df_chart[ma_col].to_numpy()
 
-    chart_data_indexed = chart_data.set_index("report_date")
+    chart_data_indexed = downsample_frame(chart_data, DEFAULT_CHART_WIDTH_PX).set_index("report_date")
     st.line_chart(chart_data_indexed, use_container_width=True)
 
     markers = []
@@ -2,41 +2,14 @@
 
 from __future__ import annotations
 
-import pandas as pd
 import streamlit as st
 
 from src.app.pages.overview_sections.common import (
+    heatline_template,
     inject_extremes_css,
     inject_shared_css,
-    render_heatline_html,
 )
-
-
-def get_extreme_values(row: dict, extremes_mode: str, group_prefix: str, metric: str) -> tuple:
-    """
-    Read min, max, pos values from compute columns (no calculation).
-    Returns (min, max, pos, current).
-    """
-    if extremes_mode == "All-time":
-        min_suffix = "_min_all"
-        max_suffix = "_max_all"
-        pos_suffix = "_pos_all"
-    else:
-        min_suffix = "_min_5y"
-        max_suffix = "_max_5y"
-        pos_suffix = "_pos_5y"
-
-    min_col = f"{group_prefix}{metric}{min_suffix}"
-    max_col = f"{group_prefix}{metric}{max_suffix}"
-    pos_col = f"{group_prefix}{metric}{pos_suffix}"
-    current_col = f"{group_prefix}{metric}"
-
-    min_val = row.get(min_col)
-    max_val = row.get(max_col)
-    pos_val = row.get(pos_col)
-    current_val = row.get(current_col)
-
-    return min_val, max_val, pos_val, current_val
+from src.common.view_models import market_view_record
 
 
 def render_extremes_header() -> None:
@@ -61,107 +34,41 @@ def render_extremes_header() -> None:
     )
 
 
-def render_extremes(row: dict, extremes_mode: str) -> None:
-    """Render Positioning Extremes section (cards only, no header/toggle)."""
+def render_extremes(row: dict | None, extremes_mode: str, view: dict | None = None) -> None:
+    """
+    Render Positioning Extremes section (cards only, no header/toggle).
+
+    Heatlines are templated from `view` (a market_view_weekly record); without
+    it the record is built from `row`.
+    """
     inject_extremes_css()
+    if view is None:
+        view = market_view_record(row or {})
+    mode = "all" if extremes_mode == "All-time" else "5y"
 
     card_ext_funds, card_ext_comm, card_ext_nr = st.columns(3)
-
-    with card_ext_funds:
-        min_val, max_val, pos_val, current_val = get_extreme_values(row, extremes_mode, "nc_", "long")
-        min_val_short, max_val_short, pos_val_short, current_val_short = get_extreme_values(row, extremes_mode, "nc_", "short")
-        min_val_total, max_val_total, pos_val_total, current_val_total = get_extreme_values(row, extremes_mode, "nc_", "total")
-        min_val_net, max_val_net, pos_val_net, current_val_net = get_extreme_values(row, extremes_mode, "nc_", "net")
-
-        st.markdown(
-            f"""
-            <div class="position-card">
-                <div class="position-card-title">Funds</div>
-                <div class="position-extremes-rows">
-                    <div class="extremes-row">
-                        <span class="extremes-label">Long:</span>
-                        {render_heatline_html(min_val, max_val, current_val, pos_val, is_delta=False)}
-                    </div>
-                    <div class="extremes-row">
-                        <span class="extremes-label">Short:</span>
-                        {render_heatline_html(min_val_short, max_val_short, current_val_short, pos_val_short, is_delta=False)}
-                    </div>
-                    <div class="extremes-row">
-                        <span class="extremes-label">Total:</span>
-                        {render_heatline_html(min_val_total, max_val_total, current_val_total, pos_val_total, is_delta=False)}
-                    </div>
-                    <div class="extremes-row">
-                        <span class="extremes-label">Net:</span>
-                        {render_heatline_html(min_val_net, max_val_net, current_val_net, pos_val_net, is_delta=False)}
-                    </div>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    with card_ext_comm:
-        min_val, max_val, pos_val, current_val = get_extreme_values(row, extremes_mode, "comm_", "long")
-        min_val_short, max_val_short, pos_val_short, current_val_short = get_extreme_values(row, extremes_mode, "comm_", "short")
-        min_val_total, max_val_total, pos_val_total, current_val_total = get_extreme_values(row, extremes_mode, "comm_", "total")
-        min_val_net, max_val_net, pos_val_net, current_val_net = get_extreme_values(row, extremes_mode, "comm_", "net")
-
-        st.markdown(
+    cards = (
+        (card_ext_funds, "Funds", "nc"),
+        (card_ext_comm, "Commercials", "comm"),
+        (card_ext_nr, "Non-Reported", "nr"),
+    )
+    for card, title, group in cards:
+        rows = "".join(
             f"""
-            <div class="position-card">
-                <div class="position-card-title">Commercials</div>
-                <div class="position-extremes-rows">
-                    <div class="extremes-row">
-                        <span class="extremes-label">Long:</span>
-                        {render_heatline_html(min_val, max_val, current_val, pos_val, is_delta=False)}
-                    </div>
-                    <div class="extremes-row">
-                        <span class="extremes-label">Short:</span>
-                        {render_heatline_html(min_val_short, max_val_short, current_val_short, pos_val_short, is_delta=False)}
-                    </div>
                     <div class="extremes-row">
-                        <span class="extremes-label">Total:</span>
-                        {render_heatline_html(min_val_total, max_val_total, current_val_total, pos_val_total, is_delta=False)}
-                    </div>
-                    <div class="extremes-row">
-                        <span class="extremes-label">Net:</span>
-                        {render_heatline_html(min_val_net, max_val_net, current_val_net, pos_val_net, is_delta=False)}
-                    </div>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
+                        <span class="extremes-label">{label}:</span>
+                        {heatline_template(view[f"{group}_{metric}_ext_{mode}_pos"], view[f"{group}_{metric}_ext_{mode}_tip"])}
+                    </div>"""
+            for label, metric in (("Long", "long"), ("Short", "short"), ("Total", "total"), ("Net", "net"))
         )
-
-    with card_ext_nr:
-        min_val, max_val, pos_val, current_val = get_extreme_values(row, extremes_mode, "nr_", "long")
-        min_val_short, max_val_short, pos_val_short, current_val_short = get_extreme_values(row, extremes_mode, "nr_", "short")
-        min_val_total, max_val_total, pos_val_total, current_val_total = get_extreme_values(row, extremes_mode, "nr_", "total")
-        min_val_net, max_val_net, pos_val_net, current_val_net = get_extreme_values(row, extremes_mode, "nr_", "net")
-
-        st.markdown(
-            f"""
+        with card:
+            st.markdown(
+                f"""
             <div class="position-card">
-                <div class="position-card-title">Non-Reported</div>
-                <div class="position-extremes-rows">
-                    <div class="extremes-row">
-                        <span class="extremes-label">Long:</span>
-                        {render_heatline_html(min_val, max_val, current_val, pos_val, is_delta=False)}
-                    </div>
-                    <div class="extremes-row">
-                        <span class="extremes-label">Short:</span>
-                        {render_heatline_html(min_val_short, max_val_short, current_val_short, pos_val_short, is_delta=False)}
-                    </div>
-                    <div class="extremes-row">
-                        <span class="extremes-label">Total:</span>
-                        {render_heatline_html(min_val_total, max_val_total, current_val_total, pos_val_total, is_delta=False)}
-                    </div>
-                    <div class="extremes-row">
-                        <span class="extremes-label">Net:</span>
-                        {render_heatline_html(min_val_net, max_val_net, current_val_net, pos_val_net, is_delta=False)}
-                    </div>
+                <div class="position-card-title">{title}</div>
+                <div class="position-extremes-rows">{rows}
                 </div>
             </div>
             """,
-            unsafe_allow_html=True,
-        )
+                unsafe_allow_html=True,
+            )
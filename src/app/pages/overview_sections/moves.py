@@ -6,10 +6,11 @@ import pandas as pd
 import streamlit as st
 
 from src.app.pages.overview_sections.common import (
+    heatline_template,
     inject_shared_css,
     inject_extremes_css,
-    render_heatline_html,
 )
+from src.common.view_models import market_view_record
 
 
 def render_moves_header() -> None:
@@ -34,23 +35,27 @@ def render_moves_header() -> None:
     )
 
 
-def render_moves(df_asset: pd.DataFrame, row: dict, current_week: pd.Timestamp, moves_mode: str) -> None:
+def render_moves(
+    df_asset: pd.DataFrame,
+    row: dict | None,
+    current_week: pd.Timestamp,
+    moves_mode: str,
+    view: dict | None = None,
+) -> None:
     """
     Render Positioning Moves section (cards only, no header/toggle).
 
     Args:
         df_asset: DataFrame filtered by market_key (unused, kept for signature consistency)
-        row: Current week row as dict (from df_week.iloc[0])
+        row: Current week row as dict (from df_week.iloc[0]); used only when view is None
         current_week: Current week timestamp (unused, kept for signature consistency)
         moves_mode: "all" or "5y" (from st.radio toggle, managed by parent)
+        view: market_view_weekly record for the week (heatlines are templated from it)
     """
     inject_extremes_css()
-
-    group_prefix = {
-        "Funds": "nc_",
-        "Commercials": "comm_",
-        "Non-Reported": "nr_",
-    }
+    if view is None:
+        view = market_view_record(row or {})
+    mode = "5y" if moves_mode == "5y" else "all"
 
     move_metrics = [
         ("Long 1w", "long"),
@@ -59,102 +64,27 @@ def render_moves(df_asset: pd.DataFrame, row: dict, current_week: pd.Timestamp,
         ("Net 1w", "net"),
     ]
 
-    def get_move_values(prefix: str, metric: str) -> tuple:
-        base = f"{prefix}{metric}_chg_1w"
-        if moves_mode == "5y":
-            min_col = f"{base}_min_5y"
-            max_col = f"{base}_max_5y"
-            pos_col = f"{base}_pos_5y"
-        else:
-            min_col = f"{base}_min_all"
-            max_col = f"{base}_max_all"
-            pos_col = f"{base}_pos_all"
-        return (
-            row.get(min_col),
-            row.get(max_col),
-            row.get(base),
-            row.get(pos_col),
-        )
-
     card_moves_funds, card_moves_comm, card_moves_nr = st.columns(3)
-
-    with card_moves_funds:
-        prefix = group_prefix["Funds"]
-        heatlines_html = []
-        for label, metric in move_metrics:
-            min_val, max_val, cur_val, pos_val = get_move_values(prefix, metric)
-            heatline_html = render_heatline_html(
-                min_val,
-                max_val,
-                cur_val,
-                pos_val,
-                is_delta=True,
-            )
-            heatlines_html.append(
-                f'<div class="extremes-row"><span class="extremes-label">{label}:</span>{heatline_html}</div>'
-            )
-        st.markdown(
-            f"""
-            <div class="position-card">
-                <div class="position-card-title">Funds</div>
-                <div class="position-extremes-rows">
-                    {''.join(heatlines_html)}
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    with card_moves_comm:
-        prefix = group_prefix["Commercials"]
-        heatlines_html = []
-        for label, metric in move_metrics:
-            min_val, max_val, cur_val, pos_val = get_move_values(prefix, metric)
-            heatline_html = render_heatline_html(
-                min_val,
-                max_val,
-                cur_val,
-                pos_val,
-                is_delta=True,
-            )
-            heatlines_html.append(
-                f'<div class="extremes-row"><span class="extremes-label">{label}:</span>{heatline_html}</div>'
-            )
-        st.markdown(
-            f"""
+    cards = (
+        (card_moves_funds, "Funds", "nc"),
+        (card_moves_comm, "Commercials", "comm"),
+        (card_moves_nr, "Non-Reported", "nr"),
+    )
+    for card, title, group in cards:
+        heatlines_html = [
+            f'<div class="extremes-row"><span class="extremes-label">{label}:</span>'
+            f'{heatline_template(view[f"{group}_{metric}_move_{mode}_pos"], view[f"{group}_{metric}_move_{mode}_tip"])}</div>'
+            for label, metric in move_metrics
+        ]
+        with card:
+            st.markdown(
+                f"""
             <div class="position-card">
-                <div class="position-card-title">Commercials</div>
+                <div class="position-card-title">{title}</div>
                 <div class="position-extremes-rows">
                     {''.join(heatlines_html)}
                 </div>
             </div>
             """,
-            unsafe_allow_html=True,
-        )
-
-    with card_moves_nr:
-        prefix = group_prefix["Non-Reported"]
-        heatlines_html = []
-        for label, metric in move_metrics:
-            min_val, max_val, cur_val, pos_val = get_move_values(prefix, metric)
-            heatline_html = render_heatline_html(
-                min_val,
-                max_val,
-                cur_val,
-                pos_val,
-                is_delta=True,
-            )
-            heatlines_html.append(
-                f'<div class="extremes-row"><span class="extremes-label">{label}:</span>{heatline_html}</div>'
+                unsafe_allow_html=True,
             )
-        st.markdown(
-            f"""
-            <div class="position-card">
-                <div class="position-card-title">Non-Reported</div>
-                <div class="position-extremes-rows">
-                    {''.join(heatlines_html)}
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
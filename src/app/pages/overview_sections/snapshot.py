@@ -8,16 +8,18 @@ import streamlit as st
 from src.app.pages.overview_sections.common import (
     fmt_num,
     fmt_delta,
-    fmt_delta_colored,
-    fmt_move_strength,
     render_dual_heatline_html,
     render_flow_rotation_bar_html,
-    create_sparkline,
-    get_13w_net_data,
+    sparkline_for,
     inject_snapshot_css,
     inject_shared_css,
     inject_extremes_css,
 )
+from src.common.formatting import delta_arrow_template, move_strength_template
+from src.common.view_models import market_view_record
+
+# metrics_weekly columns the snapshot sparklines read (card values come from the view record)
+SPARKLINE_COLUMNS = ("nc_net", "comm_net", "nr_net")
 
 
 def render_flow_rotation_section(df_asset: pd.DataFrame, row: dict) -> None:
@@ -227,37 +229,65 @@ def render_funds_vs_commercials(df_asset: pd.DataFrame, row: dict, current_week:
     )
 
 
-def render_snapshot(df_asset: pd.DataFrame, row: dict, current_week: pd.Timestamp) -> None:
-    """Render Positioning Snapshot section."""
-    inject_snapshot_css()
+def _position_card_html(title: str, view: dict, group: str, spark_svg: str) -> str:
+    """Snapshot card for one group, templated from the view record (no formatting or math)."""
 
-    def with_arrow(delta_val):
-        if pd.isna(delta_val):
-            return '<span style="color: #6b7280;">N/A</span>'
-        if delta_val > 0:
-            color = "#10b981"
-            sign = "+"
-            arrow_svg = (
-                '<svg width="10" height="10" viewBox="0 0 12 12" '
-                'style="margin-left: 4px; vertical-align: -1px;" '
-                f'fill="{color}" xmlns="http://www.w3.org/2000/svg">'
-                '<path d="M6 1 L11 6 H8 V11 H4 V6 H1 Z"/></svg>'
-            )
-        elif delta_val < 0:
-            color = "#ef4444"
-            sign = ""
-            arrow_svg = (
-                '<svg width="10" height="10" viewBox="0 0 12 12" '
-                'style="margin-left: 4px; vertical-align: -1px; transform: rotate(180deg);" '
-                f'fill="{color}" xmlns="http://www.w3.org/2000/svg">'
-                '<path d="M6 1 L11 6 H8 V11 H4 V6 H1 Z"/></svg>'
-            )
-        else:
-            color = "#6b7280"
-            sign = ""
-            arrow_svg = ""
-        value = fmt_num(delta_val)
-        return f'<span style="color: {color}; font-weight: 600;">{sign}{value}{arrow_svg}</span>'
+    def delta(key: str) -> str:
+        return delta_arrow_template(view[f"{key}_delta_dir"], view[f"{key}_delta_text"])
+
+    rows = "".join(
+        f"""
+                    <div class="position-detail-label">{label}:</div>
+                    <div class="position-detail-value">{view[f"{group}_{leg}_text"]}</div>
+                    <div class="position-detail-delta">{delta(f"{group}_{leg}")}</div>
+                    <div class="position-detail-13w">{view[f"{group}_{leg}_ma13_text"]}</div>"""
+        for label, leg in (("Long", "long"), ("Short", "short"), ("Total", "total"))
+    )
+    strength = move_strength_template(
+        view[f"{group}_strength_pct_text"],
+        view[f"{group}_strength_pct_color"],
+        view[f"{group}_strength_tip"],
+    )
+    return f"""
+            <div class="position-card">
+                <div class="position-sparkline">
+                    {spark_svg}
+                </div>
+                <div class="position-card-title">{title}</div>
+                <div class="position-net-label">Net Positions</div>
+                <div class="position-net">{view[f"{group}_net_text"]}</div>
+                <div class="position-delta">{delta(f"{group}_net")}</div>
+                <div class="position-move-strength">{strength}</div>
+                <div class="position-details-grid">
+                    <div class="position-detail-header"></div>
+                    <div class="position-detail-header"></div>
+                    <div class="position-detail-header"></div>
+                    <div class="position-detail-header">13W avg</div>{rows}
+                </div>
+            </div>
+            """
+
+
+def render_snapshot(
+    df_asset: pd.DataFrame,
+    row: dict | None,
+    current_week: pd.Timestamp,
+    market: str | None = None,
+    generation: float | None = None,
+    view: dict | None = None,
+) -> None:
+    """
+    Render Positioning Snapshot section.
+
+    Card values come from `view` (a market_view_weekly record written by
+    compute); without it the record is built from `row`. With market and
+    generation (metrics file mtime) the 13W sparklines are memoized across
+    reruns; df_asset should be the market's rows sorted by report_date
+    (e.g. MetricsStore.market()).
+    """
+    inject_snapshot_css()
+    if view is None:
+        view = market_view_record(row or {})
 
     st.markdown(
         """
@@ -275,176 +305,26 @@ def render_snapshot(df_asset: pd.DataFrame, row: dict, current_week: pd.Timestam
         unsafe_allow_html=True,
     )
 
-    nc_long_13w = row.get("nc_long_ma_13w")
-    nc_short_13w = row.get("nc_short_ma_13w")
-    nc_total_13w = row.get("nc_total_ma_13w")
-    comm_long_13w = row.get("comm_long_ma_13w")
-    comm_short_13w = row.get("comm_short_ma_13w")
-    comm_total_13w = row.get("comm_total_ma_13w")
-
     card_funds, card_comm, card_nr = st.columns(3)
-
-    with card_funds:
-        net_val = row.get("nc_net", 0)
-        net_delta = row.get("nc_net_chg_1w")
-        nc_net_13w_data = get_13w_net_data(df_asset, current_week, "nc_net")
-        spark_svg_funds = create_sparkline(nc_net_13w_data)
-        st.markdown(
-            f"""
-            <div class="position-card">
-                <div class="position-sparkline">
-                    {spark_svg_funds}
-                </div>
-                <div class="position-card-title">Funds</div>
-                <div class="position-net-label">Net Positions</div>
-                <div class="position-net">{fmt_num(net_val)}</div>
-                <div class="position-delta">{with_arrow(net_delta)}</div>
-                <div class="position-move-strength">{fmt_move_strength(
-                    row.get("nc_net_chg_1w"),
-                    row.get("nc_net_move_pct_all"),
-                    row.get("nc_net_chg_1w_min_all"),
-                    row.get("nc_net_chg_1w_max_all"),
-                )}</div>
-                <div class="position-details-grid">
-                    <div class="position-detail-header"></div>
-                    <div class="position-detail-header"></div>
-                    <div class="position-detail-header"></div>
-                    <div class="position-detail-header">13W avg</div>
-                    <div class="position-detail-label">Long:</div>
-                    <div class="position-detail-value">{fmt_num(row.get("nc_long", 0))}</div>
-                    <div class="position-detail-delta">{with_arrow(row.get("nc_long_chg_1w"))}</div>
-                    <div class="position-detail-13w">{fmt_num(nc_long_13w)}</div>
-                    <div class="position-detail-label">Short:</div>
-                    <div class="position-detail-value">{fmt_num(row.get("nc_short", 0))}</div>
-                    <div class="position-detail-delta">{with_arrow(row.get("nc_short_chg_1w"))}</div>
-                    <div class="position-detail-13w">{fmt_num(nc_short_13w)}</div>
-                    <div class="position-detail-label">Total:</div>
-                    <div class="position-detail-value">{fmt_num(row.get("nc_total", 0))}</div>
-                    <div class="position-detail-delta">{with_arrow(row.get("nc_total_chg_1w"))}</div>
-                    <div class="position-detail-13w">{fmt_num(nc_total_13w)}</div>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    with card_comm:
-        net_val = row.get("comm_net", 0)
-        net_delta = row.get("comm_net_chg_1w")
-        comm_net_13w_data = get_13w_net_data(df_asset, current_week, "comm_net")
-        spark_svg_comm = create_sparkline(comm_net_13w_data)
-        st.markdown(
-            f"""
-            <div class="position-card">
-                <div class="position-sparkline">
-                    {spark_svg_comm}
-                </div>
-                <div class="position-card-title">Commercials</div>
-                <div class="position-net-label">Net Positions</div>
-                <div class="position-net">{fmt_num(net_val)}</div>
-                <div class="position-delta">{with_arrow(net_delta)}</div>
-                <div class="position-move-strength">{fmt_move_strength(
-                    row.get("comm_net_chg_1w"),
-                    row.get("comm_net_move_pct_all"),
-                    row.get("comm_net_chg_1w_min_all"),
-                    row.get("comm_net_chg_1w_max_all"),
-                )}</div>
-                <div class="position-details-grid">
-                    <div class="position-detail-header"></div>
-                    <div class="position-detail-header"></div>
-                    <div class="position-detail-header"></div>
-                    <div class="position-detail-header">13W avg</div>
-                    <div class="position-detail-label">Long:</div>
-                    <div class="position-detail-value">{fmt_num(row.get("comm_long", 0))}</div>
-                    <div class="position-detail-delta">{with_arrow(row.get("comm_long_chg_1w"))}</div>
-                    <div class="position-detail-13w">{fmt_num(comm_long_13w)}</div>
-                    <div class="position-detail-label">Short:</div>
-                    <div class="position-detail-value">{fmt_num(row.get("comm_short", 0))}</div>
-                    <div class="position-detail-delta">{with_arrow(row.get("comm_short_chg_1w"))}</div>
-                    <div class="position-detail-13w">{fmt_num(comm_short_13w)}</div>
-                    <div class="position-detail-label">Total:</div>
-                    <div class="position-detail-value">{fmt_num(row.get("comm_total", 0))}</div>
-                    <div class="position-detail-delta">{with_arrow(row.get("comm_total_chg_1w"))}</div>
-                    <div class="position-detail-13w">{fmt_num(comm_total_13w)}</div>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-    with card_nr:
-        nr_long = row.get("nr_long")
-        nr_short = row.get("nr_short")
-        nr_total = row.get("nr_total")
-        nr_net = row.get("nr_net")
-
-        has_nr_data = (
-            (nr_long is not None and pd.notna(nr_long)) or
-            (nr_short is not None and pd.notna(nr_short)) or
-            (nr_total is not None and pd.notna(nr_total)) or
-            (nr_net is not None and pd.notna(nr_net))
-        )
-
-        if has_nr_data:
-            net_delta = row.get("nr_net_chg_1w")
-            long_delta = row.get("nr_long_chg_1w")
-            short_delta = row.get("nr_short_chg_1w")
-            total_delta = row.get("nr_total_chg_1w")
-
-            nr_long_13w = row.get("nr_long_ma_13w")
-            nr_short_13w = row.get("nr_short_ma_13w")
-            nr_total_13w = row.get("nr_total_ma_13w")
-
-            nr_net_13w_data = get_13w_net_data(df_asset, current_week, "nr_net") if "nr_net" in df_asset.columns else []
-            spark_svg_nr = create_sparkline(nr_net_13w_data)
-
-            st.markdown(
-                f"""
-                <div class="position-card">
-                    <div class="position-sparkline">
-                        {spark_svg_nr}
-                    </div>
-                    <div class="position-card-title">Non-Reported</div>
-                    <div class="position-net-label">Net Positions</div>
-                    <div class="position-net">{fmt_num(nr_net)}</div>
-                    <div class="position-delta">{with_arrow(net_delta)}</div>
-                    <div class="position-move-strength">{fmt_move_strength(
-                        row.get("nr_net_chg_1w"),
-                        row.get("nr_net_move_pct_all"),
-                        row.get("nr_net_chg_1w_min_all"),
-                        row.get("nr_net_chg_1w_max_all"),
-                    )}</div>
-                    <div class="position-details-grid">
-                        <div class="position-detail-header"></div>
-                        <div class="position-detail-header"></div>
-                        <div class="position-detail-header"></div>
-                        <div class="position-detail-header">13W avg</div>
-                        <div class="position-detail-label">Long:</div>
-                        <div class="position-detail-value">{fmt_num(nr_long)}</div>
-                        <div class="position-detail-delta">{with_arrow(long_delta)}</div>
-                        <div class="position-detail-13w">{fmt_num(nr_long_13w)}</div>
-                        <div class="position-detail-label">Short:</div>
-                        <div class="position-detail-value">{fmt_num(nr_short)}</div>
-                        <div class="position-detail-delta">{with_arrow(short_delta)}</div>
-                        <div class="position-detail-13w">{fmt_num(nr_short_13w)}</div>
-                        <div class="position-detail-label">Total:</div>
-                        <div class="position-detail-value">{fmt_num(nr_total)}</div>
-                        <div class="position-detail-delta">{with_arrow(total_delta)}</div>
-                        <div class="position-detail-13w">{fmt_num(nr_total_13w)}</div>
+    cards = (
+        (card_funds, "Funds", "nc"),
+        (card_comm, "Commercials", "comm"),
+        (card_nr, "Non-Reported", "nr"),
+    )
+    for card, title, group in cards:
+        with card:
+            if group == "nr" and not view.get("nr_has_data", False):
+                st.markdown(
+                    """
+                    <div class="position-card">
+                        <div class="position-card-title">Non-Reported</div>
+                        <div class="position-net-label">Net Positions</div>
+                        <div class="position-net">N/A</div>
+                        <p style="color: #6b7280; font-size: 0.85rem; margin-top: 1rem;">No data in metrics_weekly.parquet</p>
                     </div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
-        else:
-            st.markdown(
-                """
-                <div class="position-card">
-                    <div class="position-card-title">Non-Reported</div>
-                    <div class="position-net-label">Net Positions</div>
-                    <div class="position-net">N/A</div>
-                    <p style="color: #6b7280; font-size: 0.85rem; margin-top: 1rem;">No data in metrics_weekly.parquet</p>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
+                    """,
+                    unsafe_allow_html=True,
+                )
+                continue
+            spark_svg = sparkline_for(df_asset, current_week, f"{group}_net", market, generation)
+            st.markdown(_position_card_html(title, view, group, spark_svg), unsafe_allow_html=True)
@@ -0,0 +1,24 @@
+"""Pre-built CSS bundles for the Streamlit app (plain strings; no Streamlit or pandas import)."""
+
+from __future__ import annotations
+
+
+def css_bundle(*blocks: str) -> str:
+    """
+    One <style> element from CSS rule blocks, built once at import.
+
+    Indentation and blank lines are stripped, so every injection sends the
+    compact text and markdown never sees indented (code block) lines.
+    """
+    lines = (line.strip() for block in blocks for line in block.splitlines())
+    return "<style>\n" + "\n".join(line for line in lines if line) + "\n</style>"
+
+
+# Streamlit multipage menu (if auto-detected): hidden, the app uses its own navigation
+HIDE_SIDEBAR_NAV_CSS = css_bundle(
+    """
+    [data-testid="stSidebarNav"] {
+        display: none !important;
+    }
+    """
+)
@@ -0,0 +1,39 @@
+"""Cross-section layout shared by compute (builder) and the API (readers), without the builder's imports."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+RANK_METRICS = ["net_z_52w_funds", "nc_net_pct_oi", "oi_z_52w", "hot_score"]
+
+
+def week_slice(cross_section: pd.DataFrame, report_date: pd.Timestamp) -> pd.DataFrame:
+    """Return the rows for one report_date via binary search on the report_date-major layout."""
+    dates = cross_section["report_date"].to_numpy()
+    key = pd.Timestamp(report_date).to_datetime64()
+    start = int(np.searchsorted(dates, key, side="left"))
+    end = int(np.searchsorted(dates, key, side="right"))
+    return cross_section.iloc[start:end]
+
+
+class RankingQueryError(ValueError):
+    """Invalid ranking request."""
+
+
+def rank_week(week: pd.DataFrame, by: str, scope: str, category: str, order: str) -> pd.DataFrame:
+    """
+    One week's rows in `category` sorted by the `by` percentile (ties by market_key).
+
+    scope="category" sorts on `{by}_pct_cat`, which is only comparable within one
+    category, so it requires a specific category.
+
+    Raises:
+        RankingQueryError: for scope="category" with category="all"
+    """
+    if scope == "category" and category == "all":
+        raise RankingQueryError("scope=category requires a category")
+    if category != "all":
+        week = week[week["category"].astype(str).str.lower() == category.lower()]
+    pct_col = f"{by}_pct_cat" if scope == "category" else f"{by}_pct_xs"
+    return week.sort_values([pct_col, "market_key"], ascending=[order == "asc", True], na_position="last")
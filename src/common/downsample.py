@@ -0,0 +1,132 @@
+"""Chart downsampling shared by the Streamlit pages and the API (min-max buckets or LTTB)."""
+
+from __future__ import annotations
+
+from typing import Literal, Sequence
+
+import numpy as np
+import pandas as pd
+
+DownsampleMethod = Literal["minmax", "lttb"]
+
+# One plotted point per PX_PER_POINT pixels of chart width; denser points are not visible
+PX_PER_POINT = 2
+MIN_CHART_POINTS = 16
+# Streamlit cannot measure a chart: its line charts fill the wide-layout main column (~1000 px)
+DEFAULT_CHART_WIDTH_PX = 1000
+
+
+def point_budget(width_px: int) -> int:
+    """Max rows a chart `width_px` pixels wide needs."""
+    return max(MIN_CHART_POINTS, int(width_px) // PX_PER_POINT)
+
+
+def minmax_indices(y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """
+    Positions of the min and max of each of n_buckets equal-count buckets (plus first/last).
+
+    Every local peak and trough that is a bucket extreme survives, so spikes are never
+    averaged away. NaN values are never picked.
+    """
+    y = np.asarray(y, dtype="float64")
+    n = len(y)
+    n_buckets = min(max(int(n_buckets), 1), n)
+    if n_buckets >= n or n <= 2:
+        return np.arange(n)
+
+    edges = (np.arange(n_buckets + 1) * n) // n_buckets
+    bucket = np.repeat(np.arange(n_buckets), np.diff(edges))
+    missing = np.isnan(y)
+    # Sorted by (bucket, value): position edges[b] holds bucket b's argmin (NaN sorts last as +inf)
+    lo = np.lexsort((np.where(missing, np.inf, y), bucket))[edges[:-1]]
+    hi = np.lexsort((np.where(missing, np.inf, -y), bucket))[edges[:-1]]
+    picks = np.concatenate(([0, n - 1], lo, hi))
+    return np.unique(picks[~missing[picks] | (picks == 0) | (picks == n - 1)])
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: n_out positions that keep the visual shape of (x, y).
+
+    Computed over non-NaN points; first and last points are always kept.
+    """
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    valid = np.flatnonzero(~np.isnan(y))
+    n = len(valid)
+    if n_out >= n:
+        return valid
+    if n_out < 3:
+        return valid[[0, -1]]
+
+    vx, vy = x[valid], y[valid]
+    # n_out - 2 buckets between the fixed first and last points
+    edges = 1 + ((np.arange(n_out - 1) * (n - 2)) // (n_out - 2))
+    picks = np.empty(n_out, dtype=np.int64)
+    picks[0], picks[-1] = 0, n - 1
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        nxt_lo, nxt_hi = hi, edges[b + 2] if b + 2 < len(edges) else n
+        cx, cy = vx[nxt_lo:nxt_hi].mean(), vy[nxt_lo:nxt_hi].mean()
+        area = np.abs((vx[a] - cx) * (vy[lo:hi] - vy[a]) - (vx[a] - vx[lo:hi]) * (cy - vy[a]))
+        a = lo + int(np.argmax(area))
+        picks[b + 1] = a
+    return valid[picks]
+
+
+def downsample_indices(
+    x: np.ndarray,
+    columns: Sequence[np.ndarray],
+    max_points: int,
+    method: DownsampleMethod = "minmax",
+) -> np.ndarray:
+    """
+    Sorted row positions shared by all series of one chart (about max_points rows).
+
+    Each series gets an equal share of the budget and the union is kept, so every
+    series' bucket extremes (minmax) or shape points (lttb) are plotted.
+    """
+    n = len(x)
+    if n <= max_points or not columns:
+        return np.arange(n)
+    per_series = max(max_points // len(columns), 4)
+    picks = [np.array([0, n - 1])]
+    for y in columns:
+        if method == "lttb":
+            picks.append(lttb_indices(x, y, per_series))
+        else:
+            picks.append(minmax_indices(y, per_series // 2))
+    return np.unique(np.concatenate(picks))
+
+
+def downsample_frame(
+    df: pd.DataFrame,
+    width_px: int | None,
+    columns: Sequence[str] | None = None,
+    x_col: str = "report_date",
+    method: DownsampleMethod = "minmax",
+) -> pd.DataFrame:
+    """
+    Rows of a (date-sorted) chart frame needed to draw it `width_px` pixels wide.
+
+    Frames that already fit (short ranges, i.e. zoomed in) come back unchanged at full
+    resolution. `columns` are the plotted series (default: numeric columns except x_col).
+
+    Args:
+        df: chart frame sorted by x_col
+        width_px: target chart width in pixels; None disables downsampling
+        columns: series the rows are selected for
+        x_col: x axis column (row order when absent)
+        method: "minmax" (per-bucket peaks and troughs) or "lttb"
+    """
+    if width_px is None or len(df) <= point_budget(width_px):
+        return df
+    if columns is None:
+        columns = [c for c in df.columns if c != x_col and pd.api.types.is_numeric_dtype(df[c])]
+    series = [pd.to_numeric(df[c], errors="coerce").to_numpy(dtype="float64", na_value=np.nan) for c in columns]
+    if x_col in df.columns:
+        x = pd.to_datetime(df[x_col]).to_numpy("datetime64[ns]").astype("int64").astype("float64")
+    else:
+        x = np.arange(len(df), dtype="float64")
+    return df.iloc[downsample_indices(x, series, point_budget(width_px), method)]
@@ -0,0 +1,170 @@
+"""Display formatting shared by compute (view models) and the Streamlit sections (no Streamlit import)."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+POSITIVE_COLOR = "#10b981"
+NEGATIVE_COLOR = "#ef4444"
+NEUTRAL_COLOR = "#6b7280"
+
+_ARROW_PATH = '<path d="M6 1 L11 6 H8 V11 H4 V6 H1 Z"/></svg>'
+
+
+def fmt_num(val):
+    """Format number as integer with thousand separators."""
+    if pd.isna(val):
+        return "N/A"
+    try:
+        return f"{int(round(val)):,}"
+    except (ValueError, TypeError):
+        return "N/A"
+
+
+def fmt_delta(val):
+    """Format delta with sign as integer."""
+    if pd.isna(val):
+        return "N/A"
+    sign = "+" if val >= 0 else ""
+    return f"{sign}{fmt_num(val)}"
+
+
+def fmt_delta_colored(val):
+    """Format delta with color based on sign as integer."""
+    if pd.isna(val):
+        return f'<span style="color: {NEUTRAL_COLOR};">N/A</span>'
+    if val == 0:
+        return f'<span style="color: {NEUTRAL_COLOR};">0</span>'
+    if val > 0:
+        color = POSITIVE_COLOR  # green
+        sign = "+"
+    else:
+        color = NEGATIVE_COLOR  # red
+        sign = ""
+    value = fmt_num(val)
+    return f'<span style="color: {color}; font-weight: 600;">{sign}{value}</span>'
+
+
+def delta_arrow_parts(val) -> tuple[str, str]:
+    """Direction ("up" / "down" / "flat" / "na") and signed integer text of a delta."""
+    if pd.isna(val):
+        return "na", "N/A"
+    if val > 0:
+        return "up", f"+{fmt_num(val)}"
+    if val < 0:
+        return "down", fmt_num(val)
+    return "flat", fmt_num(val)
+
+
+def delta_arrow_template(direction: str, text: str) -> str:
+    """Colored delta with an up/down arrow icon (from delta_arrow_parts)."""
+    if direction == "na":
+        return f'<span style="color: {NEUTRAL_COLOR};">N/A</span>'
+    if direction == "up":
+        color = POSITIVE_COLOR
+        arrow_svg = (
+            '<svg width="10" height="10" viewBox="0 0 12 12" '
+            'style="margin-left: 4px; vertical-align: -1px;" '
+            f'fill="{color}" xmlns="http://www.w3.org/2000/svg">'
+            f"{_ARROW_PATH}"
+        )
+    elif direction == "down":
+        color = NEGATIVE_COLOR
+        arrow_svg = (
+            '<svg width="10" height="10" viewBox="0 0 12 12" '
+            'style="margin-left: 4px; vertical-align: -1px; transform: rotate(180deg);" '
+            f'fill="{color}" xmlns="http://www.w3.org/2000/svg">'
+            f"{_ARROW_PATH}"
+        )
+    else:
+        color = NEUTRAL_COLOR
+        arrow_svg = ""
+    return f'<span style="color: {color}; font-weight: 600;">{text}{arrow_svg}</span>'
+
+
+def fmt_delta_arrow(val):
+    """Format delta as a colored integer with an up/down arrow icon."""
+    return delta_arrow_template(*delta_arrow_parts(val))
+
+
+def move_strength_parts(chg_val, pct_val, min_val, max_val) -> tuple[str, str, str]:
+    """
+    Percentile text, its color and the escaped tooltip of a move strength row.
+
+    Args:
+        chg_val: net_chg_1w value (signed delta)
+        pct_val: net_move_pct_all value (percentile 0..1)
+        min_val: precomputed min value from compute
+        max_val: precomputed max value from compute
+    """
+    if pd.isna(chg_val):
+        tooltip_delta = "N/A"
+    else:
+        tooltip_delta = fmt_delta(chg_val)
+
+    tooltip_min = fmt_delta(min_val) if min_val is not None and pd.notna(min_val) else "N/A"
+    tooltip_max = fmt_delta(max_val) if max_val is not None and pd.notna(max_val) else "N/A"
+
+    if pd.isna(pct_val):
+        pct_text = "N/A"
+        pct_color = ""
+    else:
+        pct_rounded = round(pct_val * 100)
+        if pct_rounded < 30:
+            pct_color = NEUTRAL_COLOR  # neutral gray
+        elif pct_rounded < 60:
+            pct_color = "#6fbf73"  # soft green
+        elif pct_rounded < 80:
+            pct_color = "#f5b93d"  # amber/yellow
+        elif pct_rounded < 95:
+            pct_color = "#f08c2e"  # orange
+        else:
+            pct_color = NEGATIVE_COLOR  # red
+        pct_text = f"{pct_rounded}%"
+
+    tooltip_text = f"Min: {tooltip_min} | Current change: {tooltip_delta} | Max: {tooltip_max}"
+    return pct_text, pct_color, tooltip_text.replace('"', "&quot;")
+
+
+def move_strength_template(pct_text: str, pct_color: str, tooltip_escaped: str) -> str:
+    """Move strength HTML (from move_strength_parts; empty color = no percentile)."""
+    if not pct_color:
+        pct_html = f'<span style="color: {NEUTRAL_COLOR};">N/A</span>'
+    else:
+        pct_html = f'<span style="color: {pct_color}; font-weight: 600;">{pct_text}</span>'
+    return f'<span title="{tooltip_escaped}" style="cursor: help;">Move strength: {pct_html}</span>'
+
+
+def fmt_move_strength(chg_val, pct_val, min_val, max_val) -> str:
+    """
+    Format move strength row with delta and percentile.
+
+    Returns:
+        HTML string with formatted move strength and tooltip
+    """
+    return move_strength_template(*move_strength_parts(chg_val, pct_val, min_val, max_val))
+
+
+def heatline_fields(min_val, max_val, current_val, pos_val, is_delta: bool = False) -> tuple[float | None, str]:
+    """
+    Dot position (0..100, clamped) and escaped tooltip of one heatline.
+
+    Position is None when any input is missing (rendered as the dashed "no data" bar).
+    """
+    is_missing = (
+        pos_val is None
+        or pd.isna(pos_val)
+        or min_val is None
+        or max_val is None
+        or current_val is None
+        or pd.isna(min_val)
+        or pd.isna(max_val)
+        or pd.isna(current_val)
+    )
+    if is_missing:
+        return None, "No data for this week"
+
+    pos_pct = max(0.0, min(100.0, pos_val * 100))
+    fmt = fmt_delta if is_delta else fmt_num
+    tooltip_text = f"Min: {fmt(min_val)} | Current: {fmt(current_val)} | Max: {fmt(max_val)}"
+    return pos_pct, tooltip_text.replace('"', "&quot;")
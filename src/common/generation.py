@@ -0,0 +1,44 @@
+"""Compute generation marker: written last by compute, watched by the API for push events."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+GENERATION_FILE = "generation.json"
+
+
+def write_generation(output_dir: Path, report_date: str | None, artifacts: dict[str, int]) -> dict:
+    """
+    Atomically write data/compute/generation.json after all artifacts are in place.
+
+    Args:
+        output_dir: Compute output directory
+        report_date: Latest report_date (YYYY-MM-DD) in the outputs
+        artifacts: {filename: rows} of the files written by this run
+
+    Returns:
+        The written payload
+    """
+    payload = {
+        "id": str(time.time_ns()),
+        "report_date": report_date,
+        "written_at_utc": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+        "artifacts": artifacts,
+    }
+    path = output_dir / GENERATION_FILE
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(payload), encoding="utf-8")
+    os.replace(tmp, path)
+    return payload
+
+
+def read_generation(path: Path) -> dict | None:
+    """Parsed generation marker, or None if missing or unreadable (e.g. mid-replace)."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
@@ -0,0 +1,145 @@
+"""Per-market row ranges over metrics_weekly for O(rows per market) lookups."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+
+def range_cutoff(latest: pd.Timestamp, range_code: str) -> pd.Timestamp | None:
+    """Earliest report_date kept for range_code (4W/12W/YTD/1Y; None = no lower bound)."""
+    range_norm = (range_code or "12W").upper()
+    if range_norm == "4W":
+        return latest - pd.Timedelta(days=28)
+    if range_norm == "12W":
+        return latest - pd.Timedelta(days=84)
+    if range_norm == "1Y":
+        return latest - pd.Timedelta(days=365)
+    if range_norm == "YTD":
+        return pd.Timestamp(year=latest.year, month=1, day=1)
+    return None
+
+
+@dataclass(frozen=True)
+class MarketIndex:
+    """
+    metrics sorted by (market_key, report_date) with each market's [start, end) row range.
+
+    Within a market block valid report_dates come first in ascending order
+    (NaT rows sort last), so date windows are found by binary search.
+    """
+
+    frame: pd.DataFrame
+    ranges: dict[str, tuple[int, int]]
+    dates: np.ndarray
+
+    def market_rows(self, market_key: str) -> pd.DataFrame | None:
+        """All rows of one market sorted by report_date, or None if unknown."""
+        bounds = self.ranges.get(market_key)
+        if bounds is None:
+            return None
+        return self.frame.iloc[bounds[0]:bounds[1]]
+
+    def range_rows(
+        self,
+        market_key: str,
+        cutoff_for: Callable[[pd.Timestamp], pd.Timestamp | None],
+    ) -> pd.DataFrame | None:
+        """
+        Rows of one market with report_date >= cutoff_for(latest valid report_date).
+
+        Rows with missing report_date are excluded (as in the full-frame range filter).
+        """
+        bounds = self.ranges.get(market_key)
+        if bounds is None:
+            return None
+        start, end = bounds
+        block = self.dates[start:end]
+        valid_end = start + int(np.count_nonzero(~np.isnat(block)))
+        if valid_end == start:
+            return self.frame.iloc[start:start]
+        cutoff = cutoff_for(pd.Timestamp(self.dates[valid_end - 1]))
+        if cutoff is not None:
+            start += int(np.searchsorted(self.dates[start:valid_end], cutoff.to_datetime64(), side="left"))
+        return self.frame.iloc[start:valid_end]
+
+    def date_bounds(
+        self,
+        market_key: str,
+        start: pd.Timestamp | None = None,
+        end: pd.Timestamp | None = None,
+    ) -> tuple[int, int] | None:
+        """
+        Positional [lo, hi) rows of one market with start <= report_date <= end.
+
+        Either bound may be None; rows with missing report_date are excluded.
+        """
+        bounds = self.ranges.get(market_key)
+        if bounds is None:
+            return None
+        lo, hi = bounds
+        hi = lo + int(np.count_nonzero(~np.isnat(self.dates[lo:hi])))
+        block = self.dates[lo:hi]
+        if end is not None:
+            hi = lo + int(np.searchsorted(block, end.to_datetime64(), side="right"))
+        if start is not None:
+            lo += int(np.searchsorted(block, start.to_datetime64(), side="left"))
+        return (lo, max(lo, hi))
+
+    def page_bounds(
+        self,
+        market_key: str,
+        after: pd.Timestamp | None,
+        limit: int,
+        descending: bool = True,
+    ) -> tuple[int, int, bool] | None:
+        """
+        Keyset page of one market: up to `limit` rows strictly after the cursor date.
+
+        "After" follows the page order (older dates when descending). Returns
+        positional [lo, hi) in ascending row order plus whether more rows
+        remain beyond the page; rows with missing report_date are excluded.
+        """
+        bounds = self.ranges.get(market_key)
+        if bounds is None:
+            return None
+        first, last = bounds
+        last = first + int(np.count_nonzero(~np.isnat(self.dates[first:last])))
+        block = self.dates[first:last]
+        if descending:
+            hi = last if after is None else first + int(np.searchsorted(block, after.to_datetime64(), side="left"))
+            lo = max(first, hi - limit)
+            return (lo, hi, lo > first)
+        lo = first if after is None else first + int(np.searchsorted(block, after.to_datetime64(), side="right"))
+        hi = min(last, lo + limit)
+        return (lo, hi, hi < last)
+
+
+def build_market_index(metrics: pd.DataFrame) -> MarketIndex:
+    """
+    Sort metrics once and record each market's contiguous row range.
+
+    Args:
+        metrics: Metrics DataFrame with market_key and datetime report_date
+
+    Returns:
+        MarketIndex keyed by str(market_key)
+    """
+    keys = metrics["market_key"].astype(str)
+    frame = (
+        metrics.assign(market_key=keys)
+        .sort_values(["market_key", "report_date"], kind="stable", na_position="last")
+        .reset_index(drop=True)
+    )
+    key_arr = frame["market_key"].to_numpy()
+    if len(key_arr) == 0:
+        return MarketIndex(frame=frame, ranges={}, dates=np.array([], dtype="datetime64[ns]"))
+
+    starts = np.concatenate([[0], np.flatnonzero(key_arr[1:] != key_arr[:-1]) + 1])
+    ends = np.append(starts[1:], len(key_arr))
+    ranges = {str(key_arr[s]): (int(s), int(e)) for s, e in zip(starts, ends)}
+    dates = frame["report_date"].to_numpy(dtype="datetime64[ns]")
+    return MarketIndex(frame=frame, ranges=ranges, dates=dates)
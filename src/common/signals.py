@@ -0,0 +1,36 @@
+"""Signal state shared by the radar readers (API, UI) and the view-model builder, without the builders' imports."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+SIGNAL_COLORS = {
+    "bullish": "#22c55e",
+    "bearish": "#ef4444",
+    "extreme": "#f59e0b",
+}
+DEFAULT_SIGNAL_COLOR = "#38bdf8"
+
+
+def signal_states(df: pd.DataFrame) -> pd.Series:
+    """
+    Vectorized signal state per row.
+
+    extreme if |net_z_52w_funds| >= 2 or oi_risk_level == "High",
+    else bullish/bearish by cot_traffic_signal >= 1 / <= -1, else neutral.
+    """
+    nan = pd.Series(np.nan, index=df.index)
+    sig = pd.to_numeric(df.get("cot_traffic_signal", nan), errors="coerce")
+    funds_z = pd.to_numeric(df.get("net_z_52w_funds", nan), errors="coerce")
+    oi_risk = df["oi_risk_level"].fillna("").astype(str) if "oi_risk_level" in df.columns else pd.Series("", index=df.index)
+    states = np.select(
+        [
+            (funds_z.abs() >= 2.0) | (oi_risk == "High"),
+            sig >= 1,
+            sig <= -1,
+        ],
+        ["extreme", "bullish", "bearish"],
+        default="neutral",
+    )
+    return pd.Series(states, index=df.index, dtype=object)
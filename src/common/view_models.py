@@ -0,0 +1,147 @@
+"""Per-market UI view models: the values and formatted strings the overview sections render (compute and UI fallbacks)."""
+
+from __future__ import annotations
+
+import logging
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from src.common.formatting import delta_arrow_parts, fmt_num, heatline_fields, move_strength_parts
+from src.common.signals import DEFAULT_SIGNAL_COLOR, SIGNAL_COLORS, signal_states
+
+logger = logging.getLogger("cot_mvp")
+
+MARKET_VIEW_FILE = "market_view_weekly.parquet"
+# Sorted by (market_key, report_date); small row groups let the UI read one market via min/max stats
+MARKET_VIEW_ROW_GROUP_ROWS = 256
+
+VIEW_GROUPS = ("nc", "comm", "nr")
+VIEW_LEGS = ("long", "short", "total")
+HEATLINE_METRICS = ("long", "short", "total", "net")
+HEATLINE_MODES = ("all", "5y")
+
+
+def _column(metrics: pd.DataFrame, col: str) -> list:
+    """Column as a Python list (NaN when the column is absent, e.g. an older schema)."""
+    if col not in metrics.columns:
+        return [np.nan] * len(metrics)
+    return metrics[col].tolist()
+
+
+def _map(fn: Callable, *columns: list) -> list:
+    return [fn(*values) for values in zip(*columns)]
+
+
+def _kpi_num(val) -> str:
+    if val is None or pd.isna(val):
+        return "N/A"
+    return f"{float(val):,.0f}"
+
+
+def _kpi_z(val) -> str:
+    return f"{float(val):.2f}" if pd.notna(val) else "N/A"
+
+
+def _kpi_date(val) -> str:
+    return pd.Timestamp(val).strftime("%Y-%m-%d") if pd.notna(val) else "N/A"
+
+
+def _parts_columns(out: dict, prefix: str, suffixes: tuple[str, ...], parts: list[tuple]) -> None:
+    for i, suffix in enumerate(suffixes):
+        out[f"{prefix}_{suffix}"] = [p[i] for p in parts]
+
+
+def _heatline_columns(out: dict, metrics: pd.DataFrame, key: str, base: str, current: str, is_delta: bool) -> None:
+    """{key}_{mode}_pos / _tip for one heatline in both modes."""
+    current_vals = _column(metrics, current)
+    for mode in HEATLINE_MODES:
+        fields = _map(
+            lambda lo, hi, cur, pos: heatline_fields(lo, hi, cur, pos, is_delta=is_delta),
+            _column(metrics, f"{base}_min_{mode}"),
+            _column(metrics, f"{base}_max_{mode}"),
+            current_vals,
+            _column(metrics, f"{base}_pos_{mode}"),
+        )
+        out[f"{key}_{mode}_pos"] = np.array([np.nan if pos is None else pos for pos, _ in fields], dtype="float64")
+        out[f"{key}_{mode}_tip"] = [tip for _, tip in fields]
+
+
+def build_market_view_weekly(metrics: pd.DataFrame) -> pd.DataFrame:
+    """
+    One view record per (market_key, report_date) for the overview UI.
+
+    The UI only looks records up and substitutes them into HTML templates:
+    - KPI cards: signal_state / signal_color, kpi_funds_net, kpi_comm_net, kpi_funds_z, kpi_updated
+    - Snapshot cards per group (nc/comm/nr): {g}_has_data, {g}_net_text, {g}_net_delta_dir / _text,
+      {g}_strength_pct_text / _pct_color / _tip (move strength), and {g}_{leg}_text, {g}_{leg}_delta_dir / _text,
+      {g}_{leg}_ma13_text for long/short/total (delta/move parts feed the formatting templates)
+    - Heatlines per group x long/short/total/net x all/5y: {g}_{m}_ext_{mode}_pos / _tip (levels)
+      and {g}_{m}_move_{mode}_pos / _tip (1w deltas); pos is 0..100 (NaN = no data), tip is escaped
+
+    Args:
+        metrics: metrics_weekly (market_key, report_date and the source columns; missing ones render N/A)
+
+    Returns:
+        DataFrame sorted by market_key, report_date
+    """
+    if metrics.empty:
+        return pd.DataFrame(columns=["market_key", "report_date"])
+
+    df = metrics.sort_values(["market_key", "report_date"], kind="stable").reset_index(drop=True)
+    out: dict[str, object] = {
+        "market_key": df["market_key"].astype(str).to_numpy(),
+        "report_date": pd.to_datetime(df["report_date"], errors="coerce").to_numpy(),
+    }
+
+    states = signal_states(df)
+    out["signal_state"] = states.to_numpy(dtype=object)
+    out["signal_color"] = states.map(SIGNAL_COLORS).fillna(DEFAULT_SIGNAL_COLOR).to_numpy(dtype=object)
+    out["kpi_funds_net"] = _map(_kpi_num, _column(df, "nc_net"))
+    out["kpi_comm_net"] = _map(_kpi_num, _column(df, "comm_net"))
+    out["kpi_funds_z"] = _map(_kpi_z, _column(df, "net_z_52w_funds"))
+    out["kpi_updated"] = _map(_kpi_date, list(out["report_date"]))
+
+    for g in VIEW_GROUPS:
+        levels = [f"{g}_{leg}" for leg in (*VIEW_LEGS, "net")]
+        out[f"{g}_has_data"] = df.reindex(columns=levels).notna().any(axis=1).to_numpy()
+        out[f"{g}_net_text"] = _map(fmt_num, _column(df, f"{g}_net"))
+        _parts_columns(out, f"{g}_net_delta", ("dir", "text"), _map(delta_arrow_parts, _column(df, f"{g}_net_chg_1w")))
+        _parts_columns(
+            out,
+            f"{g}_strength",
+            ("pct_text", "pct_color", "tip"),
+            _map(
+                move_strength_parts,
+                _column(df, f"{g}_net_chg_1w"),
+                _column(df, f"{g}_net_move_pct_all"),
+                _column(df, f"{g}_net_chg_1w_min_all"),
+                _column(df, f"{g}_net_chg_1w_max_all"),
+            ),
+        )
+        for leg in VIEW_LEGS:
+            out[f"{g}_{leg}_text"] = _map(fmt_num, _column(df, f"{g}_{leg}"))
+            _parts_columns(
+                out, f"{g}_{leg}_delta", ("dir", "text"), _map(delta_arrow_parts, _column(df, f"{g}_{leg}_chg_1w"))
+            )
+            out[f"{g}_{leg}_ma13_text"] = _map(fmt_num, _column(df, f"{g}_{leg}_ma_13w"))
+        for metric in HEATLINE_METRICS:
+            _heatline_columns(out, df, f"{g}_{metric}_ext", f"{g}_{metric}", f"{g}_{metric}", is_delta=False)
+            _heatline_columns(
+                out, df, f"{g}_{metric}_move", f"{g}_{metric}_chg_1w", f"{g}_{metric}_chg_1w", is_delta=True
+            )
+
+    views = pd.DataFrame(out)
+    logger.info(f"[views] built {len(views)} rows, {len(views.columns)} columns")
+    return views
+
+
+def market_view_record(row: dict) -> dict:
+    """View record for a single metrics row (sections rendered without the compute artifact)."""
+    frame = pd.DataFrame([row])
+    if "market_key" not in frame.columns:
+        frame["market_key"] = ""
+    if "report_date" not in frame.columns:
+        frame["report_date"] = pd.NaT
+    return build_market_view_weekly(frame).iloc[0].to_dict()
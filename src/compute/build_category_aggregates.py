@@ -0,0 +1,134 @@
+"""Build category- and portfolio-level aggregate positioning series."""
+
+from __future__ import annotations
+
+import logging
+import pandas as pd
+import numpy as np
+
+logger = logging.getLogger("cot_mvp")
+
+PORTFOLIO_CATEGORY = "ALL"
+
+GROUPS = ["nc", "comm", "nr"]
+Z_COLS = ["net_z_52w_funds", "net_z_52w_commercials", "oi_z_52w"]
+FLOW_PARTS = ["gross_chg_1w", "net_abs_chg_1w", "rotation_1w"]
+
+
+def _numeric(df: pd.DataFrame, col: str) -> pd.Series:
+    if col not in df.columns:
+        return pd.Series(np.nan, index=df.index, dtype="float64")
+    return pd.to_numeric(df[col], errors="coerce").astype("float64")
+
+
+def _ratio(num: pd.Series, den: pd.Series) -> np.ndarray:
+    return np.where(den > 0, num / den.where(den > 0), np.nan)
+
+
+def build_category_aggregates(
+    metrics: pd.DataFrame,
+    portfolio_category: str = PORTFOLIO_CATEGORY,
+) -> pd.DataFrame:
+    """
+    Build OI-weighted and equal-weighted composites per (category, report_date).
+
+    A portfolio composite across all markets is emitted with category == portfolio_category.
+
+    OI-weighted (`*_oiw`) values are ratios of sums, e.g. sum(nc_net) / sum(open_interest),
+    which equals the OI-weighted mean of per-market net % OI. Equal-weighted (`*_ew`)
+    values are plain means of the per-market metrics.
+
+    Args:
+        metrics: Wide metrics DataFrame (market_key, report_date, category, open_interest,
+            {group}_net, {group}_net_pct_oi, {group}_net_chg_1w, flows, z-scores)
+        portfolio_category: Category label used for the all-markets composite
+
+    Returns:
+        DataFrame with columns:
+        - Identity: category, report_date
+        - n_markets, open_interest (sum)
+        - {group}_net_pct_oi_oiw, {group}_net_pct_oi_ew
+        - {group}_flow_pct_oi_1w_oiw, {group}_flow_pct_oi_1w_ew
+        - {group}_{gross_chg_1w|net_abs_chg_1w|rotation_1w}_pct_oi_oiw
+        - {group}_rotation_share_1w_oiw (sum rotation / sum gross), {group}_rotation_share_1w_ew
+        - {z}_oiw, {z}_ew for net_z_52w_funds, net_z_52w_commercials, oi_z_52w
+    """
+    logger.info("[category_aggregates] building category composites...")
+
+    if metrics.empty:
+        return pd.DataFrame()
+
+    oi = _numeric(metrics, "open_interest")
+    oi = oi.where(oi > 0)
+
+    # Per-row numerators/denominators, masked so that sum(num) / sum(den) only
+    # uses markets where both sides are present.
+    parts: dict[str, pd.Series] = {
+        "category": metrics["category"].fillna("N/A").astype(str),
+        "report_date": pd.to_datetime(metrics["report_date"]).dt.tz_localize(None),
+        "market_key": metrics["market_key"].astype(str),
+        "open_interest": oi,
+    }
+    sum_cols: list[str] = ["open_interest"]
+    mean_cols: list[str] = []
+    ratios: dict[str, tuple[str, str]] = {}
+
+    def _add_ratio(name: str, num: pd.Series, den: pd.Series) -> None:
+        valid = num.notna() & den.notna()
+        parts[f"{name}__num"] = num.where(valid)
+        parts[f"{name}__den"] = den.where(valid)
+        sum_cols.extend([f"{name}__num", f"{name}__den"])
+        ratios[name] = (f"{name}__num", f"{name}__den")
+
+    def _add_mean(name: str, values: pd.Series) -> None:
+        parts[name] = values
+        mean_cols.append(name)
+
+    for group in GROUPS:
+        net = _numeric(metrics, f"{group}_net")
+        net_chg = _numeric(metrics, f"{group}_net_chg_1w")
+
+        _add_ratio(f"{group}_net_pct_oi_oiw", net, oi)
+        _add_mean(f"{group}_net_pct_oi_ew", pd.Series(_ratio(net, oi), index=metrics.index))
+
+        _add_ratio(f"{group}_flow_pct_oi_1w_oiw", net_chg, oi)
+        _add_mean(f"{group}_flow_pct_oi_1w_ew", pd.Series(_ratio(net_chg, oi), index=metrics.index))
+
+        for part in FLOW_PARTS:
+            _add_ratio(f"{group}_{part}_pct_oi_oiw", _numeric(metrics, f"{group}_{part}"), oi)
+
+        _add_ratio(
+            f"{group}_rotation_share_1w_oiw",
+            _numeric(metrics, f"{group}_rotation_1w"),
+            _numeric(metrics, f"{group}_gross_chg_1w"),
+        )
+        _add_mean(f"{group}_rotation_share_1w_ew", _numeric(metrics, f"{group}_rotation_share_1w"))
+
+    for z_col in Z_COLS:
+        z = _numeric(metrics, z_col)
+        _add_ratio(f"{z_col}_oiw", z * oi, oi)
+        _add_mean(f"{z_col}_ew", z)
+
+    rows = pd.DataFrame(parts)
+    portfolio = rows.assign(category=portfolio_category)
+    stacked = pd.concat([rows, portfolio], ignore_index=True)
+
+    # Single grouped reduction over (category, report_date)
+    agg_spec = {"market_key": "count", **{c: "sum" for c in sum_cols}, **{c: "mean" for c in mean_cols}}
+    agg = stacked.groupby(["category", "report_date"], sort=True).agg(agg_spec)
+
+    out = pd.DataFrame(index=agg.index)
+    out["n_markets"] = agg["market_key"].astype("int64")
+    out["open_interest"] = agg["open_interest"].astype("float64")
+    for name, (num_col, den_col) in ratios.items():
+        out[name] = _ratio(agg[num_col], agg[den_col]).astype("float64")
+    for name in mean_cols:
+        out[name] = agg[name].astype("float64")
+
+    out = out.reset_index()
+
+    logger.info(
+        f"[category_aggregates] built {len(out)} rows, "
+        f"{out['category'].nunique()} categories (incl. {portfolio_category})"
+    )
+    return out
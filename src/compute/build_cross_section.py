@@ -0,0 +1,81 @@
+"""Build cross-sectional (across markets) percentile ranks per report week."""
+
+from __future__ import annotations
+
+import logging
+import pandas as pd
+import numpy as np
+
+from src.common.cross_section import RANK_METRICS
+
+logger = logging.getLogger("cot_mvp")
+
+
+def build_cross_section_ranks(
+    metrics: pd.DataFrame,
+    radar_history: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Rank all markets against each other for every report_date.
+
+    Args:
+        metrics: Wide metrics DataFrame (market_key, report_date, category,
+            net_z_52w_funds, nc_net_pct_oi, oi_z_52w)
+        radar_history: Radar history DataFrame (market_id, report_date, hot_score)
+
+    Returns:
+        DataFrame in report_date-major order (report_date, hot_rank) with columns:
+        - Identity: report_date, market_key, category
+        - Values: net_z_52w_funds, nc_net_pct_oi, oi_z_52w, hot_score
+        - {metric}_pct_xs: percentile rank in (0, 1] across all markets that week
+        - {metric}_pct_cat: percentile rank in (0, 1] within the market's category that week
+        - n_markets: number of markets reported that week
+        - hot_rank: 1 = highest hot_score that week (ties share the lowest rank)
+    """
+    logger.info("[cross_section] building cross-sectional ranks...")
+
+    value_cols = [c for c in RANK_METRICS if c != "hot_score"]
+    base_cols = ["market_key", "report_date", "category"] + [c for c in value_cols if c in metrics.columns]
+    df = metrics[base_cols].copy()
+    df["market_key"] = df["market_key"].astype(str)
+    df["report_date"] = pd.to_datetime(df["report_date"]).dt.tz_localize(None)
+    for col in value_cols:
+        if col not in df.columns:
+            df[col] = np.nan
+
+    if not radar_history.empty and "hot_score" in radar_history.columns:
+        hot = radar_history[["market_id", "report_date", "hot_score"]].rename(columns={"market_id": "market_key"})
+        hot["market_key"] = hot["market_key"].astype(str)
+        hot["report_date"] = pd.to_datetime(hot["report_date"]).dt.tz_localize(None)
+        df = df.merge(hot, on=["market_key", "report_date"], how="left", validate="1:1")
+    else:
+        df["hot_score"] = np.nan
+
+    values = df[RANK_METRICS].apply(pd.to_numeric, errors="coerce").astype("float64")
+    df[RANK_METRICS] = values
+
+    # report_date-major layout: every week is one contiguous block
+    df = df.sort_values(["report_date", "market_key"], kind="stable").reset_index(drop=True)
+
+    by_week = df.groupby("report_date", sort=False)
+    pct_xs = by_week[RANK_METRICS].rank(method="average", pct=True)
+    pct_cat = df.groupby(["report_date", "category"], sort=False, dropna=False)[RANK_METRICS].rank(
+        method="average", pct=True
+    )
+
+    ranks = pd.DataFrame(
+        {
+            **{f"{col}_pct_xs": pct_xs[col].astype("float64") for col in RANK_METRICS},
+            **{f"{col}_pct_cat": pct_cat[col].astype("float64") for col in RANK_METRICS},
+            "n_markets": by_week["market_key"].transform("size").astype("int64"),
+            "hot_rank": by_week["hot_score"].rank(method="min", ascending=False).astype("float64"),
+        },
+        index=df.index,
+    )
+    out = pd.concat([df, ranks], axis=1)
+
+    out = out.sort_values(["report_date", "hot_rank", "market_key"], kind="stable", na_position="last")
+    out = out.reset_index(drop=True)
+
+    logger.info(f"[cross_section] built {len(out)} rows, {out['report_date'].nunique()} weeks")
+    return out
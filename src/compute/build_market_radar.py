@@ -1,4 +1,4 @@
-"""Build latest market radar view for UI."""
+"""Build market radar views (full history and latest) for UI."""
 
 from __future__ import annotations
 
@@ -6,45 +6,118 @@ import pandas as pd
 import numpy as np
 
 
-def build_market_radar_latest(
-    metrics: pd.DataFrame,
-    market_name_map: dict[str, str],
-) -> pd.DataFrame:
-    """
-    Build latest market radar dataset (one row per market_key).
+RADAR_OUT_COLS = [
+    "market_id",
+    "market_name",
+    "category",
+    "report_date",
+    "cot_traffic_signal",
+    "conflict_level",
+    "oi_regime",
+    "oi_z_52w",
+    "oi_risk_level",
+    "net_z_52w_funds",
+    "funds_net",
+    "funds_net_delta_1w",
+    "funds_pct_oi_change",
+    "funds_net_z_52w",
+    "comm_net",
+    "comm_net_delta_1w",
+    "comm_pct_oi_change",
+    "comm_net_z_52w",
+    "small_net",
+    "small_net_delta_1w",
+    "small_pct_oi_change",
+    "small_net_z_52w",
+    "open_interest",
+    "open_interest_chg_1w",
+    "open_interest_chg_1w_pct",
+    "funds_crowded",
+    "commercial_opposition",
+    "confirmed_imbalance",
+    "is_hot",
+    "hot_score",
+    "why_tags",
+]
 
-    Required input columns (from metrics):
-    - market_key, report_date, category
-    - cot_traffic_signal, conflict_level
-    - oi_regime, oi_z_52w, oi_risk_level
-    - net_z_52w_funds
-    """
-    if metrics.empty:
-        return pd.DataFrame()
+# Metrics columns read by the radar builders (used for projected reads).
+RADAR_SOURCE_COLS = [
+    "market_key",
+    "report_date",
+    "category",
+    "cot_traffic_signal",
+    "conflict_level",
+    "oi_regime",
+    "oi_z_52w",
+    "oi_risk_level",
+    "net_z_52w_funds",
+    "net_z_52w_commercials",
+    "nc_net",
+    "nc_net_chg_1w",
+    "nc_flow_pct_oi_1w",
+    "comm_net",
+    "comm_net_chg_1w",
+    "comm_flow_pct_oi_1w",
+    "nr_net",
+    "nr_net_chg_1w",
+    "nr_flow_pct_oi_1w",
+    "open_interest",
+    "open_interest_chg_1w",
+    "open_interest_chg_1w_pct",
+]
 
-    df = metrics.copy()
-    df["report_date"] = pd.to_datetime(df["report_date"]).dt.tz_localize(None)
+_REGIME_TAGS = {
+    "Expansion_Late": "OI: Expansion (Late)",
+    "Expansion_Early": "OI: Expansion (Early)",
+    "Distribution": "OI: Distribution",
+    "Rebuild": "OI: Rebuild",
+}
 
-    # Latest row per market_key
-    latest_dates = df.groupby("market_key")["report_date"].transform("max")
-    latest = df[df["report_date"] == latest_dates].copy()
+_MAX_TAGS = 4
+
+
+def _sign_with_eps(values: pd.Series) -> np.ndarray:
+    """Vectorized sign with a dead zone around zero (NaN -> 0)."""
+    arr = values.to_numpy(dtype="float64", na_value=np.nan)
+    sign = np.where(arr > 0, 1, -1)
+    return np.where(np.isnan(arr) | (np.abs(arr) < 1e-6), 0, sign)
 
-    latest["market_id"] = latest["market_key"].astype(str)
-    latest["market_name"] = latest["market_key"].map(market_name_map).fillna(latest["market_key"])
 
-    def _sign_with_eps(val: float) -> int:
-        if np.isnan(val):
-            return 0
-        if abs(val) < 1e-6:
-            return 0
-        return 1 if val > 0 else -1
+def _fmt_z(values: pd.Series, mask: pd.Series) -> pd.Series:
+    """Format z-scores as 'Z=+1.5' only where mask is True (empty string elsewhere)."""
+    out = pd.Series("", index=values.index, dtype=object)
+    if mask.any():
+        out[mask] = values[mask].map(lambda v: f"Z={float(v):+.1f}")
+    return out
+
+
+def _join_tags(tag_columns: list[pd.Series], index: pd.Index) -> pd.Series:
+    """Join per-row tags in priority order, keeping the first _MAX_TAGS non-empty ones."""
+    joined = pd.Series("", index=index, dtype=object)
+    count = np.zeros(len(index), dtype="int64")
+    for tags in tag_columns:
+        take = (tags != "").to_numpy() & (count < _MAX_TAGS)
+        if not take.any():
+            continue
+        prefix = np.where(count[take] > 0, " | ", "")
+        joined[take] = joined[take] + prefix + tags[take]
+        count += take
+    return joined
+
+
+def _build_radar_rows(rows: pd.DataFrame, market_name_map: dict[str, str]) -> pd.DataFrame:
+    """Derive radar columns for every row of `rows` (all operations are columnar)."""
+    out = rows.copy()
+
+    out["market_id"] = out["market_key"].astype(str)
+    out["market_name"] = out["market_key"].map(market_name_map).fillna(out["market_key"])
 
     # is_hot
-    cot_signal = pd.to_numeric(latest.get("cot_traffic_signal"), errors="coerce")
-    oi_z = pd.to_numeric(latest.get("oi_z_52w"), errors="coerce")
-    net_z = pd.to_numeric(latest.get("net_z_52w_funds"), errors="coerce")
-    conflict = latest.get("conflict_level").astype(str)
-    oi_risk = latest.get("oi_risk_level").astype(str)
+    cot_signal = pd.to_numeric(out.get("cot_traffic_signal"), errors="coerce")
+    oi_z = pd.to_numeric(out.get("oi_z_52w"), errors="coerce")
+    net_z = pd.to_numeric(out.get("net_z_52w_funds"), errors="coerce")
+    conflict = out.get("conflict_level").astype(str)
+    oi_risk = out.get("oi_risk_level").astype(str)
 
     hot_conditions = (
         (cot_signal.abs() >= 1)
@@ -53,7 +126,7 @@ def build_market_radar_latest(
         | (oi_z.abs() >= 1.5)
         | (net_z.abs() >= 1.5)
     )
-    latest["is_hot"] = hot_conditions.fillna(False).astype(bool)
+    out["is_hot"] = hot_conditions.fillna(False).astype(bool)
 
     # hot_score
     hot_score = 2 * cot_signal.abs().fillna(0)
@@ -62,125 +135,127 @@ def build_market_radar_latest(
     hot_score += 0.5 * (oi_risk == "Elevated").astype(float)
     hot_score += 1 * (oi_z.abs() >= 1.5).astype(float)
     hot_score += 1 * (net_z.abs() >= 1.5).astype(float)
-    latest["hot_score"] = hot_score.astype("float64")
+    out["hot_score"] = hot_score.astype("float64")
 
     # Crowding/opposition flags
-    net_z_comm = pd.to_numeric(latest.get("net_z_52w_commercials"), errors="coerce")
-    latest["funds_crowded"] = (net_z.abs() >= 1.5).fillna(False).astype(bool)
-    funds_sign = net_z.apply(_sign_with_eps)
-    comm_sign = net_z_comm.apply(_sign_with_eps)
-    latest["commercial_opposition"] = (
-        (funds_sign != 0) & (comm_sign == -funds_sign)
-    ).fillna(False).astype(bool)
-    latest["confirmed_imbalance"] = (
-        latest["funds_crowded"] & latest["commercial_opposition"]
-    ).fillna(False).astype(bool)
-
-    # why_tags
-    def _fmt_z(val: float | None) -> str:
-        if val is None or np.isnan(val):
-            return ""
-        return f"Z={val:+.1f}"
-
-    def _build_tags(row: pd.Series) -> str:
-        tags: list[str] = []
-
-        # Conflict
-        if row.get("conflict_level") == "High":
-            tags.append("High Conflict")
-
-        # Funds crowding
-        z_funds = pd.to_numeric(row.get("net_z_52w_funds"), errors="coerce")
-        if pd.notna(z_funds):
-            if abs(z_funds) >= 2.0:
-                tags.append(f"Funds Extreme ({_fmt_z(float(z_funds))})")
-            elif abs(z_funds) >= 1.5:
-                tags.append(f"Funds Crowded ({_fmt_z(float(z_funds))})")
-
-        # OI regime
-        oi_regime = row.get("oi_regime")
-        regime_map = {
-            "Expansion_Late": "OI: Expansion (Late)",
-            "Expansion_Early": "OI: Expansion (Early)",
-            "Distribution": "OI: Distribution",
-            "Rebuild": "OI: Rebuild",
-        }
-        if oi_regime in regime_map:
-            tags.append(regime_map[oi_regime])
-
-        # OI risk
-        oi_risk_level = row.get("oi_risk_level")
-        if oi_risk_level == "High":
-            tags.append("OI Risk: High")
-        elif oi_risk_level == "Elevated":
-            tags.append("OI Risk: Elevated")
-
-        # OI extreme (z)
-        z_oi = pd.to_numeric(row.get("oi_z_52w"), errors="coerce")
-        if pd.notna(z_oi):
-            if abs(z_oi) >= 2.0:
-                tags.append(f"OI Extreme ({_fmt_z(float(z_oi))})")
-            elif abs(z_oi) >= 1.5:
-                tags.append(f"OI Stretched ({_fmt_z(float(z_oi))})")
-
-        # Take first 2-4 by priority
-        tags = tags[:4]
-        return " | ".join(tags)
-
-    latest["why_tags"] = latest.apply(_build_tags, axis=1)
+    net_z_comm = pd.to_numeric(out.get("net_z_52w_commercials"), errors="coerce")
+    out["funds_crowded"] = (net_z.abs() >= 1.5).fillna(False).astype(bool)
+    funds_sign = _sign_with_eps(net_z)
+    comm_sign = _sign_with_eps(net_z_comm)
+    out["commercial_opposition"] = (funds_sign != 0) & (comm_sign == -funds_sign)
+    out["confirmed_imbalance"] = (out["funds_crowded"] & out["commercial_opposition"]).astype(bool)
+
+    # why_tags (priority order: conflict, funds crowding, OI regime, OI risk, OI extreme)
+    conflict_raw = out.get("conflict_level")
+    regime_raw = out.get("oi_regime")
+    risk_raw = out.get("oi_risk_level")
+
+    conflict_tag = pd.Series(np.where(conflict_raw == "High", "High Conflict", ""), index=out.index, dtype=object)
+
+    z_funds_abs = net_z.abs()
+    funds_extreme = (z_funds_abs >= 2.0).fillna(False)
+    funds_crowded = ((z_funds_abs >= 1.5) & ~funds_extreme).fillna(False)
+    funds_z_txt = _fmt_z(net_z, funds_extreme | funds_crowded)
+    funds_tag = pd.Series("", index=out.index, dtype=object)
+    funds_tag[funds_extreme] = "Funds Extreme (" + funds_z_txt[funds_extreme] + ")"
+    funds_tag[funds_crowded] = "Funds Crowded (" + funds_z_txt[funds_crowded] + ")"
+
+    regime_tag = regime_raw.map(_REGIME_TAGS).fillna("").astype(object)
+
+    risk_tag = pd.Series(
+        np.select([risk_raw == "High", risk_raw == "Elevated"], ["OI Risk: High", "OI Risk: Elevated"], default=""),
+        index=out.index,
+        dtype=object,
+    )
+
+    z_oi_abs = oi_z.abs()
+    oi_extreme = (z_oi_abs >= 2.0).fillna(False)
+    oi_stretched = ((z_oi_abs >= 1.5) & ~oi_extreme).fillna(False)
+    oi_z_txt = _fmt_z(oi_z, oi_extreme | oi_stretched)
+    oi_tag = pd.Series("", index=out.index, dtype=object)
+    oi_tag[oi_extreme] = "OI Extreme (" + oi_z_txt[oi_extreme] + ")"
+    oi_tag[oi_stretched] = "OI Stretched (" + oi_z_txt[oi_stretched] + ")"
+
+    out["why_tags"] = _join_tags([conflict_tag, funds_tag, regime_tag, risk_tag, oi_tag], out.index).astype(str)
 
     # Output selection
-    out_cols = [
-        "market_id",
-        "market_name",
-        "category",
-        "report_date",
-        "cot_traffic_signal",
-        "conflict_level",
-        "oi_regime",
-        "oi_z_52w",
-        "oi_risk_level",
-        "net_z_52w_funds",
-        "funds_net",
-        "funds_net_delta_1w",
-        "funds_pct_oi_change",
-        "funds_net_z_52w",
-        "comm_net",
-        "comm_net_delta_1w",
-        "comm_pct_oi_change",
-        "comm_net_z_52w",
-        "small_net",
-        "small_net_delta_1w",
-        "small_pct_oi_change",
-        "small_net_z_52w",
-        "open_interest",
-        "open_interest_chg_1w",
-        "open_interest_chg_1w_pct",
-        "funds_crowded",
-        "commercial_opposition",
-        "confirmed_imbalance",
-        "is_hot",
-        "hot_score",
-        "why_tags",
-    ]
-    for col in out_cols:
-        if col not in latest.columns:
-            latest[col] = np.nan
-
-    latest["funds_net"] = latest.get("nc_net")
-    latest["funds_net_delta_1w"] = latest.get("nc_net_chg_1w")
-    latest["funds_pct_oi_change"] = latest.get("nc_flow_pct_oi_1w")
-    latest["funds_net_z_52w"] = latest.get("net_z_52w_funds")
-
-    latest["comm_net"] = latest.get("comm_net")
-    latest["comm_net_delta_1w"] = latest.get("comm_net_chg_1w")
-    latest["comm_pct_oi_change"] = latest.get("comm_flow_pct_oi_1w")
-    latest["comm_net_z_52w"] = latest.get("net_z_52w_commercials")
-
-    latest["small_net"] = latest.get("nr_net")
-    latest["small_net_delta_1w"] = latest.get("nr_net_chg_1w")
-    latest["small_pct_oi_change"] = latest.get("nr_flow_pct_oi_1w")
-    latest["small_net_z_52w"] = np.nan
-
-    return latest[out_cols].reset_index(drop=True)
+    for col in RADAR_OUT_COLS:
+        if col not in out.columns:
+            out[col] = np.nan
+
+    out["funds_net"] = out.get("nc_net")
+    out["funds_net_delta_1w"] = out.get("nc_net_chg_1w")
+    out["funds_pct_oi_change"] = out.get("nc_flow_pct_oi_1w")
+    out["funds_net_z_52w"] = out.get("net_z_52w_funds")
+
+    out["comm_net"] = out.get("comm_net")
+    out["comm_net_delta_1w"] = out.get("comm_net_chg_1w")
+    out["comm_pct_oi_change"] = out.get("comm_flow_pct_oi_1w")
+    out["comm_net_z_52w"] = out.get("net_z_52w_commercials")
+
+    out["small_net"] = out.get("nr_net")
+    out["small_net_delta_1w"] = out.get("nr_net_chg_1w")
+    out["small_pct_oi_change"] = out.get("nr_flow_pct_oi_1w")
+    out["small_net_z_52w"] = np.nan
+
+    return out[RADAR_OUT_COLS].reset_index(drop=True)
+
+
+def _prepare_metrics(metrics: pd.DataFrame) -> pd.DataFrame:
+    cols = [c for c in RADAR_SOURCE_COLS if c in metrics.columns]
+    df = metrics[cols].copy()
+    df["report_date"] = pd.to_datetime(df["report_date"]).dt.tz_localize(None)
+    return df
+
+
+def build_market_radar_history(
+    metrics: pd.DataFrame,
+    market_name_map: dict[str, str],
+) -> pd.DataFrame:
+    """
+    Build market radar dataset for every (market_key, report_date).
+
+    Same columns as build_market_radar_latest, one row per market and week,
+    sorted by market_id, report_date. The latest view is a slice of this
+    frame (see latest_radar_from_history).
+    """
+    if metrics.empty:
+        return pd.DataFrame()
+
+    df = _prepare_metrics(metrics)
+    df = df.sort_values(["market_key", "report_date"], kind="stable")
+    return _build_radar_rows(df, market_name_map)
+
+
+def latest_radar_from_history(history: pd.DataFrame) -> pd.DataFrame:
+    """Slice the latest report_date per market_id from a radar history frame."""
+    if history.empty:
+        return history.copy()
+
+    latest_dates = history.groupby("market_id")["report_date"].transform("max")
+    return history[history["report_date"] == latest_dates].reset_index(drop=True)
+
+
+def build_market_radar_latest(
+    metrics: pd.DataFrame,
+    market_name_map: dict[str, str],
+) -> pd.DataFrame:
+    """
+    Build latest market radar dataset (one row per market_key).
+
+    Required input columns (from metrics):
+    - market_key, report_date, category
+    - cot_traffic_signal, conflict_level
+    - oi_regime, oi_z_52w, oi_risk_level
+    - net_z_52w_funds
+    """
+    if metrics.empty:
+        return pd.DataFrame()
+
+    df = _prepare_metrics(metrics)
+
+    # Latest row per market_key
+    latest_dates = df.groupby("market_key")["report_date"].transform("max")
+    latest = df[df["report_date"] == latest_dates]
 
+    return _build_radar_rows(latest, market_name_map)
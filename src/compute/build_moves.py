@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import logging
 import pandas as pd
-import numpy as np
+
+from src.compute.rolling_windows import DEFAULT_WINDOWS, RollingEngine, WindowSpec
 
 logger = logging.getLogger("cot_mvp")
 
 
-def build_moves_weekly(changes_df: pd.DataFrame) -> pd.DataFrame:
+def build_moves_weekly(changes_df: pd.DataFrame, windows: list[WindowSpec] | None = None) -> pd.DataFrame:
     """
     Build moves table with percentile rankings of absolute week-over-week changes.
     
@@ -18,14 +19,17 @@ def build_moves_weekly(changes_df: pd.DataFrame) -> pd.DataFrame:
     
     Args:
         changes_df: Changes DataFrame with market_key, report_date, *_chg_1w columns
+        windows: Trailing windows (defaults to DEFAULT_WINDOWS["moves"], i.e. 5y = 260 weeks,
+            min_periods=52)
     
     Returns:
         DataFrame with columns:
         - Identity: market_key, report_date
         - Move percentiles (all-time): {group}_{metric}_move_pct_all
-        - Move percentiles (5Y=260w): {group}_{metric}_move_pct_5y
+        - Move percentiles (trailing): {group}_{metric}_move_pct_{label}
     """
     logger.info("[moves] building moves table with percentile rankings...")
+    specs = DEFAULT_WINDOWS["moves"] if windows is None else windows
     
     # Ensure sorted by market_key, report_date
     df = changes_df.sort_values(["market_key", "report_date"]).reset_index(drop=True).copy()
@@ -39,61 +43,31 @@ def build_moves_weekly(changes_df: pd.DataFrame) -> pd.DataFrame:
     # Groups and metrics to process
     groups = ["nc", "comm", "nr"]
     metrics = ["long", "short", "total", "net"]
+    chg_cols = [
+        f"{group}_{metric}_chg_1w"
+        for group in groups
+        for metric in metrics
+        if f"{group}_{metric}_chg_1w" in df.columns
+    ]
     
-    for group in groups:
-        for metric in metrics:
-            chg_col = f"{group}_{metric}_chg_1w"
-            
-            # Skip if column doesn't exist
-            if chg_col not in df.columns:
-                continue
-            
-            # For each market_key, calculate percentile rank of absolute change (all-time)
-            # Formula: rank(abs(chg_1w_t)) / count(non-null abs(chg_1w))
-            # rank(method='min') gives 1-based rank, divide by total count to get [0, 1] percentile
-            def calc_percentile(x):
-                abs_vals = x.abs()
-                non_null_count = abs_vals.notna().sum()
-                if non_null_count == 0:
-                    return pd.Series(np.nan, index=x.index)
-                # rank(method='min') gives 1-based ranks (1, 2, 3, ...)
-                # To get percentile in [0, 1], we use: (rank - 1) / (count - 1)
-                # But if count == 1, then rank=1, percentile should be 1.0 (or 0.0?)
-                # Standard percentile formula: rank / count gives [0, 1]
-                ranks = abs_vals.rank(method="min", na_option="keep")
-                # Divide by non_null_count to get percentile in [0, 1]
-                # When rank=1 and count=1: 1/1 = 1.0 (100th percentile, highest)
-                # When rank=1 and count=10: 1/10 = 0.1 (10th percentile)
-                # When rank=10 and count=10: 10/10 = 1.0 (100th percentile)
-                return ranks / non_null_count
-            
-            move_pct = df.groupby("market_key")[chg_col].transform(calc_percentile)
-            
-            # Set to NaN where original chg_1w is NaN
-            move_pct = move_pct.where(df[chg_col].notna(), np.nan)
-            
-            # Store result
-            result_col = f"{group}_{metric}_move_pct_all"
-            moves[result_col] = move_pct.astype("float64")
-
-            # 5Y percentile (260-week rolling window, min_periods=52)
-            def calc_rolling_percentile(window_vals: np.ndarray) -> float:
-                target = window_vals[-1]
-                if np.isnan(target):
-                    return np.nan
-                valid = window_vals[~np.isnan(window_vals)]
-                if len(valid) == 0:
-                    return np.nan
-                rank = np.sum(valid <= target)
-                return rank / len(valid)
-
-            abs_series = df[chg_col].abs()
-            move_pct_5y = (
-                abs_series.groupby(df["market_key"])
-                .transform(lambda x: x.rolling(window=260, min_periods=52).apply(calc_rolling_percentile, raw=True))
-            )
-            move_pct_5y = move_pct_5y.where(df[chg_col].notna(), np.nan)
-            moves[f"{group}_{metric}_move_pct_5y"] = move_pct_5y.astype("float64")
+    abs_chg = df[chg_cols].apply(pd.to_numeric, errors="coerce").astype("float64").abs()
+    
+    # All-time percentile: rank(method='min') gives 1-based ranks, divided by the
+    # non-null count per market -> (0, 1], NaN where chg_1w is NaN
+    by_market = abs_chg.groupby(df["market_key"])
+    ranks = by_market.rank(method="min", na_option="keep")
+    counts = by_market.transform("count")
+    move_pct_all = ranks / counts.where(counts > 0)
+    
+    # Trailing percentile: count(window <= x_t) / count(window non-null)
+    engine = RollingEngine(df["market_key"])
+    trailing = engine.rolling_pct_rank(abs_chg, specs)
+    
+    for chg_col in chg_cols:
+        base = chg_col[: -len("_chg_1w")]
+        moves[f"{base}_move_pct_all"] = move_pct_all[chg_col].astype("float64")
+        for spec in specs:
+            moves[f"{base}_move_pct_{spec.label}"] = trailing[(chg_col, spec.label)].astype("float64")
     
     logger.info(f"[moves] built {len(moves)} rows, {len(moves.columns)} columns")
     
@@ -4,26 +4,29 @@ from __future__ import annotations
 
 import logging
 import pandas as pd
-import numpy as np
+
+from src.compute.rolling_windows import DEFAULT_WINDOWS, RollingEngine, WindowSpec
 
 logger = logging.getLogger("cot_mvp")
 
 
-def build_rolling(positions: pd.DataFrame) -> pd.DataFrame:
+def build_rolling(positions: pd.DataFrame, windows: list[WindowSpec] | None = None) -> pd.DataFrame:
     """
-    Build rolling averages table with 13-week moving averages.
+    Build rolling averages table with moving averages per configured window.
     
     Args:
         positions: Positions DataFrame with market_key, report_date, nc_long, nc_short, etc.
+        windows: Moving-average windows (defaults to DEFAULT_WINDOWS["rolling_ma"], i.e. 13w)
     
     Returns:
         DataFrame with columns:
         - Identity: market_key, report_date
-        - NC rolling: nc_long_ma_13w, nc_short_ma_13w, nc_total_ma_13w, nc_net_ma_13w
-        - COMM rolling: comm_long_ma_13w, comm_short_ma_13w, comm_total_ma_13w, comm_net_ma_13w
-        - NR rolling: nr_long_ma_13w, nr_short_ma_13w, nr_total_ma_13w, nr_net_ma_13w
+        - NC rolling: nc_long_ma_{label}, nc_short_ma_{label}, nc_total_ma_{label}, nc_net_ma_{label}
+        - COMM rolling: comm_long_ma_{label}, comm_short_ma_{label}, comm_total_ma_{label}, comm_net_ma_{label}
+        - NR rolling: nr_long_ma_{label}, nr_short_ma_{label}, nr_total_ma_{label}, nr_net_ma_{label}
     """
     logger.info("[rolling] building rolling averages table...")
+    specs = DEFAULT_WINDOWS["rolling_ma"] if windows is None else windows
     
     # Ensure sorted by market_key, report_date
     df = positions.sort_values(["market_key", "report_date"]).reset_index(drop=True).copy()
@@ -37,24 +40,15 @@ def build_rolling(positions: pd.DataFrame) -> pd.DataFrame:
     # Groups to process
     groups = ["nc", "comm", "nr"]
     metrics = ["long", "short", "total", "net"]
+    cols = [f"{group}_{metric}" for group in groups for metric in metrics if f"{group}_{metric}" in df.columns]
+    
+    # One pass over each market block for all columns and windows
+    engine = RollingEngine(df["market_key"])
+    means = engine.rolling(df[cols], specs, ("mean",))
     
-    for group in groups:
-        for metric in metrics:
-            col_name = f"{group}_{metric}"
-            
-            # Skip if column doesn't exist
-            if col_name not in df.columns:
-                continue
-            
-            # Calculate 13-week moving average per market_key
-            # Rolling window = 13, min_periods = 1 (allow fewer than 13 if needed)
-            rolling[f"{col_name}_ma_13w"] = (
-                df.groupby("market_key")[col_name]
-                .transform(lambda x: x.rolling(window=13, min_periods=1).mean())
-            )
-            
-            # Convert to float64
-            rolling[f"{col_name}_ma_13w"] = pd.to_numeric(rolling[f"{col_name}_ma_13w"], errors="coerce").astype("float64")
+    for col_name in cols:
+        for spec in specs:
+            rolling[f"{col_name}_ma_{spec.label}"] = means[(col_name, "mean", spec.label)].astype("float64")
     
     logger.info(f"[rolling] built {len(rolling)} rows, {len(rolling.columns)} columns")
     logger.info(f"[rolling] columns: {list(rolling.columns)}")
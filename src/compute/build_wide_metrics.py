@@ -6,8 +6,13 @@ import logging
 import pandas as pd
 import numpy as np
 
+from src.compute.rolling_windows import RollingEngine, WindowSpec, range_position, resolve_windows, zscore
+
 logger = logging.getLogger("cot_mvp")
 
+# Fixed lookback for signal thresholds (activity p75, OI regime small-move median)
+SIGNAL_WINDOW = WindowSpec("52w", 52, 26)
+
 
 def build_wide_metrics(
     positions: pd.DataFrame,
@@ -19,6 +24,7 @@ def build_wide_metrics(
     canonical: pd.DataFrame,
     market_to_category: dict[str, str],
     market_to_contract: dict[str, str],
+    windows: dict[str, list[WindowSpec]] | None = None,
 ) -> pd.DataFrame:
     """
     Build wide metrics table as join of semantic tables.
@@ -33,12 +39,17 @@ def build_wide_metrics(
         canonical: Canonical DataFrame (for open_interest_all, contract_code)
         market_to_category: Mapping from market_key to category
         market_to_contract: Mapping from market_key to contract_code
+        windows: Window specs per family ("extremes", "moves", "zscore"); defaults to DEFAULT_WINDOWS
     
     Returns:
         Wide DataFrame with all columns from positions, changes, flows, rolling, extremes, moves
         plus category, contract_code, open_interest, spec_vs_hedge_net
     """
     logger.info("[wide_metrics] building wide metrics table as join of semantic tables...")
+    windows = resolve_windows(windows)
+    ext_specs = windows["extremes"]
+    mov_specs = windows["moves"]
+    z_specs = windows["zscore"]
     
     # Normalize keys before join
     # Ensure all DataFrames have consistent key types
@@ -157,11 +168,13 @@ def build_wide_metrics(
     canonical_oi.columns = ["market_key", "report_date", "open_interest"]
     wide = wide.merge(canonical_oi, on=join_keys, how="left", validate="1:1")
     
+    # Sort once by (market_key, report_date): shift/diff below and the shared
+    # rolling engine both rely on each market being one contiguous, ordered block.
+    wide = wide.sort_values(["market_key", "report_date"]).reset_index(drop=True)
+    engine = RollingEngine(wide["market_key"])
+
     # Calculate Open Interest weekly change metrics (if open_interest exists)
     if "open_interest" in wide.columns:
-        # Ensure sorted by market_key and report_date for shift to work correctly
-        wide = wide.sort_values(["market_key", "report_date"]).reset_index(drop=True)
-        
         # Calculate absolute change: current - previous week (using diff)
         wide["open_interest_chg_1w"] = wide.groupby("market_key")["open_interest"].diff(1)
         
@@ -177,118 +190,56 @@ def build_wide_metrics(
             np.nan
         )
         
-        # Calculate Open Interest positioning metrics (ALL window and 5Y rolling window)
-        # ALL window: min/max/pos across entire history per market_key
-        oi_current = pd.to_numeric(wide["open_interest"], errors="coerce")
-        min_oi_all = wide.groupby("market_key")["open_interest"].transform("min")
-        max_oi_all = wide.groupby("market_key")["open_interest"].transform("max")
-        diff_oi_all = max_oi_all - min_oi_all
-        # Calculate position: (current - min) / (max - min)
-        # If min == max, set to 0.5 (as per requirements)
-        pos_oi_all = np.where(
-            diff_oi_all > 0,
-            (oi_current - min_oi_all) / diff_oi_all,
-            np.where(oi_current.notna(), 0.5, np.nan)  # If min == max and current is not NaN, set to 0.5
-        )
-        wide["open_interest_pos_all"] = pos_oi_all
+        # Calculate Open Interest positioning metrics (ALL window and trailing extremes windows)
+        # Position: (current - min) / (max - min); 0.5 if min == max
+        oi_series = pd.to_numeric(wide["open_interest"], errors="coerce").astype("float64")
+        oi_frame = pd.DataFrame({"open_interest": oi_series})
+        min_oi_all = engine.group_reduce(oi_frame, "min")["open_interest"]
+        max_oi_all = engine.group_reduce(oi_frame, "max")["open_interest"]
+        wide["open_interest_pos_all"] = range_position(oi_series, min_oi_all, max_oi_all)
         
-        # 5Y rolling window: 260 weeks, min_periods=52
-        min_oi_5y = wide.groupby("market_key")["open_interest"].transform(
-            lambda x: x.rolling(window=260, min_periods=52).min()
-        )
-        max_oi_5y = wide.groupby("market_key")["open_interest"].transform(
-            lambda x: x.rolling(window=260, min_periods=52).max()
-        )
-        diff_oi_5y = max_oi_5y - min_oi_5y
-        # Calculate position: (current - min_5y) / (max_5y - min_5y)
-        # If min_5y == max_5y (and both are not NaN), set to 0.5
-        pos_oi_5y = np.where(
-            (diff_oi_5y > 0) & min_oi_5y.notna() & max_oi_5y.notna(),
-            (oi_current - min_oi_5y) / diff_oi_5y,
-            np.where(
-                (diff_oi_5y == 0) & min_oi_5y.notna() & max_oi_5y.notna() & oi_current.notna(),
-                0.5,  # If min == max and current is not NaN, set to 0.5
-                np.nan
+        oi_ext = engine.rolling(oi_frame, ext_specs, ("min", "max"))
+        for spec in ext_specs:
+            wide[f"open_interest_pos_{spec.label}"] = range_position(
+                oi_series,
+                oi_ext[("open_interest", "min", spec.label)],
+                oi_ext[("open_interest", "max", spec.label)],
             )
-        )
-        wide["open_interest_pos_5y"] = pos_oi_5y
-        
-        # Convert to float64
-        wide["open_interest_pos_all"] = pd.to_numeric(wide["open_interest_pos_all"], errors="coerce").astype("float64")
-        wide["open_interest_pos_5y"] = pd.to_numeric(wide["open_interest_pos_5y"], errors="coerce").astype("float64")
-
-        # Open Interest percentile ranks (all-time and 5Y)
-        def calc_percentile_rank(x: pd.Series) -> pd.Series:
-            valid = x.dropna()
-            count = len(valid)
-            if count == 0:
-                return pd.Series(np.nan, index=x.index)
-            ranks = x.rank(method="min", na_option="keep")
-            return ranks / count
-
-        def calc_rolling_percentile(window_vals: np.ndarray) -> float:
-            target = window_vals[-1]
-            if np.isnan(target):
-                return np.nan
-            valid = window_vals[~np.isnan(window_vals)]
-            if len(valid) == 0:
-                return np.nan
-            rank = np.sum(valid <= target)
-            return rank / len(valid)
 
-        oi_series = pd.to_numeric(wide["open_interest"], errors="coerce").astype("float64")
-        wide["open_interest_pct_all"] = (
-            oi_series.groupby(wide["market_key"]).transform(calc_percentile_rank).astype("float64")
-        )
-        wide["open_interest_pct_5y"] = (
-            oi_series.groupby(wide["market_key"])
-            .transform(lambda x: x.rolling(window=260, min_periods=52).apply(calc_rolling_percentile, raw=True))
-            .astype("float64")
-        )
+        # Open Interest percentile ranks (all-time and trailing moves windows)
+        # All-time: rank(method='min') / count(non-null); trailing: count(window <= x_t) / count(window)
+        oi_chg_pct_abs = pd.to_numeric(wide["open_interest_chg_1w_pct"], errors="coerce").astype("float64").abs()
+        pct_frame = pd.DataFrame({"oi": oi_series, "oi_chg_abs": oi_chg_pct_abs})
+        by_market = pct_frame.groupby(wide["market_key"])
+        pct_all = by_market.rank(method="min", na_option="keep") / by_market.transform("count")
+        pct_trailing = engine.rolling_pct_rank(pct_frame, mov_specs)
+
+        wide["open_interest_pct_all"] = pct_all["oi"].astype("float64")
+        for spec in mov_specs:
+            wide[f"open_interest_pct_{spec.label}"] = pct_trailing[("oi", spec.label)]
 
         # OI change percentile ranks (based on abs(open_interest_chg_1w_pct))
-        oi_chg_pct_abs = pd.to_numeric(wide["open_interest_chg_1w_pct"], errors="coerce").abs()
-        wide["open_interest_chg_pct_rank_all"] = (
-            oi_chg_pct_abs.groupby(wide["market_key"]).transform(calc_percentile_rank).astype("float64")
-        )
-        wide["open_interest_chg_pct_rank_5y"] = (
-            oi_chg_pct_abs.groupby(wide["market_key"])
-            .transform(lambda x: x.rolling(window=260, min_periods=52).apply(calc_rolling_percentile, raw=True))
-            .astype("float64")
-        )
+        wide["open_interest_chg_pct_rank_all"] = pct_all["oi_chg_abs"].astype("float64")
+        for spec in mov_specs:
+            wide[f"open_interest_chg_pct_rank_{spec.label}"] = pct_trailing[("oi_chg_abs", spec.label)]
 
         # OI change z-scores (based on open_interest_chg_1w_pct)
         oi_chg_pct = pd.to_numeric(wide["open_interest_chg_1w_pct"], errors="coerce").astype("float64")
-        z_52_mean = oi_chg_pct.groupby(wide["market_key"]).transform(
-            lambda x: x.rolling(window=52, min_periods=26).mean()
-        )
-        z_52_std = oi_chg_pct.groupby(wide["market_key"]).transform(
-            lambda x: x.rolling(window=52, min_periods=26).std(ddof=0)
-        )
-        wide["open_interest_chg_z_52w"] = np.where(
-            z_52_std > 0,
-            (oi_chg_pct - z_52_mean) / z_52_std,
-            np.nan,
-        ).astype("float64")
-
-        z_260_mean = oi_chg_pct.groupby(wide["market_key"]).transform(
-            lambda x: x.rolling(window=260, min_periods=52).mean()
-        )
-        z_260_std = oi_chg_pct.groupby(wide["market_key"]).transform(
-            lambda x: x.rolling(window=260, min_periods=52).std(ddof=0)
-        )
-        wide["open_interest_chg_z_260w"] = np.where(
-            z_260_std > 0,
-            (oi_chg_pct - z_260_mean) / z_260_std,
-            np.nan,
-        ).astype("float64")
+        chg_z = engine.rolling(pd.DataFrame({"oi_chg_pct": oi_chg_pct}), z_specs, ("mean", "std"))
+        for spec in z_specs:
+            wide[f"open_interest_chg_z_{spec.label}"] = zscore(
+                oi_chg_pct,
+                chg_z[("oi_chg_pct", "mean", spec.label)],
+                chg_z[("oi_chg_pct", "std", spec.label)],
+            )
 
         # OI regime and strength (based on change sign + change percentile)
         chg = oi_chg_pct
         regime = np.where(chg > 0, "Expansion", np.where(chg < 0, "Contraction", "Flat"))
         regime = np.where(chg.notna(), regime, "N/A")
         wide["open_interest_regime_all"] = regime
-        wide["open_interest_regime_5y"] = regime
+        for spec in mov_specs:
+            wide[f"open_interest_regime_{spec.label}"] = regime
 
         def strength_label(pct_series: pd.Series) -> pd.Series:
             return pd.Series(
@@ -301,23 +252,31 @@ def build_wide_metrics(
             )
 
         wide["open_interest_regime_strength_all"] = strength_label(wide["open_interest_chg_pct_rank_all"])
-        wide["open_interest_regime_strength_5y"] = strength_label(wide["open_interest_chg_pct_rank_5y"])
+        for spec in mov_specs:
+            wide[f"open_interest_regime_strength_{spec.label}"] = strength_label(
+                wide[f"open_interest_chg_pct_rank_{spec.label}"]
+            )
     else:
         # If open_interest column doesn't exist, set all OI metrics to NaN
         wide["open_interest_chg_1w"] = np.nan
         wide["open_interest_chg_1w_pct"] = np.nan
         wide["open_interest_pos_all"] = np.nan
-        wide["open_interest_pos_5y"] = np.nan
+        for spec in ext_specs:
+            wide[f"open_interest_pos_{spec.label}"] = np.nan
         wide["open_interest_pct_all"] = np.nan
-        wide["open_interest_pct_5y"] = np.nan
+        for spec in mov_specs:
+            wide[f"open_interest_pct_{spec.label}"] = np.nan
         wide["open_interest_chg_pct_rank_all"] = np.nan
-        wide["open_interest_chg_pct_rank_5y"] = np.nan
-        wide["open_interest_chg_z_52w"] = np.nan
-        wide["open_interest_chg_z_260w"] = np.nan
+        for spec in mov_specs:
+            wide[f"open_interest_chg_pct_rank_{spec.label}"] = np.nan
+        for spec in z_specs:
+            wide[f"open_interest_chg_z_{spec.label}"] = np.nan
         wide["open_interest_regime_all"] = "N/A"
-        wide["open_interest_regime_5y"] = "N/A"
+        for spec in mov_specs:
+            wide[f"open_interest_regime_{spec.label}"] = "N/A"
         wide["open_interest_regime_strength_all"] = "N/A"
-        wide["open_interest_regime_strength_5y"] = "N/A"
+        for spec in mov_specs:
+            wide[f"open_interest_regime_strength_{spec.label}"] = "N/A"
         logger.warning("[wide_metrics] open_interest missing, setting OI metrics to NaN")
     
     # Calculate spec_vs_hedge_net (nc_net - comm_net) if both exist
@@ -333,11 +292,6 @@ def build_wide_metrics(
     # Calculate OI-based metrics: Funds, Commercials, and Non-Reported Net % OI
     logger.info("[wide_metrics] calculating OI-based metrics...")
     
-    # Note: wide is already sorted above if open_interest was processed
-    # If open_interest doesn't exist, ensure sorted for percentile calculations
-    if "open_interest" not in wide.columns:
-        wide = wide.sort_values(["market_key", "report_date"]).reset_index(drop=True)
-    
     # Funds Net % OI: nc_net_pct_oi = nc_net / open_interest
     if "nc_net" in wide.columns and "open_interest" in wide.columns:
         # Convert to numeric
@@ -407,52 +361,26 @@ def build_wide_metrics(
         logger.warning("[wide_metrics] nc_net_chg_1w or open_interest missing, setting nc_flow_pct_oi_1w to NaN")
     
     # Calculate percentile/position metrics for OI-based metrics
-    oi_metrics = ["nc_net_pct_oi", "comm_net_pct_oi", "nr_net_pct_oi", "nc_flow_pct_oi_1w"]
+    oi_metrics = [c for c in ["nc_net_pct_oi", "comm_net_pct_oi", "nr_net_pct_oi", "nc_flow_pct_oi_1w"] if c in wide.columns]
+    oi_metric_values = wide[oi_metrics].apply(pd.to_numeric, errors="coerce").astype("float64")
+    oi_metric_min_all = engine.group_reduce(oi_metric_values, "min")
+    oi_metric_max_all = engine.group_reduce(oi_metric_values, "max")
+    oi_metric_ext = engine.rolling(oi_metric_values, ext_specs, ("min", "max"))
     
     for metric_col in oi_metrics:
-        if metric_col not in wide.columns:
-            continue
-        
-        # ALL-TIME percentile/position
-        min_all = wide.groupby("market_key")[metric_col].transform("min")
-        max_all = wide.groupby("market_key")[metric_col].transform("max")
-        
-        # Calculate position: (current - min) / (max - min)
-        # If min == max, set to 0.5 (as per requirements)
-        current = wide[metric_col]
-        diff = max_all - min_all
-        pos_all = np.where(
-            diff > 0,
-            (current - min_all) / diff,
-            np.where(current.notna(), 0.5, np.nan)  # If min == max and current is not NaN, set to 0.5
+        # ALL-TIME position: (current - min) / (max - min); 0.5 if min == max
+        current = oi_metric_values[metric_col]
+        wide[f"{metric_col}_pos_all"] = range_position(
+            current, oi_metric_min_all[metric_col], oi_metric_max_all[metric_col]
         )
-        wide[f"{metric_col}_pos_all"] = pos_all
         
-        # 5Y trailing window percentile/position (260 weeks, min_periods=52)
-        min_5y = wide.groupby("market_key")[metric_col].transform(
-            lambda x: x.rolling(window=260, min_periods=52).min()
-        )
-        max_5y = wide.groupby("market_key")[metric_col].transform(
-            lambda x: x.rolling(window=260, min_periods=52).max()
-        )
-        
-        # Calculate position: (current - min_5y) / (max_5y - min_5y)
-        # If min_5y == max_5y (and both are not NaN), set to 0.5
-        diff_5y = max_5y - min_5y
-        pos_5y = np.where(
-            (diff_5y > 0) & min_5y.notna() & max_5y.notna(),
-            (current - min_5y) / diff_5y,
-            np.where(
-                (diff_5y == 0) & min_5y.notna() & max_5y.notna() & current.notna(),
-                0.5,  # If min == max and current is not NaN, set to 0.5
-                np.nan
+        # Trailing window positions (extremes windows)
+        for spec in ext_specs:
+            wide[f"{metric_col}_pos_{spec.label}"] = range_position(
+                current,
+                oi_metric_ext[(metric_col, "min", spec.label)],
+                oi_metric_ext[(metric_col, "max", spec.label)],
             )
-        )
-        wide[f"{metric_col}_pos_5y"] = pos_5y
-        
-        # Convert to float64
-        wide[f"{metric_col}_pos_all"] = pd.to_numeric(wide[f"{metric_col}_pos_all"], errors="coerce").astype("float64")
-        wide[f"{metric_col}_pos_5y"] = pd.to_numeric(wide[f"{metric_col}_pos_5y"], errors="coerce").astype("float64")
     
     logger.info("[wide_metrics] OI-based metrics calculated")
 
@@ -462,30 +390,14 @@ def build_wide_metrics(
         oi_series = pd.to_numeric(wide["open_interest"], errors="coerce").astype("float64")
         oi_chg_1w = pd.to_numeric(wide["open_interest_chg_1w"], errors="coerce").astype("float64")
 
-        # z-score 52w and 260w (min 26 / 52)
-        oi_mean_52 = oi_series.groupby(wide["market_key"]).transform(
-            lambda x: x.rolling(window=52, min_periods=26).mean()
-        )
-        oi_std_52 = oi_series.groupby(wide["market_key"]).transform(
-            lambda x: x.rolling(window=52, min_periods=26).std(ddof=0)
-        )
-        wide["oi_z_52w"] = np.where(
-            oi_std_52 > 0,
-            (oi_series - oi_mean_52) / oi_std_52,
-            np.nan,
-        ).astype("float64")
-
-        oi_mean_260 = oi_series.groupby(wide["market_key"]).transform(
-            lambda x: x.rolling(window=260, min_periods=52).mean()
-        )
-        oi_std_260 = oi_series.groupby(wide["market_key"]).transform(
-            lambda x: x.rolling(window=260, min_periods=52).std(ddof=0)
-        )
-        wide["oi_z_260w"] = np.where(
-            oi_std_260 > 0,
-            (oi_series - oi_mean_260) / oi_std_260,
-            np.nan,
-        ).astype("float64")
+        # z-scores per zscore window (e.g. 52w/min 26, 260w/min 52)
+        oi_z = engine.rolling(pd.DataFrame({"oi": oi_series}), z_specs, ("mean", "std"))
+        for spec in z_specs:
+            wide[f"oi_z_{spec.label}"] = zscore(
+                oi_series,
+                oi_z[("oi", "mean", spec.label)],
+                oi_z[("oi", "std", spec.label)],
+            )
 
         # 4w delta and acceleration (1w vs avg 4w)
         oi_4w_ago = oi_series.groupby(wide["market_key"]).shift(4)
@@ -494,9 +406,9 @@ def build_wide_metrics(
 
         # small_threshold = 0.05 * median(|oi_delta_1w| over 52w)
         abs_oi_delta = oi_chg_1w.abs()
-        oi_median_abs_52 = abs_oi_delta.groupby(wide["market_key"]).transform(
-            lambda x: x.rolling(window=52, min_periods=26).median()
-        )
+        oi_median_abs_52 = engine.rolling(
+            pd.DataFrame({"abs_delta": abs_oi_delta}), [SIGNAL_WINDOW], ("median",)
+        )[("abs_delta", "median", SIGNAL_WINDOW.label)]
         small_threshold = 0.05 * oi_median_abs_52
 
         # Regime (N/A if required inputs are NaN)
@@ -567,8 +479,8 @@ def build_wide_metrics(
         missing_risk = oi_z_52.isna()
         wide["oi_risk_level"] = np.where(missing_risk, "N/A", risk_level)
     else:
-        wide["oi_z_52w"] = np.nan
-        wide["oi_z_260w"] = np.nan
+        for spec in z_specs:
+            wide[f"oi_z_{spec.label}"] = np.nan
         wide["oi_delta_4w"] = np.nan
         wide["oi_acceleration"] = np.nan
         wide["oi_regime"] = "N/A"
@@ -579,47 +491,29 @@ def build_wide_metrics(
     logger.info("[wide_metrics] calculating chg_1w heatline metrics...")
     chg_groups = ["nc", "comm", "nr"]
     chg_metrics = ["long", "short", "total", "net"]
-    for group in chg_groups:
-        for metric in chg_metrics:
-            chg_col = f"{group}_{metric}_chg_1w"
-            if chg_col not in wide.columns:
-                continue
-
-            series = pd.to_numeric(wide[chg_col], errors="coerce").astype("float64")
-
-            min_all = wide.groupby("market_key")[chg_col].transform("min")
-            max_all = wide.groupby("market_key")[chg_col].transform("max")
-            diff_all = max_all - min_all
-            pos_all = np.where(
-                diff_all > 0,
-                (series - min_all) / diff_all,
-                np.where(series.notna(), 0.5, np.nan)
-            )
-
-            wide[f"{chg_col}_min_all"] = pd.to_numeric(min_all, errors="coerce").astype("float64")
-            wide[f"{chg_col}_max_all"] = pd.to_numeric(max_all, errors="coerce").astype("float64")
-            wide[f"{chg_col}_pos_all"] = pd.to_numeric(pos_all, errors="coerce").astype("float64")
-
-            min_5y = wide.groupby("market_key")[chg_col].transform(
-                lambda x: x.rolling(window=260, min_periods=52).min()
-            )
-            max_5y = wide.groupby("market_key")[chg_col].transform(
-                lambda x: x.rolling(window=260, min_periods=52).max()
-            )
-            diff_5y = max_5y - min_5y
-            pos_5y = np.where(
-                (diff_5y > 0) & min_5y.notna() & max_5y.notna(),
-                (series - min_5y) / diff_5y,
-                np.where(
-                    (diff_5y == 0) & min_5y.notna() & max_5y.notna() & series.notna(),
-                    0.5,
-                    np.nan
-                )
-            )
-
-            wide[f"{chg_col}_min_5y"] = pd.to_numeric(min_5y, errors="coerce").astype("float64")
-            wide[f"{chg_col}_max_5y"] = pd.to_numeric(max_5y, errors="coerce").astype("float64")
-            wide[f"{chg_col}_pos_5y"] = pd.to_numeric(pos_5y, errors="coerce").astype("float64")
+    chg_cols = [
+        f"{group}_{metric}_chg_1w"
+        for group in chg_groups
+        for metric in chg_metrics
+        if f"{group}_{metric}_chg_1w" in wide.columns
+    ]
+    chg_values = wide[chg_cols].apply(pd.to_numeric, errors="coerce").astype("float64")
+    chg_min_all = engine.group_reduce(chg_values, "min")
+    chg_max_all = engine.group_reduce(chg_values, "max")
+    chg_ext = engine.rolling(chg_values, ext_specs, ("min", "max"))
+    for chg_col in chg_cols:
+        series = chg_values[chg_col]
+
+        wide[f"{chg_col}_min_all"] = chg_min_all[chg_col]
+        wide[f"{chg_col}_max_all"] = chg_max_all[chg_col]
+        wide[f"{chg_col}_pos_all"] = range_position(series, chg_min_all[chg_col], chg_max_all[chg_col])
+
+        for spec in ext_specs:
+            lo = chg_ext[(chg_col, "min", spec.label)]
+            hi = chg_ext[(chg_col, "max", spec.label)]
+            wide[f"{chg_col}_min_{spec.label}"] = lo
+            wide[f"{chg_col}_max_{spec.label}"] = hi
+            wide[f"{chg_col}_pos_{spec.label}"] = range_position(series, lo, hi)
 
     # Shared scale for nc_net + comm_net
     logger.info("[wide_metrics] calculating shared-scale net metrics (nc/comm)...")
@@ -628,133 +522,49 @@ def build_wide_metrics(
     nc_net_chg = pd.to_numeric(wide.get("nc_net_chg_1w"), errors="coerce").astype("float64")
     comm_net_chg = pd.to_numeric(wide.get("comm_net_chg_1w"), errors="coerce").astype("float64")
 
-    # All-time shared scale for net positions
-    fc_net_min_all = wide.groupby("market_key")[["nc_net", "comm_net"]].transform("min").min(axis=1)
-    fc_net_max_all = wide.groupby("market_key")[["nc_net", "comm_net"]].transform("max").max(axis=1)
-    fc_net_diff_all = fc_net_max_all - fc_net_min_all
-    wide["fc_net_min_all"] = pd.to_numeric(fc_net_min_all, errors="coerce").astype("float64")
-    wide["fc_net_max_all"] = pd.to_numeric(fc_net_max_all, errors="coerce").astype("float64")
-    wide["fc_net_pos_nc_all"] = np.where(
-        fc_net_diff_all > 0,
-        (nc_net - fc_net_min_all) / fc_net_diff_all,
-        np.where(nc_net.notna(), 0.5, np.nan)
-    ).astype("float64")
-    wide["fc_net_pos_comm_all"] = np.where(
-        fc_net_diff_all > 0,
-        (comm_net - fc_net_min_all) / fc_net_diff_all,
-        np.where(comm_net.notna(), 0.5, np.nan)
-    ).astype("float64")
-
-    # 5Y shared scale for net positions (260w)
-    fc_net_min_5y = wide.groupby("market_key")[["nc_net", "comm_net"]].transform(
-        lambda x: x.rolling(window=260, min_periods=52).min()
-    ).min(axis=1)
-    fc_net_max_5y = wide.groupby("market_key")[["nc_net", "comm_net"]].transform(
-        lambda x: x.rolling(window=260, min_periods=52).max()
-    ).max(axis=1)
-    fc_net_diff_5y = fc_net_max_5y - fc_net_min_5y
-    wide["fc_net_min_5y"] = pd.to_numeric(fc_net_min_5y, errors="coerce").astype("float64")
-    wide["fc_net_max_5y"] = pd.to_numeric(fc_net_max_5y, errors="coerce").astype("float64")
-    wide["fc_net_pos_nc_5y"] = np.where(
-        (fc_net_diff_5y > 0) & fc_net_min_5y.notna() & fc_net_max_5y.notna(),
-        (nc_net - fc_net_min_5y) / fc_net_diff_5y,
-        np.where(
-            (fc_net_diff_5y == 0) & nc_net.notna() & fc_net_min_5y.notna() & fc_net_max_5y.notna(),
-            0.5,
-            np.nan
-        )
-    ).astype("float64")
-    wide["fc_net_pos_comm_5y"] = np.where(
-        (fc_net_diff_5y > 0) & fc_net_min_5y.notna() & fc_net_max_5y.notna(),
-        (comm_net - fc_net_min_5y) / fc_net_diff_5y,
-        np.where(
-            (fc_net_diff_5y == 0) & comm_net.notna() & fc_net_min_5y.notna() & fc_net_max_5y.notna(),
-            0.5,
-            np.nan
-        )
-    ).astype("float64")
-
-    # All-time shared scale for net changes
-    fc_net_chg_min_all = wide.groupby("market_key")[["nc_net_chg_1w", "comm_net_chg_1w"]].transform("min").min(axis=1)
-    fc_net_chg_max_all = wide.groupby("market_key")[["nc_net_chg_1w", "comm_net_chg_1w"]].transform("max").max(axis=1)
-    fc_net_chg_diff_all = fc_net_chg_max_all - fc_net_chg_min_all
-    wide["fc_net_chg_min_all"] = pd.to_numeric(fc_net_chg_min_all, errors="coerce").astype("float64")
-    wide["fc_net_chg_max_all"] = pd.to_numeric(fc_net_chg_max_all, errors="coerce").astype("float64")
-    wide["fc_net_chg_pos_nc_all"] = np.where(
-        fc_net_chg_diff_all > 0,
-        (nc_net_chg - fc_net_chg_min_all) / fc_net_chg_diff_all,
-        np.where(nc_net_chg.notna(), 0.5, np.nan)
-    ).astype("float64")
-    wide["fc_net_chg_pos_comm_all"] = np.where(
-        fc_net_chg_diff_all > 0,
-        (comm_net_chg - fc_net_chg_min_all) / fc_net_chg_diff_all,
-        np.where(comm_net_chg.notna(), 0.5, np.nan)
-    ).astype("float64")
-
-    # 5Y shared scale for net changes (260w)
-    fc_net_chg_min_5y = wide.groupby("market_key")[["nc_net_chg_1w", "comm_net_chg_1w"]].transform(
-        lambda x: x.rolling(window=260, min_periods=52).min()
-    ).min(axis=1)
-    fc_net_chg_max_5y = wide.groupby("market_key")[["nc_net_chg_1w", "comm_net_chg_1w"]].transform(
-        lambda x: x.rolling(window=260, min_periods=52).max()
-    ).max(axis=1)
-    fc_net_chg_diff_5y = fc_net_chg_max_5y - fc_net_chg_min_5y
-    wide["fc_net_chg_min_5y"] = pd.to_numeric(fc_net_chg_min_5y, errors="coerce").astype("float64")
-    wide["fc_net_chg_max_5y"] = pd.to_numeric(fc_net_chg_max_5y, errors="coerce").astype("float64")
-    wide["fc_net_chg_pos_nc_5y"] = np.where(
-        (fc_net_chg_diff_5y > 0) & fc_net_chg_min_5y.notna() & fc_net_chg_max_5y.notna(),
-        (nc_net_chg - fc_net_chg_min_5y) / fc_net_chg_diff_5y,
-        np.where(
-            (fc_net_chg_diff_5y == 0) & nc_net_chg.notna() & fc_net_chg_min_5y.notna() & fc_net_chg_max_5y.notna(),
-            0.5,
-            np.nan
-        )
-    ).astype("float64")
-    wide["fc_net_chg_pos_comm_5y"] = np.where(
-        (fc_net_chg_diff_5y > 0) & fc_net_chg_min_5y.notna() & fc_net_chg_max_5y.notna(),
-        (comm_net_chg - fc_net_chg_min_5y) / fc_net_chg_diff_5y,
-        np.where(
-            (fc_net_chg_diff_5y == 0) & comm_net_chg.notna() & fc_net_chg_min_5y.notna() & fc_net_chg_max_5y.notna(),
-            0.5,
-            np.nan
-        )
-    ).astype("float64")
-
-    # Net z-score (52w) + Activity/Flow/Positioning + Consensus Signal
+    # One scale per row for both groups: min/max taken over nc and comm together
+    for prefix, nc_values, comm_values in [
+        ("fc_net", nc_net, comm_net),
+        ("fc_net_chg", nc_net_chg, comm_net_chg),
+    ]:
+        pair = pd.DataFrame({"nc": nc_values, "comm": comm_values})
+        pair_min_all = engine.group_reduce(pair, "min")
+        pair_max_all = engine.group_reduce(pair, "max")
+        pair_ext = engine.rolling(pair, ext_specs, ("min", "max"))
+
+        scales = [("all", np.fmin(pair_min_all["nc"], pair_min_all["comm"]), np.fmax(pair_max_all["nc"], pair_max_all["comm"]))]
+        for spec in ext_specs:
+            scales.append((
+                spec.label,
+                np.fmin(pair_ext[("nc", "min", spec.label)], pair_ext[("comm", "min", spec.label)]),
+                np.fmax(pair_ext[("nc", "max", spec.label)], pair_ext[("comm", "max", spec.label)]),
+            ))
+
+        for label, lo, hi in scales:
+            wide[f"{prefix}_min_{label}"] = lo.astype("float64")
+            wide[f"{prefix}_max_{label}"] = hi.astype("float64")
+            wide[f"{prefix}_pos_nc_{label}"] = range_position(nc_values, lo, hi)
+            wide[f"{prefix}_pos_comm_{label}"] = range_position(comm_values, lo, hi)
+
+    # Net z-scores + Activity/Flow/Positioning + Consensus Signal
     logger.info("[wide_metrics] calculating net z-scores and traffic signal metrics...")
-    wide = wide.sort_values(["market_key", "report_date"]).reset_index(drop=True)
 
     def _sign(series: pd.Series) -> pd.Series:
         s = pd.to_numeric(series, errors="coerce")
         return np.sign(s).astype("float64")
 
-    # Net z-score 52w (min_periods=26)
+    # Net z-scores per zscore window (52w/min 26 drives the signals below)
     nc_net = pd.to_numeric(wide.get("nc_net"), errors="coerce").astype("float64")
     comm_net = pd.to_numeric(wide.get("comm_net"), errors="coerce").astype("float64")
 
-    nc_net_mean_52 = nc_net.groupby(wide["market_key"]).transform(
-        lambda x: x.rolling(window=52, min_periods=26).mean()
-    )
-    nc_net_std_52 = nc_net.groupby(wide["market_key"]).transform(
-        lambda x: x.rolling(window=52, min_periods=26).std(ddof=0)
-    )
-    comm_net_mean_52 = comm_net.groupby(wide["market_key"]).transform(
-        lambda x: x.rolling(window=52, min_periods=26).mean()
-    )
-    comm_net_std_52 = comm_net.groupby(wide["market_key"]).transform(
-        lambda x: x.rolling(window=52, min_periods=26).std(ddof=0)
-    )
-
-    wide["net_z_52w_funds"] = np.where(
-        nc_net_std_52 > 0,
-        (nc_net - nc_net_mean_52) / nc_net_std_52,
-        np.nan,
-    ).astype("float64")
-    wide["net_z_52w_commercials"] = np.where(
-        comm_net_std_52 > 0,
-        (comm_net - comm_net_mean_52) / comm_net_std_52,
-        np.nan,
-    ).astype("float64")
+    net_z = engine.rolling(pd.DataFrame({"funds": nc_net, "commercials": comm_net}), z_specs, ("mean", "std"))
+    for spec in z_specs:
+        wide[f"net_z_{spec.label}_funds"] = zscore(
+            nc_net, net_z[("funds", "mean", spec.label)], net_z[("funds", "std", spec.label)]
+        )
+        wide[f"net_z_{spec.label}_commercials"] = zscore(
+            comm_net, net_z[("commercials", "mean", spec.label)], net_z[("commercials", "std", spec.label)]
+        )
 
     # Activity: Aggressive/Normal by rolling p75 of abs(net_delta_1w)
     nc_net_delta = pd.to_numeric(wide.get("nc_net_chg_1w"), errors="coerce").astype("float64")
@@ -762,12 +572,9 @@ def build_wide_metrics(
     nc_abs_delta = nc_net_delta.abs()
     comm_abs_delta = comm_net_delta.abs()
 
-    nc_p75 = nc_abs_delta.groupby(wide["market_key"]).transform(
-        lambda x: x.rolling(window=52, min_periods=26).quantile(0.75)
-    )
-    comm_p75 = comm_abs_delta.groupby(wide["market_key"]).transform(
-        lambda x: x.rolling(window=52, min_periods=26).quantile(0.75)
-    )
+    p75 = engine.rolling(pd.DataFrame({"nc": nc_abs_delta, "comm": comm_abs_delta}), [SIGNAL_WINDOW], ("p75",))
+    nc_p75 = p75[("nc", "p75", SIGNAL_WINDOW.label)]
+    comm_p75 = p75[("comm", "p75", SIGNAL_WINDOW.label)]
 
     wide["activity_funds"] = np.where(
         nc_p75.notna(),
@@ -0,0 +1,227 @@
+"""Window specs and shared per-market rolling engine for compute builders."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+import numpy as np
+import yaml
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+@dataclass(frozen=True)
+class WindowSpec:
+    """One rolling lookback: column suffix, window length and min_periods (weeks)."""
+
+    label: str
+    window: int
+    min_periods: int
+
+
+WINDOW_FAMILIES = ("rolling_ma", "extremes", "moves", "zscore")
+
+DEFAULT_WINDOWS: dict[str, list[WindowSpec]] = {
+    "rolling_ma": [WindowSpec("13w", 13, 1)],
+    "extremes": [WindowSpec("5y", 260, 52)],
+    "moves": [WindowSpec("5y", 260, 52)],
+    "zscore": [WindowSpec("52w", 52, 26), WindowSpec("260w", 260, 52)],
+}
+
+# Labels that signals/validations reference by name.
+REQUIRED_LABELS: dict[str, set[str]] = {
+    "extremes": {"5y"},
+    "moves": {"5y"},
+    "zscore": {"52w"},
+}
+
+
+def _parse_specs(family: str, entries: list[dict]) -> list[WindowSpec]:
+    specs: list[WindowSpec] = []
+    seen: set[str] = set()
+    for entry in entries or []:
+        try:
+            spec = WindowSpec(
+                label=str(entry["label"]).strip(),
+                window=int(entry["window"]),
+                min_periods=int(entry.get("min_periods", entry["window"])),
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"windows.yaml: invalid entry in '{family}': {entry!r}") from exc
+        if not spec.label or spec.label in seen:
+            raise ValueError(f"windows.yaml: empty or duplicate label '{spec.label}' in '{family}'")
+        if spec.window < 1 or not 1 <= spec.min_periods <= spec.window:
+            raise ValueError(
+                f"windows.yaml: '{family}.{spec.label}' needs window >= 1 and 1 <= min_periods <= window"
+            )
+        seen.add(spec.label)
+        specs.append(spec)
+    return specs
+
+
+def validate_windows(windows: dict[str, list[WindowSpec]]) -> None:
+    """Fail if a label that downstream logic depends on is missing."""
+    for family, labels in REQUIRED_LABELS.items():
+        present = {spec.label for spec in windows.get(family, [])}
+        missing = labels - present
+        if missing:
+            raise ValueError(f"windows.yaml: '{family}' must define labels {sorted(missing)}")
+
+
+def load_windows(configs_dir: Path) -> dict[str, list[WindowSpec]]:
+    """
+    Load window specs from configs/windows.yaml.
+
+    Families missing from the file fall back to DEFAULT_WINDOWS.
+    """
+    windows = {family: list(specs) for family, specs in DEFAULT_WINDOWS.items()}
+    path = configs_dir / "windows.yaml"
+    if path.exists():
+        cfg = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        unknown = set(cfg) - set(WINDOW_FAMILIES)
+        if unknown:
+            raise ValueError(f"windows.yaml: unknown families {sorted(unknown)}")
+        for family in WINDOW_FAMILIES:
+            if family in cfg:
+                windows[family] = _parse_specs(family, cfg[family])
+    validate_windows(windows)
+    return windows
+
+
+def resolve_windows(windows: dict[str, list[WindowSpec]] | None) -> dict[str, list[WindowSpec]]:
+    """Fill families missing from `windows` with defaults."""
+    resolved = {family: list(specs) for family, specs in DEFAULT_WINDOWS.items()}
+    if windows:
+        resolved.update({family: list(specs) for family, specs in windows.items()})
+    return resolved
+
+
+_ROLLING_STATS: dict[str, Callable] = {
+    "min": lambda r: r.min(),
+    "max": lambda r: r.max(),
+    "mean": lambda r: r.mean(),
+    "std": lambda r: r.std(ddof=0),
+    "median": lambda r: r.median(),
+    "p75": lambda r: r.quantile(0.75),
+}
+
+
+class RollingEngine:
+    """
+    Per-market rolling computations over a frame sorted by market_key.
+
+    Group boundaries are computed once; every call then walks each market's
+    contiguous block a single time and evaluates all requested windows and
+    statistics for all requested columns on it, instead of one
+    groupby(...).transform(lambda ...) pass per column, window and statistic.
+    """
+
+    def __init__(self, keys: pd.Series):
+        arr = keys.to_numpy()
+        if len(arr) == 0:
+            bounds = np.array([0], dtype="int64")
+        else:
+            change = np.flatnonzero(arr[1:] != arr[:-1]) + 1
+            bounds = np.concatenate([[0], change, [len(arr)]]).astype("int64")
+            if len(bounds) - 1 != len(pd.unique(arr)):
+                raise ValueError("RollingEngine requires rows grouped by key (sort by market_key first)")
+        self.index = keys.index
+        self.n = len(arr)
+        self.bounds = bounds
+
+    def _blocks(self):
+        return zip(self.bounds[:-1], self.bounds[1:])
+
+    @staticmethod
+    def _as_array(values: pd.DataFrame) -> np.ndarray:
+        return values.apply(pd.to_numeric, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
+    def group_reduce(self, values: pd.DataFrame, stat: str) -> dict[str, pd.Series]:
+        """All-history per-market min/max broadcast back to rows (NaN-skipping)."""
+        arr = self._as_array(values)
+        if self.n == 0:
+            return {col: pd.Series(np.nan, index=self.index, dtype="float64") for col in values.columns}
+        ufunc = {"min": np.fmin, "max": np.fmax}[stat]
+        reduced = ufunc.reduceat(arr, self.bounds[:-1], axis=0)
+        full = np.repeat(reduced, np.diff(self.bounds), axis=0)
+        return {col: pd.Series(full[:, j], index=self.index) for j, col in enumerate(values.columns)}
+
+    def rolling(
+        self,
+        values: pd.DataFrame,
+        specs: list[WindowSpec],
+        stats: tuple[str, ...],
+    ) -> dict[tuple[str, str, str], pd.Series]:
+        """
+        Trailing-window statistics per market.
+
+        Returns {(column, stat, spec.label): Series aligned to the engine index}.
+        """
+        arr = self._as_array(values)
+        cols = list(values.columns)
+        buffers = {
+            (stat, spec.label): np.full(arr.shape, np.nan, dtype="float64")
+            for spec in specs
+            for stat in stats
+        }
+        for start, end in self._blocks():
+            block = pd.DataFrame(arr[start:end])
+            for spec in specs:
+                roll = block.rolling(window=spec.window, min_periods=spec.min_periods)
+                for stat in stats:
+                    buffers[(stat, spec.label)][start:end] = _ROLLING_STATS[stat](roll).to_numpy()
+        return {
+            (col, stat, label): pd.Series(buf[:, j], index=self.index)
+            for (stat, label), buf in buffers.items()
+            for j, col in enumerate(cols)
+        }
+
+    def rolling_pct_rank(
+        self,
+        values: pd.DataFrame,
+        specs: list[WindowSpec],
+    ) -> dict[tuple[str, str], pd.Series]:
+        """
+        Trailing-window percentile of the current value: count(window <= x_t) / count(window non-NaN).
+
+        NaN when the current value is NaN or fewer than min_periods values are present.
+        Returns {(column, spec.label): Series}.
+        """
+        arr = self._as_array(values)
+        out: dict[tuple[str, str], pd.Series] = {}
+        for spec in specs:
+            result = np.full(arr.shape, np.nan, dtype="float64")
+            pad = np.full(spec.window - 1, np.nan)
+            for start, end in self._blocks():
+                for j in range(arr.shape[1]):
+                    x = arr[start:end, j]
+                    windows = sliding_window_view(np.concatenate([pad, x]), spec.window)
+                    count = (~np.isnan(windows)).sum(axis=1)
+                    rank = (windows <= x[:, None]).sum(axis=1)
+                    ok = (count >= spec.min_periods) & ~np.isnan(x)
+                    result[start:end, j] = np.where(ok, rank / np.maximum(count, 1), np.nan)
+            for j, col in enumerate(values.columns):
+                out[(col, spec.label)] = pd.Series(result[:, j], index=self.index)
+        return out
+
+
+def range_position(current: pd.Series, lo: pd.Series, hi: pd.Series) -> np.ndarray:
+    """
+    Position of current within [lo, hi]: (current - lo) / (hi - lo).
+
+    0.5 when lo == hi (and all inputs present), NaN when any input is missing.
+    """
+    diff = hi - lo
+    both = lo.notna() & hi.notna()
+    return np.where(
+        (diff > 0) & both,
+        (current - lo) / diff,
+        np.where((diff == 0) & both & current.notna(), 0.5, np.nan),
+    ).astype("float64")
+
+
+def zscore(current: pd.Series, mean: pd.Series, std: pd.Series) -> np.ndarray:
+    """(current - mean) / std, NaN where std is not positive."""
+    return np.where(std > 0, (current - mean) / std, np.nan).astype("float64")
@@ -14,6 +14,7 @@ import yaml
 import pandas as pd
 
 from src.common.paths import ProjectPaths
+from src.common.generation import write_generation
 from src.common.logging import setup_logging
 from src.common.markets_sync import sync_markets_from_contracts_meta, _clean_contract_code
 from src.compute.build_positions import build_positions
@@ -23,26 +24,24 @@ from src.compute.build_rolling import build_rolling
 from src.compute.build_extremes import build_extremes
 from src.compute.build_moves import build_moves_weekly
 from src.compute.build_wide_metrics import build_wide_metrics
-from src.compute.build_market_radar import build_market_radar_latest
+from src.compute.rolling_windows import load_windows
+from src.compute.build_market_radar import build_market_radar_history, latest_radar_from_history
 from src.compute.build_market_positioning import build_market_positioning_latest
+from src.compute.build_cross_section import build_cross_section_ranks
+from src.compute.build_category_aggregates import build_category_aggregates
+from src.common.view_models import MARKET_VIEW_FILE, MARKET_VIEW_ROW_GROUP_ROWS, build_market_view_weekly
 from src.compute.validations import (
     validate_canonical_exists,
     validate_required_columns,
-    validate_output_rows,
-    validate_pos_all,
-    validate_pos_5y,
-    validate_max_min_all,
-    validate_max_min_5y,
-    validate_chg_1w,
-    validate_oi_metrics,
     warn_missing_weeks,
     warn_negative_open_interest,
-    warn_duplicate_keys,
-    warn_oi_missing_mid_history,
-    info_oi_chg_pct_threshold,
-    warn_oi_chg_pct_threshold,
+    run_metrics_validations,
 )
 
+# metrics_weekly is sorted by (market_key, report_date); bounded row groups keep
+# min/max statistics selective so bulk API readers can skip whole groups.
+METRICS_ROW_GROUP_ROWS = 1024
+
 
 def main():
     parser = argparse.ArgumentParser()
@@ -106,6 +105,16 @@ def main():
             allowed_pairs.add((str(market_key), contract_code))
     
     logger.info(f"[compute] loaded {len(market_to_category)} markets from config")
+    
+    # Read windows.yaml (rolling lookbacks per metric family)
+    try:
+        windows = load_windows(paths.configs)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    logger.info(
+        "[compute] windows: "
+        + ", ".join(f"{family}={[s.label for s in specs]}" for family, specs in windows.items())
+    )
 
     # Filter canonical by (market_key, contract_code) from markets.yaml
     canonical["market_key"] = canonical["market_key"].astype(str)
@@ -194,7 +203,7 @@ def main():
     
     # Step 3: Build rolling table
     logger.info("[compute] step 3/4: building rolling...")
-    rolling = build_rolling(positions)
+    rolling = build_rolling(positions, windows["rolling_ma"])
     
     # Validate rolling
     if len(rolling) == 0:
@@ -209,7 +218,7 @@ def main():
     
     # Step 4: Build extremes table
     logger.info("[compute] step 4/4: building extremes...")
-    extremes = build_extremes(positions)
+    extremes = build_extremes(positions, windows["extremes"])
     
     # Validate extremes
     if len(extremes) == 0:
@@ -224,7 +233,7 @@ def main():
     
     # Step 6: Build moves table
     logger.info("[compute] step 6/7: building moves...")
-    moves = build_moves_weekly(changes)
+    moves = build_moves_weekly(changes, windows["moves"])
     
     # Validate moves
     if len(moves) == 0:
@@ -251,59 +260,15 @@ def main():
         canonical=canonical,
         market_to_category=market_to_category,
         market_to_contract=market_to_contract,
+        windows=windows,
     )
     
-    # Validate metrics
-    errors = []
-    
-    # Check output rows
-    errors.extend(validate_output_rows(metrics))
-    
-    # Warn on duplicate keys (do not stop compute here)
-    warnings.extend(warn_duplicate_keys(metrics, ["market_key", "report_date"]))
-    
-    # Check 1:1 with positions (must have same row count)
-    if len(metrics) != len(positions):
-        errors.append(
-            f"Metrics row count ({len(metrics)}) != positions row count ({len(positions)}). "
-            f"Expected 1:1 join."
-        )
-    
-    # Check pos_all (no NaN, in [0, 1])
-    errors.extend(validate_pos_all(metrics))
-    
-    # Check pos_5y (NaN allowed, non-NaN in [0, 1])
-    errors.extend(validate_pos_5y(metrics))
-    
-    # Check max != min for ALL window
-    errors.extend(validate_max_min_all(metrics))
-    
-    # Check max != min for 5Y window (allow min==max for early data)
-    errors.extend(validate_max_min_5y(metrics))
-    
-    # Check WoW change columns (chg_1w) - only basic columns from semantic tables
-    errors.extend(validate_chg_1w(metrics))
-    
-    # Check basic net metrics (nc_net, comm_net exist)
-    # Note: spec_vs_hedge_net_chg_1w and other derived metrics are optional
-    if "nc_net" not in metrics.columns or "comm_net" not in metrics.columns:
-        errors.append("Missing required net metrics columns: nc_net, comm_net")
-    
-    # Check basic OI (open_interest exists)
-    # Note: open_interest_chg_1w and OI extremes are optional
-    if "open_interest" not in metrics.columns:
-        errors.append("Missing required OI column: open_interest")
-    
-    # Skip exposure_shares validation - these columns are not in semantic tables
-    # If needed, they should be added to positions or changes tables
-    
-    # Validate OI metrics (full checks)
-    errors.extend(validate_oi_metrics(metrics))
-
-    # OI warnings/infos
-    warnings.extend(warn_oi_missing_mid_history(metrics))
-    infos.extend(info_oi_chg_pct_threshold(metrics, 0.35))
-    warnings.extend(warn_oi_chg_pct_threshold(metrics, 0.50))
+    # Validate metrics (one pre-sorted view shared by all checks)
+    report = run_metrics_validations(metrics, expected_rows=len(positions))
+    errors = report.errors
+    warnings.extend(report.warnings)
+    infos.extend(report.infos)
+    logger.info(f"[compute] validations: {report.timing_summary()}")
     
     logger.info(f"[compute] metrics rows: {len(metrics)}, cols: {len(metrics.columns)}")
     
@@ -346,19 +311,68 @@ def main():
     
     # Write metrics_weekly output (wide view for UI)
     output_path = output_dir / "metrics_weekly.parquet"
-    metrics.to_parquet(output_path, index=False)
+    metrics.to_parquet(output_path, index=False, row_group_size=METRICS_ROW_GROUP_ROWS)
     logger.info(f"[compute] wrote {output_path} rows={len(metrics)}")
 
-    # Write market radar latest view
-    radar = build_market_radar_latest(metrics, market_to_name)
+    # Write market radar history (every market x week) and latest view sliced from it
+    radar_history = build_market_radar_history(metrics, market_to_name)
+    radar_history_path = output_dir / "market_radar_history.parquet"
+    radar_history.to_parquet(radar_history_path, index=False)
+    logger.info(f"[compute] wrote {radar_history_path} rows={len(radar_history)}")
+
+    radar = latest_radar_from_history(radar_history)
     radar_path = output_dir / "market_radar_latest.parquet"
     radar.to_parquet(radar_path, index=False)
     logger.info(f"[compute] wrote {radar_path} rows={len(radar)}")
 
+    # Write cross-sectional ranks (report_date-major, one block per week)
+    cross_section = build_cross_section_ranks(metrics, radar_history)
+    cross_section_path = output_dir / "cross_section_weekly.parquet"
+    cross_section.to_parquet(cross_section_path, index=False)
+    logger.info(f"[compute] wrote {cross_section_path} rows={len(cross_section)}")
+
+    # Write category/portfolio composites
+    category_aggregates = build_category_aggregates(metrics)
+    category_aggregates_path = output_dir / "category_aggregates_weekly.parquet"
+    category_aggregates.to_parquet(category_aggregates_path, index=False)
+    logger.info(f"[compute] wrote {category_aggregates_path} rows={len(category_aggregates)}")
+
     positioning = build_market_positioning_latest(metrics, market_to_name)
     positioning_path = output_dir / "market_positioning_latest.parquet"
     positioning.to_parquet(positioning_path, index=False)
     logger.info(f"[compute] wrote {positioning_path} rows={len(positioning)}")
+
+    # Per-market UI view models (formatted values the overview sections template)
+    views = build_market_view_weekly(metrics)
+    views_path = output_dir / MARKET_VIEW_FILE
+    views.to_parquet(views_path, index=False, row_group_size=MARKET_VIEW_ROW_GROUP_ROWS)
+    logger.info(f"[compute] wrote {views_path} rows={len(views)}")
+
+    # Generation marker last: API watchers treat it as "all artifacts of this run are in place"
+    latest_report = pd.to_datetime(radar["report_date"], errors="coerce").max() if not radar.empty else pd.NaT
+    generation = write_generation(
+        output_dir,
+        latest_report.strftime("%Y-%m-%d") if pd.notna(latest_report) else None,
+        {
+            path.name: len(frame)
+            for path, frame in [
+                (positions_path, positions),
+                (changes_path, changes),
+                (flows_path, flows),
+                (rolling_path, rolling),
+                (extremes_path, extremes),
+                (moves_path, moves),
+                (output_path, metrics),
+                (radar_history_path, radar_history),
+                (radar_path, radar),
+                (cross_section_path, cross_section),
+                (category_aggregates_path, category_aggregates),
+                (positioning_path, positioning),
+                (views_path, views),
+            ]
+        },
+    )
+    logger.info(f"[compute] generation {generation['id']} report_date={generation['report_date']}")
     
     logger.info("[compute] DONE")
 
@@ -2,10 +2,104 @@
 
 from __future__ import annotations
 
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
 import pandas as pd
 import numpy as np
 
 
+class SortedMetricsView:
+    """
+    A frame sorted once by (market_key, report_date) plus per-market group boundaries.
+
+    Validators accept either a DataFrame or a view (as_view); run_metrics_validations
+    sorts once and passes the same view to every validator, so no check re-sorts the
+    metrics frame and per-market checks run as vectorized reductions over contiguous
+    [starts, ends) blocks.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        has_keys = "market_key" in df.columns and "report_date" in df.columns
+        if has_keys and not _is_sorted_by_keys(df):
+            df = df.sort_values(["market_key", "report_date"])
+        self.df = df.reset_index(drop=True)
+
+        if has_keys and len(self.df) > 0:
+            keys = self.df["market_key"].to_numpy()
+            change = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+            self.starts = np.concatenate([[0], change]).astype("int64")
+            self.markets = keys[self.starts]
+        else:
+            self.starts = np.array([], dtype="int64")
+            self.markets = np.array([], dtype=object)
+        self.ends = np.append(self.starts[1:], len(self.df))[: len(self.starts)].astype("int64")
+        sizes = self.ends - self.starts
+        self.codes = np.repeat(np.arange(len(self.starts)), sizes)
+        self.is_first = np.zeros(len(self.df), dtype=bool)
+        self.is_first[self.starts] = True
+
+    @property
+    def n_markets(self) -> int:
+        return len(self.starts)
+
+    def prev(self, values: pd.Series | np.ndarray) -> pd.Series:
+        """Previous row's value within the same market (NaN on each market's first row)."""
+        arr = pd.to_numeric(pd.Series(values, index=self.df.index), errors="coerce").to_numpy(dtype="float64")
+        shifted = np.empty_like(arr)
+        shifted[1:] = arr[:-1]
+        if len(shifted):
+            shifted[self.is_first] = np.nan
+        return pd.Series(shifted, index=self.df.index)
+
+    def count_per_market(self, mask: pd.Series | np.ndarray) -> np.ndarray:
+        """Number of True rows per market (aligned with self.markets)."""
+        return np.bincount(self.codes, weights=np.asarray(mask, dtype="float64"), minlength=self.n_markets).astype("int64")
+
+
+def _is_sorted_by_keys(df: pd.DataFrame) -> bool:
+    keys = df["market_key"].to_numpy()
+    dates = pd.to_datetime(df["report_date"], errors="coerce").to_numpy()
+    if len(keys) < 2:
+        return True
+    try:
+        key_lt = keys[1:] > keys[:-1]
+    except TypeError:
+        return False
+    key_eq = keys[1:] == keys[:-1]
+    return bool(np.all(key_lt | (key_eq & (dates[1:] >= dates[:-1]))))
+
+
+def as_view(df: pd.DataFrame | SortedMetricsView) -> SortedMetricsView:
+    """Return df as a SortedMetricsView (no-op if it already is one)."""
+    return df if isinstance(df, SortedMetricsView) else SortedMetricsView(df)
+
+
+def _frame(df: pd.DataFrame | SortedMetricsView) -> pd.DataFrame:
+    return df.df if isinstance(df, SortedMetricsView) else df
+
+
+def _first_row_nan_errors(view: SortedMetricsView, col: str) -> list[str]:
+    """*_chg_1w may be NaN only on the first (earliest) row of each market_key."""
+    errors: list[str] = []
+    nan_mask = view.df[col].isna().to_numpy()
+    nan_counts = view.count_per_market(nan_mask)
+    first_is_nan = nan_mask[view.starts]
+    for market_key, nan_count, first_nan in zip(view.markets, nan_counts, first_is_nan):
+        if nan_count > 1:
+            errors.append(
+                f"{col}: {nan_count} NaN values for market_key '{market_key}' "
+                f"(expected at most 1 NaN for first row)"
+            )
+        elif nan_count == 1 and not first_nan:
+            errors.append(
+                f"{col}: NaN not in first row for market_key '{market_key}' "
+                f"(expected NaN only for first row)"
+            )
+    return errors
+
+
 def validate_canonical_exists(canonical_path: str | None) -> None:
     """Fail if canonical parquet is missing."""
     if canonical_path is None:
@@ -47,27 +141,30 @@ def validate_uniqueness(df: pd.DataFrame, keys: list[str]) -> list[str]:
     return errors
 
 
-def warn_missing_weeks(df: pd.DataFrame) -> list[str]:
+def warn_missing_weeks(df: pd.DataFrame | SortedMetricsView) -> list[str]:
     """
     Warn if there are gaps larger than 7 days between consecutive report_date values.
 
     Returns list of warning messages.
     """
     warnings: list[str] = []
-    if "market_key" not in df.columns or "report_date" not in df.columns:
+    frame = _frame(df)
+    if "market_key" not in frame.columns or "report_date" not in frame.columns:
         return warnings
 
-    df_sorted = df.sort_values(["market_key", "report_date"]).reset_index(drop=True)
+    view = as_view(df)
     gap_days = 8
-    for market_key, group in df_sorted.groupby("market_key"):
-        dates = pd.to_datetime(group["report_date"], errors="coerce")
-        deltas = dates.diff().dt.days
-        gaps = deltas[deltas > gap_days]
-        if not gaps.empty:
-            warnings.append(
-                f"Missing weeks WARN: {market_key} has {len(gaps)} gaps > {gap_days} days "
-                f"(max gap {int(gaps.max())} days)"
-            )
+    dates = pd.to_datetime(view.df["report_date"], errors="coerce")
+    deltas = dates.diff().dt.days.to_numpy(dtype="float64", na_value=np.nan, copy=True)
+    deltas[view.is_first] = np.nan
+    is_gap = deltas > gap_days
+    gap_counts = view.count_per_market(is_gap)
+    for code in np.flatnonzero(gap_counts):
+        block = deltas[view.starts[code]:view.ends[code]]
+        warnings.append(
+            f"Missing weeks WARN: {view.markets[code]} has {gap_counts[code]} gaps > {gap_days} days "
+            f"(max gap {int(np.nanmax(block))} days)"
+        )
     return warnings
 
 
@@ -92,34 +189,32 @@ def warn_duplicate_keys(df: pd.DataFrame, keys: list[str]) -> list[str]:
     return warnings
 
 
-def warn_oi_missing_mid_history(df: pd.DataFrame) -> list[str]:
+def warn_oi_missing_mid_history(df: pd.DataFrame | SortedMetricsView) -> list[str]:
     """
     Warn if open_interest has NaN after the first non-NaN value per market_key.
     """
     warnings: list[str] = []
-    if "market_key" not in df.columns or "report_date" not in df.columns:
+    frame = _frame(df)
+    if "market_key" not in frame.columns or "report_date" not in frame.columns:
         return warnings
-    if "open_interest" not in df.columns:
+    if "open_interest" not in frame.columns:
         return warnings
 
-    df_sorted = df.sort_values(["market_key", "report_date"]).reset_index(drop=True)
-    for market_key, group in df_sorted.groupby("market_key"):
-        oi = group["open_interest"]
-        first_valid_idx = oi.first_valid_index()
-        if first_valid_idx is None:
-            continue
-        # Any NaN after the first valid value counts as missing mid-history
-        tail = oi.loc[first_valid_idx:]
-        missing_after = tail.isna().sum()
-        if missing_after > 0:
-            warnings.append(
-                f"Open Interest WARN: {market_key} has {missing_after} NaN values after initial data"
-            )
+    view = as_view(df)
+    valid = view.df["open_interest"].notna()
+    # Any NaN after the first valid value counts as missing mid-history
+    seen_valid = valid.groupby(view.codes).cummax().to_numpy()
+    missing_after = view.count_per_market(seen_valid & ~valid.to_numpy())
+    for code in np.flatnonzero(missing_after):
+        warnings.append(
+            f"Open Interest WARN: {view.markets[code]} has {missing_after[code]} NaN values after initial data"
+        )
     return warnings
 
 
-def info_oi_chg_pct_threshold(df: pd.DataFrame, threshold: float) -> list[str]:
+def info_oi_chg_pct_threshold(df: pd.DataFrame | SortedMetricsView, threshold: float) -> list[str]:
     """Info if abs(open_interest_chg_1w_pct) exceeds threshold."""
+    df = _frame(df)
     infos: list[str] = []
     if "open_interest_chg_1w_pct" not in df.columns:
         return infos
@@ -134,8 +229,9 @@ def info_oi_chg_pct_threshold(df: pd.DataFrame, threshold: float) -> list[str]:
     return infos
 
 
-def warn_oi_chg_pct_threshold(df: pd.DataFrame, threshold: float) -> list[str]:
+def warn_oi_chg_pct_threshold(df: pd.DataFrame | SortedMetricsView, threshold: float) -> list[str]:
     """Warn if abs(open_interest_chg_1w_pct) exceeds threshold."""
+    df = _frame(df)
     warnings: list[str] = []
     if "open_interest_chg_1w_pct" not in df.columns:
         return warnings
@@ -150,7 +246,7 @@ def warn_oi_chg_pct_threshold(df: pd.DataFrame, threshold: float) -> list[str]:
     return warnings
 
 
-def validate_pos_all(df: pd.DataFrame) -> list[str]:
+def validate_pos_all(df: pd.DataFrame | SortedMetricsView) -> list[str]:
     """
     Validate pos_all columns.
     
@@ -160,6 +256,7 @@ def validate_pos_all(df: pd.DataFrame) -> list[str]:
     
     Returns list of error messages.
     """
+    df = _frame(df)
     errors = []
     groups = ["nc", "comm"]
     sides = ["long", "short", "total"]
@@ -186,7 +283,7 @@ def validate_pos_all(df: pd.DataFrame) -> list[str]:
     return errors
 
 
-def validate_pos_5y(df: pd.DataFrame) -> list[str]:
+def validate_pos_5y(df: pd.DataFrame | SortedMetricsView) -> list[str]:
     """
     Validate pos_5y columns.
     
@@ -196,6 +293,7 @@ def validate_pos_5y(df: pd.DataFrame) -> list[str]:
     
     Returns list of error messages.
     """
+    df = _frame(df)
     errors = []
     groups = ["nc", "comm"]
     sides = ["long", "short", "total"]
@@ -217,12 +315,13 @@ def validate_pos_5y(df: pd.DataFrame) -> list[str]:
     return errors
 
 
-def validate_max_min_all(df: pd.DataFrame) -> list[str]:
+def validate_max_min_all(df: pd.DataFrame | SortedMetricsView) -> list[str]:
     """
     Validate ALL window when min == max.
 
     If min == max, pos_all should be 0.5 (or NaN if current value is NaN).
     """
+    df = _frame(df)
     errors = []
     groups = ["nc", "comm"]
     sides = ["long", "short", "total"]
@@ -252,12 +351,13 @@ def validate_max_min_all(df: pd.DataFrame) -> list[str]:
     return errors
 
 
-def validate_max_min_5y(df: pd.DataFrame) -> list[str]:
+def validate_max_min_5y(df: pd.DataFrame | SortedMetricsView) -> list[str]:
     """
     Validate 5Y window when min == max.
 
     If min == max, pos_5y should be 0.5 (or NaN if current value is NaN).
     """
+    df = _frame(df)
     errors = []
     groups = ["nc", "comm"]
     sides = ["long", "short", "total"]
@@ -287,7 +387,7 @@ def validate_max_min_5y(df: pd.DataFrame) -> list[str]:
     return errors
 
 
-def validate_chg_1w(df: pd.DataFrame) -> list[str]:
+def validate_chg_1w(df: pd.DataFrame | SortedMetricsView) -> list[str]:
     """
     Validate WoW change columns (*_chg_1w).
     
@@ -302,8 +402,8 @@ def validate_chg_1w(df: pd.DataFrame) -> list[str]:
     groups = ["nc", "comm"]
     sides = ["long", "short", "total"]
     
-    # Sort by market_key and report_date for validation
-    df_sorted = df.sort_values(["market_key", "report_date"]).reset_index(drop=True)
+    view = as_view(df)
+    df_sorted = view.df
     
     for group in groups:
         for side in sides:
@@ -319,30 +419,7 @@ def validate_chg_1w(df: pd.DataFrame) -> list[str]:
                 continue
             
             # Check 1: NaN allowed ONLY for first row per market_key
-            # Count NaNs per market_key
-            for market_key in df_sorted["market_key"].unique():
-                market_mask = df_sorted["market_key"] == market_key
-                market_data = df_sorted.loc[market_mask, [col_chg, "report_date"]].sort_values("report_date")
-                
-                if len(market_data) == 0:
-                    continue
-                
-                nan_mask = market_data[col_chg].isna()
-                nan_count = nan_mask.sum()
-                
-                if nan_count > 1:
-                    errors.append(
-                        f"{col_chg}: {nan_count} NaN values for market_key '{market_key}' "
-                        f"(expected at most 1 NaN for first row)"
-                    )
-                elif nan_count == 1:
-                    # Check that NaN is in the first row (earliest report_date)
-                    first_idx = market_data.index[0]
-                    if not pd.isna(market_data.loc[first_idx, col_chg]):
-                        errors.append(
-                            f"{col_chg}: NaN not in first row for market_key '{market_key}' "
-                            f"(expected NaN only for first row)"
-                        )
+            errors.extend(_first_row_nan_errors(view, col_chg))
             
             # Check 2: No inf/-inf; dtype numeric
             if not pd.api.types.is_numeric_dtype(df_sorted[col_chg]):
@@ -360,9 +437,7 @@ def validate_chg_1w(df: pd.DataFrame) -> list[str]:
             non_nan_mask = df_sorted[col_chg].notna()
             if non_nan_mask.sum() > 0:
                 # Calculate expected change: current - shift(1) within market_key
-                expected_chg = df_sorted.groupby("market_key")[col_current].transform(
-                    lambda x: x - x.shift(1)
-                )
+                expected_chg = df_sorted[col_current] - view.prev(df_sorted[col_current])
                 
                 # Compare actual vs expected (only for non-NaN rows)
                 actual_chg = df_sorted.loc[non_nan_mask, col_chg]
@@ -382,7 +457,7 @@ def validate_chg_1w(df: pd.DataFrame) -> list[str]:
     return errors
 
 
-def validate_net_metrics(df: pd.DataFrame) -> list[str]:
+def validate_net_metrics(df: pd.DataFrame | SortedMetricsView) -> list[str]:
     """
     Validate net exposure metrics.
     
@@ -408,13 +483,13 @@ def validate_net_metrics(df: pd.DataFrame) -> list[str]:
     ]
     
     # Check 1: All columns exist
-    missing_cols = [col for col in required_cols if col not in df.columns]
+    missing_cols = [col for col in required_cols if col not in _frame(df).columns]
     if missing_cols:
         errors.append(f"Missing net metrics columns: {', '.join(sorted(missing_cols))}")
         return errors  # Early return if columns are missing
     
-    # Sort by market_key and report_date for validation
-    df_sorted = df.sort_values(["market_key", "report_date"]).reset_index(drop=True)
+    view = as_view(df)
+    df_sorted = view.df
     
     # Check 2: Formula checks (strict)
     # nc_net == nc_long - nc_short
@@ -462,29 +537,7 @@ def validate_net_metrics(df: pd.DataFrame) -> list[str]:
     # Check 4: *_chg_1w NaN allowed only for first row per market_key
     chg_cols = ["nc_net_chg_1w", "comm_net_chg_1w", "spec_vs_hedge_net_chg_1w"]
     for col_chg in chg_cols:
-        for market_key in df_sorted["market_key"].unique():
-            market_mask = df_sorted["market_key"] == market_key
-            market_data = df_sorted.loc[market_mask, [col_chg, "report_date"]].sort_values("report_date")
-            
-            if len(market_data) == 0:
-                continue
-            
-            nan_mask = market_data[col_chg].isna()
-            nan_count = nan_mask.sum()
-            
-            if nan_count > 1:
-                errors.append(
-                    f"{col_chg}: {nan_count} NaN values for market_key '{market_key}' "
-                    f"(expected at most 1 NaN for first row)"
-                )
-            elif nan_count == 1:
-                # Check that NaN is in the first row (earliest report_date)
-                first_idx = market_data.index[0]
-                if not pd.isna(market_data.loc[first_idx, col_chg]):
-                    errors.append(
-                        f"{col_chg}: NaN not in first row for market_key '{market_key}' "
-                        f"(expected NaN only for first row)"
-                    )
+        errors.extend(_first_row_nan_errors(view, col_chg))
     
     # Check 5: No inf/-inf in new columns
     for col in required_cols:
@@ -499,15 +552,15 @@ def validate_net_metrics(df: pd.DataFrame) -> list[str]:
                 errors.append(f"{col}: found {inf_count} inf/-inf values (not allowed)")
     
     # Check rebalance decomposition metrics
-    errors.extend(validate_rebalance_metrics(df))
+    errors.extend(validate_rebalance_metrics(view))
     
     # Check net side and magnitude gap metrics
-    errors.extend(validate_net_side_and_mag_gap(df))
+    errors.extend(validate_net_side_and_mag_gap(view))
     
     return errors
 
 
-def validate_net_side_and_mag_gap(df: pd.DataFrame) -> list[str]:
+def validate_net_side_and_mag_gap(df: pd.DataFrame | SortedMetricsView) -> list[str]:
     """
     Validate net side indicators and magnitude gap metrics.
     
@@ -532,13 +585,13 @@ def validate_net_side_and_mag_gap(df: pd.DataFrame) -> list[str]:
     ]
     
     # Check 1: All columns exist
-    missing_cols = [col for col in required_cols if col not in df.columns]
+    missing_cols = [col for col in required_cols if col not in _frame(df).columns]
     if missing_cols:
         errors.append(f"Missing net side/magnitude gap columns: {', '.join(sorted(missing_cols))}")
         return errors  # Early return if columns are missing
     
-    # Sort by market_key and report_date for validation
-    df_sorted = df.sort_values(["market_key", "report_date"]).reset_index(drop=True)
+    view = as_view(df)
+    df_sorted = view.df
     
     # Check 2: net_mag_gap formula check
     if "nc_net" in df_sorted.columns and "comm_net" in df_sorted.columns:
@@ -555,9 +608,7 @@ def validate_net_side_and_mag_gap(df: pd.DataFrame) -> list[str]:
     
     # Check 3: net_mag_gap_chg_1w equals diff check
     if "net_mag_gap" in df_sorted.columns:
-        expected_chg = df_sorted.groupby("market_key")["net_mag_gap"].transform(
-            lambda x: x - x.shift(1)
-        )
+        expected_chg = df_sorted["net_mag_gap"] - view.prev(df_sorted["net_mag_gap"])
         # Compare only non-NaN rows
         mask = df_sorted["net_mag_gap_chg_1w"].notna() & expected_chg.notna()
         if mask.sum() > 0:
@@ -612,12 +663,12 @@ def validate_net_side_and_mag_gap(df: pd.DataFrame) -> list[str]:
         )
     
     # Check net flip flags
-    errors.extend(validate_net_flip_flags(df))
+    errors.extend(validate_net_flip_flags(view))
     
     return errors
 
 
-def validate_net_flip_flags(df: pd.DataFrame) -> list[str]:
+def validate_net_flip_flags(df: pd.DataFrame | SortedMetricsView) -> list[str]:
     """
     Validate net flip flags (sign change detection).
     
@@ -638,13 +689,13 @@ def validate_net_flip_flags(df: pd.DataFrame) -> list[str]:
     ]
     
     # Check 1: All columns exist
-    missing_cols = [col for col in required_cols if col not in df.columns]
+    missing_cols = [col for col in required_cols if col not in _frame(df).columns]
     if missing_cols:
         errors.append(f"Missing net flip columns: {', '.join(sorted(missing_cols))}")
         return errors  # Early return if columns are missing
     
-    # Sort by market_key and report_date for validation
-    df_sorted = df.sort_values(["market_key", "report_date"]).reset_index(drop=True)
+    view = as_view(df)
+    df_sorted = view.df
     
     # Check 2: Type and value check
     for col in required_cols:
@@ -659,78 +710,32 @@ def validate_net_flip_flags(df: pd.DataFrame) -> list[str]:
             )
     
     # Check 3: Formula check - reproduce expected flip
-    def sign_func(val):
+    def sign_func(values: pd.Series) -> np.ndarray:
         """Sign function: 1 if >0, -1 if <0, 0 if ==0 or NaN."""
-        if pd.isna(val):
-            return 0
-        if val > 0:
-            return 1
-        elif val < 0:
-            return -1
-        else:
-            return 0
+        arr = pd.to_numeric(values, errors="coerce").to_numpy(dtype="float64")
+        return np.nan_to_num(np.sign(arr), nan=0.0)
     
-    # Check nc_net_flip_1w
-    if "nc_net" in df_sorted.columns:
-        prev_nc = df_sorted.groupby("market_key")["nc_net"].shift(1)
-        curr_nc = df_sorted["nc_net"]
-        
-        prev_sign = prev_nc.apply(sign_func)
-        curr_sign = curr_nc.apply(sign_func)
-        
-        expected_flip = (prev_sign != 0) & (curr_sign != 0) & (curr_sign != prev_sign)
-        expected_flip = expected_flip.fillna(False).astype(bool)
-        
-        actual_flip = df_sorted["nc_net_flip_1w"].fillna(False).astype(bool)
-        
-        mismatch = (expected_flip != actual_flip).sum()
-        if mismatch > 0:
-            errors.append(
-                f"nc_net_flip_1w formula mismatch: {mismatch} rows where expected != actual"
-            )
-    
-    # Check comm_net_flip_1w
-    if "comm_net" in df_sorted.columns:
-        prev_comm = df_sorted.groupby("market_key")["comm_net"].shift(1)
-        curr_comm = df_sorted["comm_net"]
-        
-        prev_sign = prev_comm.apply(sign_func)
-        curr_sign = curr_comm.apply(sign_func)
-        
-        expected_flip = (prev_sign != 0) & (curr_sign != 0) & (curr_sign != prev_sign)
-        expected_flip = expected_flip.fillna(False).astype(bool)
-        
-        actual_flip = df_sorted["comm_net_flip_1w"].fillna(False).astype(bool)
-        
-        mismatch = (expected_flip != actual_flip).sum()
-        if mismatch > 0:
-            errors.append(
-                f"comm_net_flip_1w formula mismatch: {mismatch} rows where expected != actual"
-            )
-    
-    # Check spec_vs_hedge_net_flip_1w
-    if "spec_vs_hedge_net" in df_sorted.columns:
-        prev_spec = df_sorted.groupby("market_key")["spec_vs_hedge_net"].shift(1)
-        curr_spec = df_sorted["spec_vs_hedge_net"]
+    for value_col in ["nc_net", "comm_net", "spec_vs_hedge_net"]:
+        if value_col not in df_sorted.columns:
+            continue
+        flip_col = f"{value_col}_flip_1w"
         
-        prev_sign = prev_spec.apply(sign_func)
-        curr_sign = curr_spec.apply(sign_func)
+        prev_sign = sign_func(view.prev(df_sorted[value_col]))
+        curr_sign = sign_func(df_sorted[value_col])
         
         expected_flip = (prev_sign != 0) & (curr_sign != 0) & (curr_sign != prev_sign)
-        expected_flip = expected_flip.fillna(False).astype(bool)
-        
-        actual_flip = df_sorted["spec_vs_hedge_net_flip_1w"].fillna(False).astype(bool)
+        actual_flip = df_sorted[flip_col].fillna(False).astype(bool).to_numpy()
         
-        mismatch = (expected_flip != actual_flip).sum()
+        mismatch = int((expected_flip != actual_flip).sum())
         if mismatch > 0:
             errors.append(
-                f"spec_vs_hedge_net_flip_1w formula mismatch: {mismatch} rows where expected != actual"
+                f"{flip_col} formula mismatch: {mismatch} rows where expected != actual"
             )
     
     return errors
 
 
-def validate_rebalance_metrics(df: pd.DataFrame) -> list[str]:
+def validate_rebalance_metrics(df: pd.DataFrame | SortedMetricsView) -> list[str]:
     """
     Validate rebalance decomposition metrics.
     
@@ -752,13 +757,13 @@ def validate_rebalance_metrics(df: pd.DataFrame) -> list[str]:
     ]
     
     # Check 1: All columns exist
-    missing_cols = [col for col in required_cols if col not in df.columns]
+    missing_cols = [col for col in required_cols if col not in _frame(df).columns]
     if missing_cols:
         errors.append(f"Missing rebalance metrics columns: {', '.join(sorted(missing_cols))}")
         return errors  # Early return if columns are missing
     
-    # Sort by market_key and report_date for validation
-    df_sorted = df.sort_values(["market_key", "report_date"]).reset_index(drop=True)
+    view = as_view(df)
+    df_sorted = view.df
     
     # Check 2: No inf/-inf in new columns + net_chg_1w columns
     inf_check_cols = required_cols + ["nc_net_chg_1w", "comm_net_chg_1w"]
@@ -881,7 +886,7 @@ def validate_rebalance_metrics(df: pd.DataFrame) -> list[str]:
     return errors
 
 
-def validate_oi_metrics(df: pd.DataFrame) -> list[str]:
+def validate_oi_metrics(df: pd.DataFrame | SortedMetricsView) -> list[str]:
     """
     Validate Open Interest metrics.
     
@@ -907,13 +912,13 @@ def validate_oi_metrics(df: pd.DataFrame) -> list[str]:
     ]
     
     # Check 1: All columns exist
-    missing_cols = [col for col in required_cols if col not in df.columns]
+    missing_cols = [col for col in required_cols if col not in _frame(df).columns]
     if missing_cols:
         errors.append(f"Missing OI metrics columns: {', '.join(sorted(missing_cols))}")
         return errors  # Early return if columns are missing
     
-    # Sort by market_key and report_date for validation
-    df_sorted = df.sort_values(["market_key", "report_date"]).reset_index(drop=True)
+    view = as_view(df)
+    df_sorted = view.df
     
     # Check 2: open_interest >= 0
     negative_oi = (df_sorted["open_interest"] < 0).sum()
@@ -939,29 +944,7 @@ def validate_oi_metrics(df: pd.DataFrame) -> list[str]:
             errors.append(f"open_interest_pos_5y: {out_of_range} values outside [0, 1] range")
     
     # Check 5: open_interest_chg_1w: NaN allowed only for first row per market_key
-    for market_key in df_sorted["market_key"].unique():
-        market_mask = df_sorted["market_key"] == market_key
-        market_data = df_sorted.loc[market_mask, ["open_interest_chg_1w", "report_date"]].sort_values("report_date")
-        
-        if len(market_data) == 0:
-            continue
-        
-        nan_mask = market_data["open_interest_chg_1w"].isna()
-        nan_count = nan_mask.sum()
-        
-        if nan_count > 1:
-            errors.append(
-                f"open_interest_chg_1w: {nan_count} NaN values for market_key '{market_key}' "
-                f"(expected at most 1 NaN for first row)"
-            )
-        elif nan_count == 1:
-            # Check that NaN is in the first row (earliest report_date)
-            first_idx = market_data.index[0]
-            if not pd.isna(market_data.loc[first_idx, "open_interest_chg_1w"]):
-                errors.append(
-                    f"open_interest_chg_1w: NaN not in first row for market_key '{market_key}' "
-                    f"(expected NaN only for first row)"
-                )
+    errors.extend(_first_row_nan_errors(view, "open_interest_chg_1w"))
     
     # Check 6: open_interest_chg_1w_pct: no inf/-inf
     if "open_interest_chg_1w_pct" in df_sorted.columns:
@@ -988,7 +971,7 @@ def validate_oi_metrics(df: pd.DataFrame) -> list[str]:
     return errors
 
 
-def validate_exposure_shares(df: pd.DataFrame) -> list[str]:
+def validate_exposure_shares(df: pd.DataFrame | SortedMetricsView) -> list[str]:
     """
     Validate gross exposure share metrics.
     
@@ -1016,16 +999,17 @@ def validate_exposure_shares(df: pd.DataFrame) -> list[str]:
     ]
     
     # Check 1: Always required columns exist
-    missing_cols = [col for col in required_cols if col not in df.columns]
+    missing_cols = [col for col in required_cols if col not in _frame(df).columns]
     if missing_cols:
         errors.append(f"Missing required exposure share columns: {', '.join(sorted(missing_cols))}")
         return errors  # Early return if required columns are missing
     
     # Check if NR columns exist (conditional requirement)
-    has_nr = "nr_gross" in df.columns and "nr_gross_share" in df.columns and "nr_gross_share_chg_1w_pp" in df.columns
+    columns = _frame(df).columns
+    has_nr = "nr_gross" in columns and "nr_gross_share" in columns and "nr_gross_share_chg_1w_pp" in columns
     
-    # Sort by market_key and report_date for validation
-    df_sorted = df.sort_values(["market_key", "report_date"]).reset_index(drop=True)
+    view = as_view(df)
+    df_sorted = view.df
     
     # Check 2: Shares should be within [0, 1] when not NaN
     for share_col in ["funds_gross_share", "comm_gross_share"]:
@@ -1137,3 +1121,83 @@ def validate_exposure_shares(df: pd.DataFrame) -> list[str]:
                 errors.append(f"nr_gross: found {inf_count} inf/-inf values (not allowed)")
     
     return errors
+
+
+@dataclass
+class ValidationReport:
+    """Collected QA messages and per-check wall-clock timings (seconds)."""
+
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    infos: list[str] = field(default_factory=list)
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.timings.values())
+
+    def timing_summary(self, top: int = 3) -> str:
+        slowest = sorted(self.timings.items(), key=lambda kv: kv[1], reverse=True)[:top]
+        parts = ", ".join(f"{name}={secs * 1000:.1f}ms" for name, secs in slowest)
+        return f"{len(self.timings)} checks in {self.total_seconds * 1000:.1f}ms (slowest: {parts})"
+
+
+def run_metrics_validations(
+    metrics: pd.DataFrame,
+    expected_rows: int | None = None,
+) -> ValidationReport:
+    """
+    Run the metrics_weekly QA suite against a single pre-sorted view.
+
+    Args:
+        metrics: Wide metrics DataFrame
+        expected_rows: Row count the metrics table must match (positions, 1:1 join)
+
+    Returns:
+        ValidationReport with errors/warnings/infos in suite order and timings per check
+        (including the one-off sort/grouping as "sorted_view").
+    """
+    report = ValidationReport()
+
+    started = time.perf_counter()
+    view = SortedMetricsView(metrics)
+    report.timings["sorted_view"] = time.perf_counter() - started
+
+    def _run(name: str, sink: list[str], check: Callable[[], list[str]]) -> None:
+        t0 = time.perf_counter()
+        sink.extend(check())
+        report.timings[name] = report.timings.get(name, 0.0) + time.perf_counter() - t0
+
+    def _row_count() -> list[str]:
+        if expected_rows is not None and len(metrics) != expected_rows:
+            return [
+                f"Metrics row count ({len(metrics)}) != positions row count ({expected_rows}). "
+                f"Expected 1:1 join."
+            ]
+        return []
+
+    def _required_basics() -> list[str]:
+        errors = []
+        # Note: spec_vs_hedge_net_chg_1w and other derived metrics are optional
+        if "nc_net" not in metrics.columns or "comm_net" not in metrics.columns:
+            errors.append("Missing required net metrics columns: nc_net, comm_net")
+        # Note: open_interest_chg_1w and OI extremes are optional
+        if "open_interest" not in metrics.columns:
+            errors.append("Missing required OI column: open_interest")
+        return errors
+
+    _run("output_rows", report.errors, lambda: validate_output_rows(metrics))
+    _run("duplicate_keys", report.warnings, lambda: warn_duplicate_keys(metrics, ["market_key", "report_date"]))
+    _run("row_count", report.errors, _row_count)
+    _run("pos_all", report.errors, lambda: validate_pos_all(view))
+    _run("pos_5y", report.errors, lambda: validate_pos_5y(view))
+    _run("max_min_all", report.errors, lambda: validate_max_min_all(view))
+    _run("max_min_5y", report.errors, lambda: validate_max_min_5y(view))
+    _run("chg_1w", report.errors, lambda: validate_chg_1w(view))
+    _run("required_basics", report.errors, _required_basics)
+    _run("oi_metrics", report.errors, lambda: validate_oi_metrics(view))
+    _run("oi_missing_mid_history", report.warnings, lambda: warn_oi_missing_mid_history(view))
+    _run("oi_chg_pct_info", report.infos, lambda: info_oi_chg_pct_threshold(view, 0.35))
+    _run("oi_chg_pct_warn", report.warnings, lambda: warn_oi_chg_pct_threshold(view, 0.50))
+
+    return report
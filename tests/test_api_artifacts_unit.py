@@ -0,0 +1,61 @@
+"""Unit tests for the API artifact cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.api.artifacts import ArtifactCache
+
+
+def _write(path: Path, values: list[int], mtime_ns: int) -> None:
+    pd.DataFrame({"x": values}).to_parquet(path, index=False)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_cache_reuses_frame_until_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "a.parquet"
+    _write(path, [1, 2], 1_000_000_000)
+    cache = ArtifactCache()
+    reads: list[Path] = []
+
+    def loader(p: Path) -> pd.DataFrame:
+        reads.append(p)
+        return pd.read_parquet(p)
+
+    first = cache.get(path, loader)
+    assert cache.get(path, loader) is first
+    assert len(reads) == 1
+
+    first.derive("sum", lambda df: int(df["x"].sum()))
+    assert first.derive("sum", lambda df: -1) == 3
+
+    _write(path, [1, 2, 3], 2_000_000_000)
+    second = cache.get(path, loader)
+    assert second is not first
+    assert second.generation > first.generation
+    assert second.frame["x"].tolist() == [1, 2, 3]
+    assert second.derive("sum", lambda df: int(df["x"].sum())) == 6
+
+
+def test_cache_keeps_previous_generation_on_failed_reload(tmp_path: Path) -> None:
+    path = tmp_path / "a.parquet"
+    _write(path, [1], 1_000_000_000)
+    cache = ArtifactCache()
+    first = cache.get(path, pd.read_parquet)
+
+    path.write_bytes(b"partial write")
+    assert cache.get(path, pd.read_parquet) is first
+
+    path.unlink()
+    assert cache.get(path, pd.read_parquet) is None
+
+
+def test_cache_raises_when_first_load_fails(tmp_path: Path) -> None:
+    path = tmp_path / "a.parquet"
+    path.write_bytes(b"not parquet")
+    with pytest.raises(Exception):
+        ArtifactCache().get(path, pd.read_parquet)
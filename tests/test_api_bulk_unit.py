@@ -0,0 +1,66 @@
+"""Unit tests for bulk Arrow/Parquet streaming over metrics_weekly."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from src.api.bulk import BulkQueryError, build_filter, open_dataset, project_columns, stream_batches
+
+
+def _write_metrics(path: Path) -> pd.DataFrame:
+    dates = pd.date_range("2024-01-02", periods=6, freq="7D")
+    df = pd.DataFrame(
+        {
+            "market_key": ["EUR"] * 6 + ["XAU"] * 6,
+            "report_date": list(dates) * 2,
+            "nc_net": range(12),
+            "open_interest": [float(i) * 10 for i in range(12)],
+        }
+    )
+    df.to_parquet(path, index=False, row_group_size=4)
+    return df
+
+
+def test_projection_and_filter_pushdown(tmp_path: Path) -> None:
+    expected = _write_metrics(tmp_path / "metrics_weekly.parquet")
+    dataset = open_dataset(tmp_path / "metrics_weekly.parquet")
+
+    columns = project_columns(dataset.schema, ["nc_net"])
+    assert columns == ["market_key", "report_date", "nc_net"]
+    expr = build_filter(dataset.schema, ["XAU"], "2024-01-09", "2024-01-30")
+
+    table = pa.ipc.open_stream(b"".join(stream_batches(dataset, columns, expr, "arrow", batch_size=2))).read_all()
+    got = table.to_pandas()
+    want = expected[
+        (expected["market_key"] == "XAU")
+        & expected["report_date"].between(pd.Timestamp("2024-01-09"), pd.Timestamp("2024-01-30"))
+    ][columns].reset_index(drop=True)
+    pd.testing.assert_frame_equal(got, want, check_dtype=False)
+
+
+def test_parquet_stream_round_trips_in_chunks(tmp_path: Path) -> None:
+    expected = _write_metrics(tmp_path / "metrics_weekly.parquet")
+    dataset = open_dataset(tmp_path / "metrics_weekly.parquet")
+
+    chunks = list(stream_batches(dataset, project_columns(dataset.schema, None), None, "parquet", batch_size=4))
+    assert len(chunks) > 2
+    got = pq.read_table(io.BytesIO(b"".join(chunks))).to_pandas()
+    pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+
+
+def test_invalid_requests(tmp_path: Path) -> None:
+    _write_metrics(tmp_path / "metrics_weekly.parquet")
+    schema = open_dataset(tmp_path / "metrics_weekly.parquet").schema
+    with pytest.raises(BulkQueryError):
+        project_columns(schema, ["nc_net,missing"])
+    with pytest.raises(BulkQueryError):
+        build_filter(schema, None, "not-a-date", None)
+    with pytest.raises(BulkQueryError):
+        build_filter(schema, None, "2024-02-01", "2024-01-01")
+    assert build_filter(schema, None, None, None) is None
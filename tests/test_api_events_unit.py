@@ -0,0 +1,96 @@
+"""Unit tests for generation watching and radar diffs pushed over SSE."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.api.events import ReportWatcher, format_sse, radar_diff
+from src.common.generation import read_generation, write_generation
+
+
+def _radar(hot: list[float], markets: list[str] | None = None) -> pd.DataFrame:
+    markets = markets or ["EUR", "GBP", "XAU"]
+    return pd.DataFrame(
+        {
+            "market_id": markets,
+            "cot_traffic_signal": [1, -1, 0][: len(markets)],
+            "hot_score": hot,
+            "conflict_level": ["Low"] * len(markets),
+            "oi_risk_level": ["Low"] * len(markets),
+            "net_z_52w_funds": [0.5, np.nan, 0.1][: len(markets)],
+            "is_hot": [False] * len(markets),
+        }
+    )
+
+
+def test_radar_diff_is_compact() -> None:
+    old = _radar([1.0, 2.0, 3.0])
+    new = _radar([1.0, 5.0], markets=["EUR", "GBP"])
+    new.loc[0, "net_z_52w_funds"] = 2.5  # EUR becomes extreme
+
+    diff = radar_diff(old, new)
+    assert diff["removed"] == ["XAU"]
+    assert diff["added"] == []
+    assert diff["unchanged"] == 0
+    changes = {c["market_id"]: c["changes"] for c in diff["changed"]}
+    assert changes["EUR"] == {"signal_state": ["bullish", "extreme"], "net_z_52w_funds": [0.5, 2.5]}
+    assert changes["GBP"] == {"hot_score": [2.0, 5.0]}  # NaN == NaN is not a change
+
+    assert [row["market_id"] for row in radar_diff(None, old)["added"]] == ["EUR", "GBP", "XAU"]
+
+
+def test_watcher_publishes_once_per_generation(tmp_path: Path) -> None:
+    radar = {"frame": _radar([1.0, 2.0, 3.0])}
+    write_generation(tmp_path, "2025-01-21", {"market_radar_latest.parquet": 3})
+    watcher = ReportWatcher(lambda: tmp_path / "generation.json", lambda: radar["frame"], poll_seconds=3600)
+
+    async def main() -> list[str]:
+        await watcher.start()
+        with watcher.subscribe() as queue:
+            assert await watcher.check() is False
+            radar["frame"] = _radar([1.0, 2.0, 9.0])
+            write_generation(tmp_path, "2025-01-28", {"market_radar_latest.parquet": 3})
+            assert await watcher.check() is True
+            assert await watcher.check() is False
+            return [queue.get_nowait() for _ in range(queue.qsize())]
+
+    messages = asyncio.run(main())
+    assert len(messages) == 1
+    assert messages[0].startswith(f"id: {read_generation(tmp_path / 'generation.json')['id']}\nevent: report\n")
+    event, data = watcher.last_event
+    assert data["previous_report_date"] == "2025-01-21"
+    assert data["radar_diff"]["changed"] == [{"market_id": "XAU", "changes": {"hot_score": [3.0, 9.0]}}]
+
+
+def test_format_sse() -> None:
+    assert format_sse("update", {"a": None}, "7") == 'id: 7\nevent: update\ndata: {"a":null}\n\n'
+
+
+def test_watcher_polls_only_while_subscribed(tmp_path: Path) -> None:
+    radar = {"frame": _radar([1.0, 2.0, 3.0])}
+    write_generation(tmp_path, "2025-01-21", {"market_radar_latest.parquet": 3})
+    watcher = ReportWatcher(lambda: tmp_path / "generation.json", lambda: radar["frame"], poll_seconds=3600)
+
+    async def main() -> None:
+        await watcher.start()
+        assert watcher._task is None
+        with watcher.subscribe():
+            with watcher.subscribe():
+                polling = watcher._task
+                assert polling is not None and not polling.done()
+            assert watcher._task is polling
+        assert watcher._task is None
+        await asyncio.sleep(0)
+        assert polling.cancelled()
+
+        # A generation written while nobody listened is picked up by the next start()
+        write_generation(tmp_path, "2025-01-28", {"market_radar_latest.parquet": 3})
+        await watcher.start()
+        assert watcher.generation["report_date"] == "2025-01-28"
+        assert watcher.last_event[1]["previous_report_date"] == "2025-01-21"
+
+    asyncio.run(main())
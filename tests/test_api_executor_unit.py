@@ -0,0 +1,95 @@
+"""Unit tests for the bounded, coalescing API worker pool."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from src.api.executor import PoolSaturated, WorkPool
+
+
+def test_identical_keys_share_one_run() -> None:
+    pool = WorkPool(max_workers=2, max_queue=0)
+    calls = []
+    release = threading.Event()
+
+    def work(x: int) -> int:
+        calls.append(x)
+        release.wait(5)
+        return x * 10
+
+    async def main() -> list[int]:
+        tasks = [asyncio.ensure_future(pool.run(("k", 1), work, 1)) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(main()) == [10] * 5
+    assert calls == [1]
+    assert pool.stats.submitted == 1 and pool.stats.coalesced == 4
+    assert pool.pending == 0
+
+
+def test_rejects_when_workers_and_queue_are_full() -> None:
+    pool = WorkPool(max_workers=1, max_queue=1, retry_after=3)
+    release = threading.Event()
+
+    async def main() -> None:
+        running = [asyncio.ensure_future(pool.run(None, release.wait, 5)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(PoolSaturated) as exc:
+            await pool.run(None, lambda: None)
+        assert exc.value.retry_after == 3
+        release.set()
+        await asyncio.gather(*running)
+        assert await pool.run(None, lambda: "ok") == "ok"
+
+    asyncio.run(main())
+    assert pool.stats.rejected == 1
+
+
+def test_errors_propagate_to_all_waiters() -> None:
+    pool = WorkPool(max_workers=1, max_queue=0)
+    release = threading.Event()
+
+    def fail() -> None:
+        release.wait(5)
+        raise ValueError("boom")
+
+    async def main() -> list:
+        tasks = [asyncio.ensure_future(pool.run("same", fail)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert pool.pending == 0
+
+
+def test_iterate_runs_each_step_on_the_pool_and_waits_when_saturated() -> None:
+    pool = WorkPool(max_workers=1, max_queue=0)
+    release = threading.Event()
+    threads = []
+
+    def chunks():
+        for i in range(3):
+            threads.append(threading.current_thread().name)
+            yield i
+
+    async def main() -> list[int]:
+        items = chunks()
+        first = await pool.run(None, next, items, None)
+        busy = asyncio.ensure_future(pool.run(None, release.wait, 5))
+        await asyncio.sleep(0.05)
+        asyncio.get_running_loop().call_later(0.1, release.set)
+        out = [item async for item in pool.iterate(items, first)]
+        await busy
+        return out
+
+    assert asyncio.run(main()) == [0, 1, 2]
+    assert all(name.startswith("cot-api") for name in threads)
+    assert pool.stats.rejected > 0
+    assert pool.pending == 0
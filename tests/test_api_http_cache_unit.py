@@ -0,0 +1,124 @@
+"""Unit tests for generation-based HTTP validators and response compression."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from src.api import http_cache
+from src.api.http_cache import (
+    GenerationTracker,
+    HttpCacheMiddleware,
+    HttpCacheSettings,
+    choose_encoding,
+)
+from src.api.responses import encode_json, json_response
+from src.common.generation import write_generation
+
+
+def _client(tmp_path: Path, calls: list[str], **settings) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(
+        HttpCacheMiddleware,
+        tracker=GenerationTracker(lambda: tmp_path / "generation.json", lambda: tmp_path / "metrics.parquet"),
+        settings=HttpCacheSettings(**settings),
+    )
+
+    @app.get("/api/rows")
+    def rows(n: int = 10) -> list[dict]:
+        calls.append("rows")
+        return [{"i": i, "label": "x" * 20} for i in range(n)]
+
+    @app.get("/api/health")
+    def health() -> dict:
+        return {"status": "ok"}
+
+    return TestClient(app)
+
+
+def test_validators_and_304_skip_the_handler(tmp_path: Path) -> None:
+    write_generation(tmp_path, "2025-01-21", {})
+    calls: list[str] = []
+    client = _client(tmp_path, calls, compression=False)
+
+    first = client.get("/api/rows?n=3&x=1")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+    assert "max-age=60" in first.headers["cache-control"]
+
+    again = client.get("/api/rows?x=1&n=3", headers={"if-none-match": etag})
+    assert again.status_code == 304
+    since = client.get("/api/rows?n=3&x=1", headers={"if-modified-since": first.headers["last-modified"]})
+    assert since.status_code == 304
+    assert calls == ["rows"]
+
+    write_generation(tmp_path, "2025-01-28", {})
+    changed = client.get("/api/rows?n=3&x=1", headers={"if-none-match": etag})
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert "etag" not in client.get("/api/health").headers
+
+
+def test_compresses_only_large_bodies(tmp_path: Path) -> None:
+    write_generation(tmp_path, "2025-01-21", {})
+    client = _client(tmp_path, [], min_size=500)
+
+    big = client.get("/api/rows?n=100", headers={"accept-encoding": "gzip"})
+    assert big.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in big.headers["vary"]
+    assert len(json.loads(big.content)) == 100  # transparently decoded by the client
+
+    revalidated = client.get("/api/rows?n=100", headers={"accept-encoding": "gzip", "if-none-match": big.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["vary"] == big.headers["vary"]
+
+    small = client.get("/api/rows?n=2", headers={"accept-encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+    assert "Accept-Encoding" in small.headers["vary"]
+
+    off = _client(tmp_path, [], compression=False).get("/api/rows?n=100", headers={"accept-encoding": "gzip"})
+    assert "content-encoding" not in off.headers
+
+
+def test_choose_encoding() -> None:
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0, identity") is None
+    assert choose_encoding(None) is None
+    assert gzip.decompress(gzip.compress(b"x")) == b"x"
+
+
+def test_precompressed_snapshot_keeps_its_validators(tmp_path: Path, monkeypatch) -> None:
+    write_generation(tmp_path, "2025-01-21", {})
+    encoded = encode_json([{"i": i, "label": "x" * 20} for i in range(100)], precompress=True)
+    app = FastAPI()
+    app.add_middleware(
+        HttpCacheMiddleware,
+        tracker=GenerationTracker(lambda: tmp_path / "generation.json", lambda: tmp_path / "metrics.parquet"),
+        settings=HttpCacheSettings(),
+    )
+
+    @app.get("/api/snapshot")
+    def snapshot(request: Request) -> Response:
+        return json_response(request, encoded)
+
+    # Served as precompressed: the middleware must not compress it again
+    monkeypatch.setattr(http_cache, "compress", lambda *args: pytest.fail("recompressed"))
+    client = TestClient(app)
+    first = client.get("/api/snapshot", headers={"accept-encoding": "gzip"})
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.headers["etag"] == encoded.variant_etag("gzip")
+    assert json.loads(first.content) == json.loads(encoded.body)
+
+    again = client.get("/api/snapshot", headers={"accept-encoding": "gzip", "if-none-match": first.headers["etag"]})
+    assert again.status_code == 304
+    assert (again.headers["etag"], again.headers["vary"]) == (first.headers["etag"], "Accept-Encoding")
+    assert first.headers["vary"] == "Accept-Encoding"
+
+    plain = client.get("/api/snapshot", headers={"accept-encoding": "identity", "if-none-match": first.headers["etag"]})
+    assert plain.status_code == 200 and plain.headers["etag"] == encoded.etag
+    assert "content-encoding" not in plain.headers
@@ -0,0 +1,51 @@
+"""Unit tests for column-array JSON serialization."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from src.api.serialization import column_values, dumps, frame_columns, frame_payload, frame_records
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "report_date": pd.to_datetime(["2025-01-07", None, "2025-01-21"]),
+            "nc_net": [1.5, np.nan, np.inf],
+            "n_markets": [3, 4, 5],
+            "is_hot": [True, False, True],
+            "label": ["a", None, "c"],
+        }
+    )
+
+
+def test_column_values_nulls_and_dates() -> None:
+    df = _frame()
+    assert column_values(df["report_date"]) == ["2025-01-07", None, "2025-01-21"]
+    assert column_values(df["nc_net"]) == [1.5, None, None]
+    assert column_values(df["n_markets"]) == [3, 4, 5]
+    assert column_values(df["is_hot"]) == [True, False, True]
+    assert column_values(df["label"]) == ["a", None, "c"]
+    assert column_values(pd.Series([1, None], dtype="Int64")) == [1, None]
+
+
+def test_records_and_columns_layouts_match() -> None:
+    df = _frame()
+    records = frame_records(df)
+    columns = frame_columns(df)
+    assert records[1] == {"report_date": None, "nc_net": None, "n_markets": 4, "is_hot": False, "label": None}
+    assert [dict(zip(columns, row)) for row in zip(*columns.values())] == records
+    assert frame_payload(df, "columns") == columns
+    assert frame_payload(df, "records") == records
+    assert frame_records(df.iloc[0:0]) == []
+
+
+def test_dumps_is_strict_json() -> None:
+    payload = {"items": frame_records(_frame()), "n": np.int64(2), "x": np.float64(0.5)}
+    decoded = json.loads(dumps(payload))
+    assert decoded["items"][1]["nc_net"] is None
+    assert decoded["n"] == 2 and decoded["x"] == 0.5
+    assert b"NaN" not in dumps(payload)
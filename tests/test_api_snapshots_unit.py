@@ -0,0 +1,61 @@
+"""Unit tests for precomputed dashboard/signals snapshots."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from src.api.responses import encode_json, etag_matches
+from src.api.snapshots import RadarSnapshots
+from src.common.signals import signal_states
+
+
+def _radar() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "market_id": ["EUR", "GBP", "XAU", "SPX"],
+            "market_name": ["Euro", "Pound", "Gold", "S&P"],
+            "category": ["FX", "FX", "METALS", "EQUITY_INDEX"],
+            "report_date": pd.to_datetime(["2025-01-21"] * 4),
+            "cot_traffic_signal": [1, -2, 0, np.nan],
+            "hot_score": [3.0, 5.0, 1.0, 0.0],
+            "conflict_level": ["Low", "High", "Low", "Medium"],
+            "oi_risk_level": ["Low", "Low", "High", "N/A"],
+            "net_z_52w_funds": [0.5, -1.0, 0.1, np.nan],
+            "open_interest_chg_1w_pct": [0.01, np.nan, 0.02, 0.0],
+            "is_hot": [False, True, False, False],
+        }
+    )
+
+
+def test_signal_states_vectorized() -> None:
+    assert signal_states(_radar()).tolist() == ["bullish", "bearish", "extreme", "neutral"]
+
+
+def test_snapshots_filter_sort_and_encode() -> None:
+    snapshots = RadarSnapshots(_radar())
+
+    payload = json.loads(snapshots.signals("all", "fx", "all", 200).body)
+    assert [item["market_id"] for item in payload["items"]] == ["GBP", "EUR"]
+    assert payload["items"][0]["open_interest_chg_1w_pct"] is None
+    assert payload["latest_report_date"] == "2025-01-21"
+
+    dashboard = json.loads(snapshots.dashboard("all", "all", 50).body)
+    assert dashboard["summary"] == {"bullish": 1, "bearish": 1, "extreme": 1, "neutral": 1}
+    assert dashboard["categories"] == ["EQUITY_INDEX", "FX", "METALS"]
+
+    # Pre-encoded default responses are reused; "ALL" is a category value, not the wildcard
+    assert snapshots.signals("all", "all", "all", 200) is snapshots.signals("all", "all", "all", 200)
+    assert json.loads(snapshots.signals("all", "ALL", "all", 200).body)["total"] == 0
+    assert json.loads(snapshots.dashboard("bearish", "all", 1).body)["total"] == 1
+
+
+def test_etag_matching() -> None:
+    encoded = encode_json({"a": 1})
+    assert etag_matches(encoded.etag, encoded.etag)
+    assert etag_matches(f'"x", W/{encoded.etag}', encoded.etag)
+    assert etag_matches("*", encoded.etag)
+    assert not etag_matches('"other"', encoded.etag)
+    assert not etag_matches(None, encoded.etag)
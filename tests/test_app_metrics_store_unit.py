@@ -0,0 +1,138 @@
+"""Unit tests for the shared Streamlit metrics store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import streamlit as st
+
+from src.app.metrics_store import build_metric_pivot, build_metrics_store
+from src.app.pages._terminal_ui import fragment, load_market_view, load_metric_pivot, load_metrics_store
+from src.common.view_models import MARKET_VIEW_FILE, build_market_view_weekly
+
+
+def test_market_views_are_sorted_slices_of_one_frame() -> None:
+    weeks = pd.date_range("2024-12-03", periods=10, freq="W-TUE")
+    metrics = pd.DataFrame(
+        {
+            "market_key": ["XAU"] * 10 + ["EUR"] * 10,
+            "report_date": list(weeks[::-1]) + list(weeks),
+            "nc_net": list(range(20)),
+        }
+    )
+    store = build_metrics_store(metrics)
+    assert store.markets == ["EUR", "XAU"]
+
+    xau = store.market("XAU")
+    assert xau["report_date"].is_monotonic_increasing
+    assert xau["nc_net"].tolist() == list(range(9, -1, -1))
+    assert store.market("GBP").empty
+
+    last_4w = store.market_range("EUR", "4W")
+    assert len(last_4w) == 5  # latest minus 28 days, inclusive
+    ytd = store.market_range("EUR", "YTD")
+    assert ytd["report_date"].min() == pd.Timestamp("2025-01-07")
+    assert len(store.market_range("EUR", "ALL")) == 10
+
+
+def test_market_id_fallback_and_missing_columns() -> None:
+    store = build_metrics_store(
+        pd.DataFrame({"market_id": ["XAU", "EUR"], "report_date": pd.to_datetime(["2025-01-07", "2025-01-07"])})
+    )
+    assert store.markets == ["EUR", "XAU"]
+    assert build_metrics_store(pd.DataFrame({"x": [1]})).markets == []
+
+
+def test_page_manifest_is_a_column_view_of_one_store(tmp_path: Path) -> None:
+    path = tmp_path / "metrics_weekly.parquet"
+    pd.DataFrame(
+        {
+            "market_key": ["XAU", "XAU", "EUR"],
+            "report_date": pd.to_datetime(["2025-01-14", "2025-01-07", "2025-01-07"]),
+            "nc_net": [2.0, 1.0, 3.0],
+            "comm_net": 0.0,
+            "unused": 1.0,
+        }
+    ).to_parquet(path, index=False)
+
+    store = load_metrics_store(str(path), path.stat().st_mtime, ("nc_net", "not_in_file"))
+    assert list(store.frame.columns) == ["market_key", "report_date", "nc_net"]
+    assert store.markets == ["EUR", "XAU"]
+    assert store.market("XAU")["nc_net"].tolist() == [1.0, 2.0]
+    full = load_metrics_store(str(path), path.stat().st_mtime)
+    assert "unused" in full.frame.columns
+    assert np.shares_memory(store.frame["nc_net"].to_numpy(), full.frame["nc_net"].to_numpy())
+
+
+def test_metric_pivot_is_dates_by_markets() -> None:
+    metrics = pd.DataFrame(
+        {
+            "market_key": ["XAU", "XAU", "XAU", "EUR", "EUR"],  # EUR lacks the latest week
+            "report_date": pd.to_datetime(["2025-01-21", "2025-01-14", "2025-01-07", "2025-01-07", "2025-01-14"]),
+            "nc_net": [3.0, 2.0, 1.0, 10.0, 11.0],
+        }
+    )
+    pivot = build_metric_pivot(metrics, "nc_net")
+
+    assert list(pivot.columns) == ["EUR", "XAU"]
+    assert pivot.index.is_monotonic_increasing and len(pivot) == 3
+    assert pivot["XAU"].tolist() == [1.0, 2.0, 3.0]
+    assert pivot["EUR"].iloc[:-1].tolist() == [10.0, 11.0]
+    assert pd.isna(pivot["EUR"].iloc[-1])
+    assert build_metric_pivot(metrics, "missing").empty
+
+
+def test_pivot_loader_reads_one_metric_and_slices_ranges(tmp_path: Path) -> None:
+    path = tmp_path / "metrics_weekly.parquet"
+    pd.DataFrame(
+        {
+            "market_key": ["EUR"] * 10,
+            "report_date": pd.date_range("2024-12-03", periods=10, freq="W-TUE"),
+            "nc_net": range(10),
+            "comm_net": 0,
+        }
+    ).to_parquet(path, index=False)
+
+    full = load_metric_pivot(str(path), path.stat().st_mtime, "nc_net")
+    last_4w = load_metric_pivot(str(path), path.stat().st_mtime, "nc_net", "4W")
+    assert len(full) == 10
+    assert len(last_4w) == 5
+    assert last_4w.equals(full.iloc[-5:])
+
+
+def test_market_view_falls_back_to_the_full_metrics_row(tmp_path: Path) -> None:
+    path = tmp_path / "metrics_weekly.parquet"
+    metrics = pd.DataFrame(
+        {
+            "market_key": ["XAU", "XAU"],
+            "report_date": pd.to_datetime(["2025-01-07", "2025-01-14"]),
+            "nc_long": [4000.0, 5000.0],
+            "nc_long_min_all": [1000.0, 1000.0],
+            "nc_long_max_all": [9000.0, 9000.0],
+            "nc_long_pos_all": [0.375, 0.5],
+        }
+    )
+    metrics.to_parquet(path, index=False)
+    # The view artifact is one generation behind: it has no record for the latest week
+    build_market_view_weekly(metrics.iloc[:1]).to_parquet(path.with_name(MARKET_VIEW_FILE), index=False)
+    load_metrics_store(str(path), path.stat().st_mtime, ("nc_long",))  # the page's projected store
+
+    view = load_market_view(path, "XAU", pd.Timestamp("2025-01-14"))
+    assert view["nc_long_text"] == "5,000"
+    assert view["nc_long_ext_all_pos"] == 50.0
+    assert "Min: N/A" not in view["nc_long_ext_all_tip"]
+
+
+def test_fragment_falls_back_to_plain_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    def block() -> str:
+        return "rendered"
+
+    monkeypatch.delattr(st, "fragment", raising=False)
+    monkeypatch.setattr(st, "experimental_fragment", lambda fn: ("experimental", fn), raising=False)
+    assert fragment(block) == ("experimental", block)
+
+    monkeypatch.delattr(st, "experimental_fragment")
+    assert fragment(block) is block
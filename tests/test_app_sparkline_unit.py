@@ -0,0 +1,51 @@
+"""Unit tests for the overview sparkline renderer and its data window."""
+
+from __future__ import annotations
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from src.app.pages.overview_sections.common import create_sparkline, get_13w_net_data, sparkline_for
+
+
+def _paths(svg: str) -> list[tuple[str, list[str]]]:
+    return [
+        (color, d.split(" L"))
+        for d, color in re.findall(r'<path d="M([^"]+)" fill="none" stroke="([^"]+)"', svg)
+    ]
+
+
+def test_one_path_per_color_run_split_at_zero() -> None:
+    svg = create_sparkline([2.0, 1.0, -1.0, -2.0, None, 3.0], width=108, height=18)
+    paths = _paths(svg)
+    assert [color for color, _ in paths] == ["#10b981", "#ef4444", "#10b981"]
+    # 100x10 plot area: x = 4 + 20 * i, y = 10 - 2 * v (zero line at y = 10)
+    assert paths[0][1] == ["4.00 6.00", "24.00 8.00", "34.00 10.00"]
+    assert paths[1][1] == ["34.00 10.00", "44.00 12.00", "64.00 14.00", "80.00 10.00"]
+    assert paths[2][1] == ["80.00 10.00", "104.00 4.00"]
+    assert '<circle cx="104.00" cy="4.00"' in svg
+
+
+def test_too_few_values() -> None:
+    assert create_sparkline([]) == ""
+    assert create_sparkline([1.0, None, np.nan]) == ""
+    assert create_sparkline(np.array([1.0, 2.0])) != ""
+
+
+def test_window_matches_sorted_filter_and_memo() -> None:
+    weeks = pd.date_range("2024-01-02", periods=20, freq="W-TUE")
+    df = pd.DataFrame({"report_date": weeks, "nc_net": np.arange(20.0)})
+    current = weeks[15]
+    expected = list(range(3, 16))
+    assert get_13w_net_data(df, current, "nc_net") == expected
+    assert get_13w_net_data(df.iloc[::-1], current, "nc_net") == expected
+    assert get_13w_net_data(df, current, "missing") == []
+
+    direct = sparkline_for(df, current, "nc_net")
+    assert sparkline_for(df, current, "nc_net", market="XAU", generation=1.0) == direct
+    # Same key returns the memoized SVG; a new generation re-renders
+    changed = df.assign(nc_net=-df["nc_net"])
+    assert sparkline_for(changed, current, "nc_net", market="XAU", generation=1.0) == direct
+    assert sparkline_for(changed, current, "nc_net", market="XAU", generation=2.0) != direct
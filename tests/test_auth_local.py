@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import sqlite3
+
+import src.app.auth as auth
 from src.app.auth import (
     authenticate_local,
     hash_password,
@@ -46,3 +49,98 @@ def test_admin_email_gets_admin_active_access(tmp_path, monkeypatch) -> None:
     login_ok, login_err = authenticate_local("owner@example.com", "StrongPass_123!")
     assert login_ok
     assert login_err == ""
+
+
+def test_init_auth_db_runs_ddl_once_per_db_file(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "auth.db"
+    monkeypatch.setenv("COT_AUTH_DB_PATH", str(db_path))
+    calls = []
+    create_tables = auth._create_auth_tables
+    monkeypatch.setattr(auth, "_create_auth_tables", lambda: (calls.append(1), create_tables()))
+
+    init_auth_db()
+    init_auth_db()
+    assert len(calls) == 1
+
+    # A removed DB file gets its schema again
+    db_path.unlink()
+    init_auth_db()
+    assert len(calls) == 2
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'users'").fetchone()
+
+
+def test_connections_are_pooled_in_wal_mode(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("COT_AUTH_DB_PATH", str(tmp_path / "auth.db"))
+    init_auth_db()
+
+    with auth._connect() as conn:
+        first = conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    with auth._connect() as conn:
+        assert conn is first
+
+
+def test_session_cache_skips_db_until_revoked(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("COT_AUTH_DB_PATH", str(tmp_path / "auth.db"))
+    monkeypatch.setenv("COT_ADMIN_EMAIL", "owner@example.com")
+    init_auth_db()
+    register_local("owner@example.com", "StrongPass_123!")
+    token = auth._create_session_for_user(int(auth._get_user_by_email("owner@example.com")["id"]))
+
+    assert auth._load_user_by_session_token(token)["email"] == "owner@example.com"
+    queries = []
+    connect = auth._connect
+    monkeypatch.setattr(auth, "_connect", lambda: (queries.append(1), connect())[1])
+    assert auth._load_user_by_session_token(token)["email"] == "owner@example.com"
+    assert queries == []
+
+    auth._revoke_session_token(token)
+    assert auth._load_user_by_session_token(token) is None
+
+
+def test_role_change_invalidates_cached_user(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("COT_AUTH_DB_PATH", str(tmp_path / "auth.db"))
+    monkeypatch.delenv("COT_ADMIN_EMAIL", raising=False)
+    init_auth_db()
+    register_local("user@example.com", "StrongPass_123!")
+
+    assert auth._cached_user_by_email("user@example.com")["status"] == "pending"
+    ok, _ = auth._update_user_role_status("user@example.com", "admin", "active")
+    assert ok
+    user = auth._cached_user_by_email("user@example.com")
+    assert (user["role"], user["status"]) == ("admin", "active")
+
+
+def test_failed_logins_are_throttled_per_email_and_ip(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("COT_AUTH_DB_PATH", str(tmp_path / "auth.db"))
+    monkeypatch.setenv("COT_ADMIN_EMAIL", "owner@example.com")
+    init_auth_db()
+    register_local("owner@example.com", "StrongPass_123!")
+
+    for _ in range(auth.LOGIN_MAX_FAILURES_PER_EMAIL):
+        assert authenticate_local("owner@example.com", "wrong-pass") == (False, "Invalid email or password.")
+    ok, err = authenticate_local("owner@example.com", "StrongPass_123!")
+    assert not ok
+    assert "too many" in err.lower()
+
+    monkeypatch.setattr(auth, "LOGIN_MAX_FAILURES_PER_IP", 2)
+    for _ in range(2):
+        authenticate_local("nobody@example.com", "wrong-pass", client_ip="10.0.0.1")
+    assert "too many" in authenticate_local("other@example.com", "x", client_ip="10.0.0.1")[1].lower()
+    assert authenticate_local("other@example.com", "x", client_ip="10.0.0.2")[1] == "Invalid email or password."
+
+
+def test_login_rehashes_password_when_iterations_change(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("COT_AUTH_DB_PATH", str(tmp_path / "auth.db"))
+    monkeypatch.setenv("COT_ADMIN_EMAIL", "owner@example.com")
+    init_auth_db()
+    monkeypatch.setattr(auth, "PASSWORD_HASH_ITERATIONS", 1_000)
+    register_local("owner@example.com", "StrongPass_123!")
+    assert auth._get_user_by_email("owner@example.com")["password_hash"].startswith("pbkdf2_sha256$1000$")
+
+    monkeypatch.setattr(auth, "PASSWORD_HASH_ITERATIONS", 2_000)
+    assert authenticate_local("owner@example.com", "StrongPass_123!") == (True, "")
+    password_hash = auth._get_user_by_email("owner@example.com")["password_hash"]
+    assert password_hash.startswith("pbkdf2_sha256$2000$")
+    assert verify_password("StrongPass_123!", password_hash)
@@ -0,0 +1,49 @@
+"""Unit tests for chart downsampling (min-max buckets and LTTB)."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from src.common.downsample import downsample_frame, lttb_indices, minmax_indices, point_budget
+
+
+def test_minmax_keeps_bucket_extremes_and_skips_nan() -> None:
+    y = np.array([0.0, 5.0, 1.0, np.nan, -3.0, 2.0, 0.5, 9.0, 1.0, 0.0])
+    # Buckets of 5: [0, 5) and [5, 10)
+    assert minmax_indices(y, 2).tolist() == [0, 1, 4, 7, 9]
+    assert minmax_indices(y, 10).tolist() == list(range(10))
+
+
+def test_lttb_keeps_endpoints_and_spike() -> None:
+    x = np.arange(100.0)
+    y = np.zeros(100)
+    y[37] = 50.0
+    picks = lttb_indices(x, y, 10)
+    assert len(picks) == 10
+    assert picks[0] == 0 and picks[-1] == 99
+    assert 37 in picks
+    assert lttb_indices(x, y, 200).tolist() == list(range(100))
+
+
+def test_frame_downsampled_to_width_keeps_every_series_range() -> None:
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame(
+        {
+            "report_date": pd.date_range("2000-01-04", periods=2000, freq="W-TUE"),
+            "nc_net": np.cumsum(rng.normal(size=2000)),
+            "comm_net": np.cumsum(rng.normal(size=2000)),
+        }
+    )
+    out = downsample_frame(df, 400)
+    assert len(out) <= point_budget(400)
+    assert out["report_date"].is_monotonic_increasing
+    for col in ("nc_net", "comm_net"):
+        assert out[col].max() == df[col].max()
+        assert out[col].min() == df[col].min()
+    assert out.iloc[[0, -1]].equals(df.iloc[[0, -1]])
+
+    # Ranges that already fit the width (zoomed in) keep full resolution
+    short = df.tail(52)
+    assert downsample_frame(short, 400) is short
+    assert downsample_frame(df, None) is df
@@ -0,0 +1,88 @@
+"""Unit tests for the per-market metrics index shared by the API and the Streamlit store."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from src.common.market_index import build_market_index
+
+
+def _cutoff_4w(latest: pd.Timestamp) -> pd.Timestamp:
+    return latest - pd.Timedelta(days=28)
+
+
+def test_market_rows_and_binary_search_range() -> None:
+    weeks = pd.date_range("2025-01-07", periods=8, freq="W-TUE")
+    metrics = pd.DataFrame(
+        {
+            "market_key": ["XAU"] * 8 + ["EUR"] * 8,
+            "report_date": list(weeks[::-1]) + list(weeks),
+            "nc_net": list(range(16)),
+        }
+    )
+    index = build_market_index(metrics)
+
+    assert index.ranges == {"EUR": (0, 8), "XAU": (8, 16)}
+    xau = index.market_rows("XAU")
+    assert xau["report_date"].is_monotonic_increasing
+    assert xau["nc_net"].tolist() == list(range(7, -1, -1))
+
+    last_4w = index.range_rows("EUR", _cutoff_4w)
+    assert last_4w["report_date"].tolist() == list(weeks[-5:])
+    assert index.range_rows("EUR", lambda latest: None)["report_date"].tolist() == list(weeks)
+    assert index.market_rows("GBP") is None
+
+
+def test_range_rows_skip_missing_report_dates() -> None:
+    metrics = pd.DataFrame(
+        {
+            "market_key": ["EUR"] * 3,
+            "report_date": pd.to_datetime(["2025-01-14", None, "2025-01-07"]),
+            "nc_net": [2.0, 9.0, 1.0],
+        }
+    )
+    index = build_market_index(metrics)
+
+    assert index.market_rows("EUR")["nc_net"].tolist() == [1.0, 2.0, 9.0]
+    assert index.range_rows("EUR", _cutoff_4w)["nc_net"].tolist() == [1.0, 2.0]
+
+
+def test_date_bounds_start_end_and_nat() -> None:
+    weeks = pd.date_range("2025-01-07", periods=6, freq="W-TUE")
+    metrics = pd.DataFrame(
+        {
+            "market_key": ["EUR"] * 7,
+            "report_date": [*weeks, pd.NaT],
+            "nc_net": list(range(7)),
+        }
+    )
+    index = build_market_index(metrics)
+
+    assert index.date_bounds("EUR") == (0, 6)
+    assert index.date_bounds("EUR", weeks[1], weeks[3]) == (1, 4)
+    assert index.date_bounds("EUR", weeks[1] + pd.Timedelta(days=1), None) == (2, 6)
+    assert index.date_bounds("EUR", None, weeks[0] - pd.Timedelta(days=1)) == (0, 0)
+    assert index.date_bounds("EUR", weeks[4], weeks[2]) == (4, 4)
+    assert index.date_bounds("GBP") is None
+
+
+def test_page_bounds_keyset_both_orders() -> None:
+    weeks = pd.date_range("2025-01-07", periods=5, freq="W-TUE")
+    metrics = pd.DataFrame(
+        {
+            "market_key": ["GBP"] * 2 + ["EUR"] * 6,
+            "report_date": [weeks[0], weeks[1], *weeks, pd.NaT],
+            "nc_net": list(range(8)),
+        }
+    )
+    index = build_market_index(metrics)
+    assert index.ranges["EUR"] == (0, 6)
+
+    assert index.page_bounds("EUR", None, 2) == (3, 5, True)
+    assert index.page_bounds("EUR", weeks[3], 2) == (1, 3, True)
+    assert index.page_bounds("EUR", weeks[1], 2) == (0, 1, False)
+    assert index.page_bounds("EUR", weeks[0], 2) == (0, 0, False)
+
+    assert index.page_bounds("EUR", None, 3, descending=False) == (0, 3, True)
+    assert index.page_bounds("EUR", weeks[2], 3, descending=False) == (3, 5, False)
+    assert index.page_bounds("XAU", None, 3) is None
@@ -0,0 +1,73 @@
+"""Unit tests for the per-market UI view model builder."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from src.common.formatting import (
+    delta_arrow_template,
+    fmt_delta_arrow,
+    fmt_move_strength,
+    move_strength_template,
+)
+from src.common.view_models import build_market_view_weekly, market_view_record
+
+
+def test_records_are_sorted_and_formatted() -> None:
+    metrics = pd.DataFrame(
+        {
+            "market_key": ["XAU", "XAU"],
+            "report_date": pd.to_datetime(["2025-01-14", "2025-01-07"]),
+            "cot_traffic_signal": [1, 0],
+            "net_z_52w_funds": [0.5, 2.4],
+            "oi_risk_level": ["Low", "Low"],
+            "nc_net": [1234.4, -50.0],
+            "nc_net_chg_1w": [1284.4, np.nan],
+            "nc_long": [5000.0, 4000.0],
+            "nc_long_min_all": [1000.0, 1000.0],
+            "nc_long_max_all": [9000.0, 9000.0],
+            "nc_long_pos_all": [0.5, 1.2],
+        }
+    )
+
+    views = build_market_view_weekly(metrics)
+
+    assert views["report_date"].is_monotonic_increasing
+    latest = views.iloc[-1]
+    assert latest["signal_state"] == "bullish"
+    assert latest["signal_color"] == "#22c55e"
+    assert views.iloc[0]["signal_state"] == "extreme"
+    assert (latest["kpi_funds_net"], latest["kpi_funds_z"], latest["kpi_updated"]) == ("1,234", "0.50", "2025-01-14")
+    assert latest["nc_net_text"] == "1,234"
+    assert (latest["nc_net_delta_dir"], latest["nc_net_delta_text"]) == ("up", "+1,284")
+    assert latest["nc_long_ext_all_pos"] == 50.0
+    assert latest["nc_long_ext_all_tip"] == "Min: 1,000 | Current: 5,000 | Max: 9,000"
+    assert views.iloc[0]["nc_long_ext_all_pos"] == 100.0  # clamped
+
+
+def test_templates_match_direct_formatting() -> None:
+    view = market_view_record(
+        {
+            "nc_net_chg_1w": 1284.4,
+            "nc_net_move_pct_all": 0.97,
+            "nc_net_chg_1w_min_all": -900.0,
+            "nc_net_chg_1w_max_all": 1500.0,
+        }
+    )
+
+    assert delta_arrow_template(view["nc_net_delta_dir"], view["nc_net_delta_text"]) == fmt_delta_arrow(1284.4)
+    assert move_strength_template(
+        view["nc_strength_pct_text"], view["nc_strength_pct_color"], view["nc_strength_tip"]
+    ) == fmt_move_strength(1284.4, 0.97, -900.0, 1500.0)
+
+
+def test_missing_sources_render_as_no_data() -> None:
+    view = market_view_record({"market_key": "EUR", "report_date": pd.Timestamp("2025-01-07")})
+
+    assert view["signal_state"] == "neutral"
+    assert view["kpi_funds_net"] == "N/A"
+    assert not view["nr_has_data"]
+    assert view["nc_net_delta_dir"] == "na"
+    assert np.isnan(view["comm_net_move_5y_pos"])
+    assert view["comm_net_move_5y_tip"] == "No data for this week"
@@ -0,0 +1,43 @@
+"""Unit tests for category/portfolio aggregates."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from src.compute.build_category_aggregates import build_category_aggregates
+
+
+def test_category_aggregates_oi_and_equal_weighted() -> None:
+    metrics = pd.DataFrame(
+        {
+            "market_key": ["EUR", "GBP", "XAU"],
+            "report_date": pd.to_datetime(["2025-01-07"] * 3),
+            "category": ["FX", "FX", "METALS"],
+            "open_interest": [100.0, 300.0, 200.0],
+            "nc_net": [50.0, -30.0, 20.0],
+            "nc_net_chg_1w": [10.0, np.nan, -20.0],
+            "net_z_52w_funds": [1.0, -1.0, 2.0],
+            "nc_gross_chg_1w": [20.0, 10.0, 40.0],
+            "nc_rotation_1w": [10.0, 5.0, 20.0],
+        }
+    )
+
+    out = build_category_aggregates(metrics).set_index("category")
+
+    assert out.index.tolist() == ["ALL", "FX", "METALS"]
+    assert out.loc["FX", "n_markets"] == 2
+    assert out.loc["ALL", "open_interest"] == 600.0
+
+    # OI-weighted: sum(net) / sum(OI); equal-weighted: mean(net / OI)
+    assert np.isclose(out.loc["FX", "nc_net_pct_oi_oiw"], 20.0 / 400.0)
+    assert np.isclose(out.loc["FX", "nc_net_pct_oi_ew"], (0.5 - 0.1) / 2)
+    assert np.isclose(out.loc["ALL", "nc_net_pct_oi_oiw"], 40.0 / 600.0)
+
+    # Missing flow rows are excluded from both numerator and denominator
+    assert np.isclose(out.loc["FX", "nc_flow_pct_oi_1w_oiw"], 10.0 / 100.0)
+    assert np.isclose(out.loc["FX", "nc_rotation_share_1w_oiw"], 15.0 / 30.0)
+
+    assert np.isclose(out.loc["FX", "net_z_52w_funds_oiw"], (100.0 - 300.0) / 400.0)
+    assert np.isclose(out.loc["FX", "net_z_52w_funds_ew"], 0.0)
+    assert np.isnan(out.loc["METALS", "comm_net_pct_oi_oiw"])
@@ -0,0 +1,64 @@
+"""Unit tests for cross-sectional ranks."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.common.cross_section import RankingQueryError, rank_week, week_slice
+from src.compute.build_cross_section import build_cross_section_ranks
+
+
+def test_cross_section_ranks_per_week_and_category() -> None:
+    weeks = pd.to_datetime(["2025-01-07", "2025-01-14"])
+    metrics = pd.DataFrame(
+        {
+            "market_key": ["EUR", "GBP", "XAU"] * 2,
+            "report_date": np.repeat(weeks, 3),
+            "category": ["FX", "FX", "METALS"] * 2,
+            "net_z_52w_funds": [1.0, 2.0, 3.0, -1.0, np.nan, 0.5],
+            "nc_net_pct_oi": [0.1, 0.2, 0.3, 0.3, 0.2, 0.1],
+            "oi_z_52w": [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        }
+    )
+    radar_history = pd.DataFrame(
+        {
+            "market_id": ["EUR", "GBP", "XAU"] * 2,
+            "report_date": np.repeat(weeks, 3),
+            "hot_score": [1.0, 3.0, 2.0, 0.0, 0.0, 5.0],
+        }
+    )
+
+    out = build_cross_section_ranks(metrics, radar_history)
+
+    # report_date-major, hottest first within each week
+    assert out["report_date"].is_monotonic_increasing
+    assert out["market_key"].tolist() == ["GBP", "XAU", "EUR", "XAU", "EUR", "GBP"]
+
+    first = week_slice(out, pd.Timestamp("2025-01-07")).set_index("market_key")
+    assert first["net_z_52w_funds_pct_xs"].to_dict() == {"GBP": 2 / 3, "XAU": 1.0, "EUR": 1 / 3}
+    assert first["net_z_52w_funds_pct_cat"].to_dict() == {"GBP": 1.0, "XAU": 1.0, "EUR": 0.5}
+    assert first["n_markets"].eq(3).all()
+
+    second = week_slice(out, pd.Timestamp("2025-01-14")).set_index("market_key")
+    assert np.isnan(second.loc["GBP", "net_z_52w_funds_pct_xs"])
+    assert second["hot_rank"].to_dict() == {"XAU": 1.0, "EUR": 2.0, "GBP": 2.0}
+    assert week_slice(out, pd.Timestamp("2025-01-21")).empty
+
+
+def test_rank_week_scopes() -> None:
+    week = pd.DataFrame(
+        {
+            "market_key": ["EUR", "GBP", "XAU"],
+            "category": ["FX", "FX", "METALS"],
+            "hot_score_pct_xs": [0.5, 1.0, 0.25],
+            "hot_score_pct_cat": [0.5, 1.0, 1.0],
+        }
+    )
+
+    assert rank_week(week, "hot_score", "all", "all", "desc")["market_key"].tolist() == ["GBP", "EUR", "XAU"]
+    assert rank_week(week, "hot_score", "category", "fx", "asc")["market_key"].tolist() == ["EUR", "GBP"]
+    # Within-category percentiles of different categories are not comparable
+    with pytest.raises(RankingQueryError):
+        rank_week(week, "hot_score", "category", "all", "desc")
@@ -0,0 +1,68 @@
+"""Unit tests for market radar history/latest builders."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from src.compute.build_market_radar import (
+    build_market_radar_history,
+    build_market_radar_latest,
+    latest_radar_from_history,
+)
+
+
+def test_radar_history_has_one_row_per_market_week() -> None:
+    weeks = pd.to_datetime(["2025-01-07", "2025-01-14", "2025-01-21"])
+    metrics = pd.DataFrame(
+        {
+            "market_key": ["EUR"] * 3 + ["XAU"] * 3,
+            "report_date": list(weeks) * 2,
+            "category": ["FX"] * 3 + ["METALS"] * 3,
+            "cot_traffic_signal": [0, 1, -2, 0, 0, 0],
+            "conflict_level": ["Low", "High", "High", "Low", "Low", "Medium"],
+            "oi_regime": ["N/A", "Expansion_Early", "Distribution", "Neutral", "Rebuild", "Mixed"],
+            "oi_z_52w": [np.nan, 0.5, 2.4, 1.6, 0.1, -0.2],
+            "oi_risk_level": ["N/A", "Low", "High", "Elevated", "Low", "Low"],
+            "net_z_52w_funds": [np.nan, 1.7, -2.3, 0.2, -1.55, 0.0],
+            "net_z_52w_commercials": [np.nan, -1.0, 1.9, 0.3, 1.2, 0.0],
+            "nc_net": [10.0, 20.0, 30.0, 40.0, 50.0, 60.0],
+            "open_interest": [100, 110, 120, 130, 140, 150],
+        }
+    )
+
+    history = build_market_radar_history(metrics, {"EUR": "Euro"})
+
+    assert len(history) == 6
+    assert history["market_name"].tolist()[:3] == ["Euro"] * 3
+    assert history["market_name"].tolist()[3:] == ["XAU"] * 3
+    assert history["hot_score"].tolist() == [0.0, 5.0, 9.0, 1.5, 1.0, 0.0]
+    assert history["confirmed_imbalance"].tolist() == [False, True, True, False, True, False]
+    assert history.loc[2, "why_tags"] == (
+        "High Conflict | Funds Extreme (Z=-2.3) | OI: Distribution | OI Risk: High"
+    )
+    assert history.loc[5, "why_tags"] == ""
+
+
+def test_latest_radar_is_slice_of_history() -> None:
+    metrics = pd.DataFrame(
+        {
+            "market_key": ["EUR", "EUR", "XAU"],
+            "report_date": pd.to_datetime(["2025-01-14", "2025-01-21", "2025-01-21"]),
+            "category": ["FX", "FX", "METALS"],
+            "cot_traffic_signal": [1, -2, 0],
+            "conflict_level": ["High", "High", "Low"],
+            "oi_regime": ["Expansion_Early", "Distribution", "Rebuild"],
+            "oi_z_52w": [0.5, 2.4, 0.1],
+            "oi_risk_level": ["Low", "High", "Low"],
+            "net_z_52w_funds": [1.7, -2.3, 0.2],
+            "net_z_52w_commercials": [-1.0, 1.9, 0.3],
+            "nc_net": [20.0, 30.0, 40.0],
+            "open_interest": [110, 120, 130],
+        }
+    )
+    history = build_market_radar_history(metrics, {})
+    latest = build_market_radar_latest(metrics, {})
+
+    pd.testing.assert_frame_equal(latest_radar_from_history(history), latest)
+    assert latest["report_date"].eq(pd.Timestamp("2025-01-21")).all()
@@ -0,0 +1,95 @@
+"""Unit tests for window specs and the shared rolling engine."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.compute.build_extremes import build_extremes
+from src.compute.build_moves import build_moves_weekly
+from src.compute.rolling_windows import DEFAULT_WINDOWS, RollingEngine, WindowSpec, load_windows
+
+
+def _two_markets(n: int = 30) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    weeks = pd.date_range("2020-01-07", periods=n, freq="W-TUE")
+    values = rng.normal(size=2 * n)
+    values[[3, 40]] = np.nan
+    return pd.DataFrame(
+        {
+            "market_key": ["EUR"] * n + ["XAU"] * n,
+            "report_date": list(weeks) * 2,
+            "x": values,
+        }
+    )
+
+
+def test_engine_rolling_matches_groupby_transform() -> None:
+    df = _two_markets()
+    spec = WindowSpec("8w", 8, 4)
+    out = RollingEngine(df["market_key"]).rolling(df[["x"]], [spec], ("mean", "std", "max"))
+
+    grouped = df.groupby("market_key")["x"]
+    expected_mean = grouped.transform(lambda s: s.rolling(8, min_periods=4).mean())
+    expected_std = grouped.transform(lambda s: s.rolling(8, min_periods=4).std(ddof=0))
+    expected_max = grouped.transform(lambda s: s.rolling(8, min_periods=4).max())
+
+    pd.testing.assert_series_equal(out[("x", "mean", "8w")], expected_mean, check_names=False)
+    pd.testing.assert_series_equal(out[("x", "std", "8w")], expected_std, check_names=False)
+    pd.testing.assert_series_equal(out[("x", "max", "8w")], expected_max, check_names=False)
+
+
+def test_engine_pct_rank_matches_rolling_apply() -> None:
+    df = _two_markets()
+
+    def pct(window: np.ndarray) -> float:
+        target = window[-1]
+        if np.isnan(target):
+            return np.nan
+        valid = window[~np.isnan(window)]
+        return np.sum(valid <= target) / len(valid)
+
+    out = RollingEngine(df["market_key"]).rolling_pct_rank(df[["x"]], [WindowSpec("10w", 10, 5)])
+    expected = df.groupby("market_key")["x"].transform(
+        lambda s: s.rolling(10, min_periods=5).apply(pct, raw=True)
+    )
+    pd.testing.assert_series_equal(out[("x", "10w")], expected, check_names=False)
+
+
+def test_engine_rejects_ungrouped_keys() -> None:
+    with pytest.raises(ValueError):
+        RollingEngine(pd.Series(["EUR", "XAU", "EUR"]))
+
+
+def test_extra_windows_add_column_families() -> None:
+    df = _two_markets().rename(columns={"x": "nc_net"})
+    specs = [*DEFAULT_WINDOWS["extremes"], WindowSpec("12w", 12, 6)]
+
+    out = build_extremes(df, specs)
+    assert {"nc_net_min_5y", "nc_net_pos_5y", "nc_net_min_12w", "nc_net_max_12w", "nc_net_pos_12w"} <= set(out.columns)
+    assert out["nc_net_pos_12w"].iloc[:5].isna().all()
+
+    moves = build_moves_weekly(df.rename(columns={"nc_net": "nc_net_chg_1w"}), [WindowSpec("12w", 12, 6)])
+    assert "nc_net_move_pct_12w" in moves.columns
+    assert "nc_net_move_pct_5y" not in moves.columns
+
+
+def test_load_windows_defaults_and_validation(tmp_path: Path) -> None:
+    assert load_windows(tmp_path) == DEFAULT_WINDOWS
+
+    (tmp_path / "windows.yaml").write_text(
+        "zscore:\n  - {label: 26w, window: 26, min_periods: 13}\n", encoding="utf-8"
+    )
+    with pytest.raises(ValueError, match="52w"):
+        load_windows(tmp_path)
+
+    (tmp_path / "windows.yaml").write_text(
+        "extremes:\n  - {label: 5y, window: 260, min_periods: 52}\n  - {label: 2y, window: 104, min_periods: 26}\n",
+        encoding="utf-8",
+    )
+    windows = load_windows(tmp_path)
+    assert [s.label for s in windows["extremes"]] == ["5y", "2y"]
+    assert windows["zscore"] == DEFAULT_WINDOWS["zscore"]
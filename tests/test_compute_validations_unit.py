@@ -0,0 +1,66 @@
+"""Unit tests for compute QA validators."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from src.compute.validations import (
+    SortedMetricsView,
+    run_metrics_validations,
+    validate_chg_1w,
+    warn_missing_weeks,
+    warn_oi_missing_mid_history,
+)
+
+
+def _frame() -> pd.DataFrame:
+    weeks = pd.to_datetime(["2025-01-07", "2025-01-14", "2025-01-21", "2025-02-04"])
+    df = pd.DataFrame(
+        {
+            "market_key": ["XAU"] * 4 + ["EUR"] * 4,
+            "report_date": list(weeks) * 2,
+            "open_interest": [10.0, np.nan, 12.0, 13.0, np.nan, 5.0, 6.0, 7.0],
+        }
+    )
+    for group in ["nc", "comm"]:
+        for side in ["long", "short", "total"]:
+            df[f"{group}_{side}"] = np.arange(8, dtype="float64")
+            df[f"{group}_{side}_chg_1w"] = [np.nan, 1.0, 1.0, 1.0] * 2
+    return df
+
+
+def test_view_sorts_once_and_finds_market_blocks() -> None:
+    view = SortedMetricsView(_frame())
+
+    assert view.markets.tolist() == ["EUR", "XAU"]
+    assert view.starts.tolist() == [0, 4]
+    assert view.prev(view.df["open_interest"]).isna().tolist() == [True, True, False, False, True, False, True, False]
+
+
+def test_vectorized_warnings_per_market() -> None:
+    df = _frame()
+
+    assert warn_missing_weeks(df) == [
+        "Missing weeks WARN: EUR has 1 gaps > 8 days (max gap 14 days)",
+        "Missing weeks WARN: XAU has 1 gaps > 8 days (max gap 14 days)",
+    ]
+    # EUR's leading NaN is not mid-history; XAU's second-row NaN is
+    assert warn_oi_missing_mid_history(df) == ["Open Interest WARN: XAU has 1 NaN values after initial data"]
+
+
+def test_chg_1w_nan_only_on_first_row() -> None:
+    df = _frame()
+    df.loc[2, "nc_long_chg_1w"] = np.nan
+
+    errors = validate_chg_1w(SortedMetricsView(df))
+    assert "nc_long_chg_1w: 2 NaN values for market_key 'XAU' (expected at most 1 NaN for first row)" in errors
+
+
+def test_suite_reports_timings() -> None:
+    report = run_metrics_validations(_frame(), expected_rows=9)
+
+    assert "Metrics row count (8) != positions row count (9). Expected 1:1 join." in report.errors
+    assert {"sorted_view", "chg_1w", "oi_metrics"} <= set(report.timings)
+    assert report.total_seconds >= 0
+    assert "checks in" in report.timing_summary()